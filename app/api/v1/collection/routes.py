@@ -7,28 +7,245 @@ Provides endpoints for:
 - Viewing recent collection history
 - Managing collector configuration
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from typing import List, Optional
+from sqlalchemy import select, desc, func, lambda_stmt, text, tuple_
+from sqlalchemy.orm import raiseload
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, field_validator
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
+import asyncio
+import base64
 import logging
+import time
+import uuid
 
-from ....database import get_db
+import orjson
+
+from ....core.cache import (
+    cache_get,
+    cache_set,
+    COLLECTION_ITEMS_NAMESPACE,
+    COLLECTION_STATS_NAMESPACE,
+)
+from ....database import get_db, get_replica_db, replica_session
 from ....models.news_item import NewsItem, CollectionRun
 from ....services.collectors import (
     CollectionScheduler,
     get_all_collectors,
 )
 from ....services.collectors.scheduler import get_scheduler, setup_scheduler
-from ....services.broadcast import get_broadcast_manager
+from ....services.broadcast import BroadcastManager, get_broadcast_manager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Collector source types and categories are short snake_case identifiers
+# (source_type/collector_type are String(50) columns); anything else can
+# never match, so it is rejected before reaching the database
+IDENTIFIER_PATTERN = r"^[a-z0-9_]+$"
+
+# Response cache TTLs for dashboard polling of item listings
+ITEMS_CACHE_TTL = 15
+STATS_CACHE_TTL = 30
+
+# Encoded payloads for endpoints the dashboard polls at 1-5 Hz, keyed by
+# endpoint name -> (monotonic timestamp, JSON bytes)
+MICRO_CACHE_TTL = 1.0
+_micro_cache: Dict[str, Tuple[float, bytes]] = {}
+
+
+def _micro_cached(key: str, build: Callable[[], Any]) -> Response:
+    """Serve build() as JSON, reusing the encoded bytes for MICRO_CACHE_TTL."""
+    now = time.monotonic()
+    cached = _micro_cache.get(key)
+    if cached and now - cached[0] < MICRO_CACHE_TTL:
+        return Response(content=cached[1], media_type="application/json")
+
+    payload = orjson.dumps(build())
+    _micro_cache[key] = (now, payload)
+    return Response(content=payload, media_type="application/json")
+
+
+# Columns needed to build the /items payload. Content is truncated in SQL so
+# the full article body never leaves the database.
+ITEM_COLUMNS = (
+    NewsItem.id,
+    NewsItem.source_type,
+    NewsItem.source_name,
+    NewsItem.source_url,
+    NewsItem.title,
+    func.left(NewsItem.content, 1000).label("content"),
+    NewsItem.summary,
+    NewsItem.url,
+    NewsItem.published_at,
+    NewsItem.collected_at,
+    NewsItem.author,
+    NewsItem.categories,
+    NewsItem.processed,
+    NewsItem.relevance_score,
+    NewsItem.item_metadata,
+)
+
+
+# ==================== Pydantic Models ====================
+
+class NewsItemOut(BaseModel):
+    """Serialized NewsItem, matching NewsItem.to_dict()."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    source_type: str
+    source_name: str
+    source_url: Optional[str] = None
+    title: str
+    content: Optional[str] = None
+    summary: Optional[str] = None
+    url: Optional[str] = None
+    published_at: Optional[datetime] = None
+    collected_at: Optional[datetime] = None
+    author: Optional[str] = None
+    categories: list = Field(default_factory=list)
+    processed: Optional[int] = None
+    relevance_score: Optional[float] = None
+    metadata: dict = Field(default_factory=dict, validation_alias="item_metadata")
+
+    @computed_field
+    @property
+    def item_id(self) -> str:
+        return NewsItem.compute_item_id(self.title, self.source_type, self.url)
+
+    @field_validator("content", mode="before")
+    @classmethod
+    def _empty_content_to_none(cls, v):
+        return v or None
+
+    @field_validator("categories", "metadata", mode="before")
+    @classmethod
+    def _null_to_empty(cls, v, info):
+        if v is None:
+            return [] if info.field_name == "categories" else {}
+        return v
+
+
+class CollectionRunOut(BaseModel):
+    """Serialized CollectionRun, matching CollectionRun.to_dict()."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    collector_type: str
+    collector_name: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    status: Optional[str] = None
+    duration_seconds: float = 0.0
+    items_collected: Optional[int] = None
+    items_new: Optional[int] = None
+    items_duplicate: Optional[int] = None
+    items_filtered: Optional[int] = None
+    error_message: Optional[str] = None
+    metadata: dict = Field(default_factory=dict, validation_alias="run_metadata")
+
+    @field_validator("metadata", mode="before")
+    @classmethod
+    def _null_to_empty(cls, v):
+        return v or {}
+
+
+# Built once; validation and JSON-mode dumping run in pydantic-core
+_ITEMS_ADAPTER = TypeAdapter(List[NewsItemOut])
+_RUNS_ADAPTER = TypeAdapter(List[CollectionRunOut])
+
+
+def _serialize_items(rows) -> list:
+    return _ITEMS_ADAPTER.dump_python(
+        _ITEMS_ADAPTER.validate_python(rows, from_attributes=True), mode="json"
+    )
+
+
+def _serialize_runs(runs) -> list:
+    return _RUNS_ADAPTER.dump_python(
+        _RUNS_ADAPTER.validate_python(runs, from_attributes=True), mode="json"
+    )
+
+
+# Planner row estimate for news_items; O(1) compared to count(*)
+_ESTIMATED_ITEM_COUNT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE relname = 'news_items'"
+)
+
+
+def _encode_cursor(timestamp: datetime, row_id) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque cursor string."""
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+async def _recent_runs(
+    db: AsyncSession,
+    limit: int,
+    since: Optional[datetime] = None,
+    collector_type: Optional[str] = None,
+    status: Optional[str] = None,
+    before: Optional[Tuple[datetime, uuid.UUID]] = None,
+) -> List[CollectionRun]:
+    """
+    Fetch collection runs newest-first.
+
+    Shared by /runs and /items/stats so both go through the same cached
+    lambda_stmt and the (started_at, id) index.
+
+    Args:
+        limit: Maximum number of runs
+        since: Only runs started at or after this time
+        collector_type: Filter by collector type
+        status: Filter by run status
+        before: Keyset position (started_at, id); only older runs are returned
+    """
+    query = lambda_stmt(
+        lambda: select(CollectionRun)
+        .options(raiseload("*"))
+        .order_by(desc(CollectionRun.started_at), desc(CollectionRun.id))
+    )
+
+    if since is not None:
+        query += lambda q: q.where(CollectionRun.started_at >= since)
+    if collector_type:
+        query += lambda q: q.where(CollectionRun.collector_type == collector_type)
+    if status:
+        query += lambda q: q.where(CollectionRun.status == status)
+    if before is not None:
+        c_at, c_id = before
+        query += lambda q: q.where(
+            tuple_(CollectionRun.started_at, CollectionRun.id) < tuple_(c_at, c_id)
+        )
+
+    query += lambda q: q.limit(limit)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
 
 @router.get("/status")
-async def get_collection_status():
+async def get_collection_status(
+    scheduler: CollectionScheduler = Depends(get_scheduler),
+):
     """
     Get status of all collectors.
 
@@ -37,15 +254,17 @@ async def get_collection_status():
     """
     logger.debug("[COLLECTION] GET /status")
     try:
-        scheduler = get_scheduler()
-        status = scheduler.get_status()
-        logger.debug(
-            f"[COLLECTION] Status: running={status['is_running']}, "
-            f"collectors={status['collector_count']}"
-        )
-        return status
+        def build():
+            status = scheduler.get_status()
+            logger.debug(
+                "[COLLECTION] Status: running=%s, collectors=%s",
+                status['is_running'], status['collector_count']
+            )
+            return status
+
+        return _micro_cached("status", build)
     except Exception as e:
-        logger.error(f"[COLLECTION] Failed to get status: {e}", exc_info=True)
+        logger.error("[COLLECTION] Failed to get status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get collection status: {str(e)}"
@@ -53,7 +272,9 @@ async def get_collection_status():
 
 
 @router.get("/health")
-async def get_collection_health():
+async def get_collection_health(
+    scheduler: CollectionScheduler = Depends(get_scheduler),
+):
     """
     Get health summary of collection system.
 
@@ -62,15 +283,17 @@ async def get_collection_health():
     """
     logger.debug("[COLLECTION] GET /health")
     try:
-        scheduler = get_scheduler()
-        health = scheduler.get_health_summary()
-        logger.info(
-            f"[COLLECTION] Health: overall={health['overall']}, "
-            f"healthy={health['healthy']}, degraded={health['degraded']}, unhealthy={health['unhealthy']}"
-        )
-        return health
+        def build():
+            health = scheduler.get_health_summary()
+            logger.info(
+                "[COLLECTION] Health: overall=%s, healthy=%s, degraded=%s, unhealthy=%s",
+                health['overall'], health['healthy'], health['degraded'], health['unhealthy']
+            )
+            return health
+
+        return _micro_cached("health", build)
     except Exception as e:
-        logger.error(f"[COLLECTION] Failed to get health summary: {e}", exc_info=True)
+        logger.error("[COLLECTION] Failed to get health summary: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get health summary: {str(e)}"
@@ -79,9 +302,9 @@ async def get_collection_health():
 
 @router.post("/run")
 async def trigger_collection(
-    background_tasks: BackgroundTasks,
     collector_name: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    scheduler: CollectionScheduler = Depends(get_scheduler),
 ):
     """
     Manually trigger collection.
@@ -90,35 +313,32 @@ async def trigger_collection(
         collector_name: Optional specific collector to run.
                        If not provided, runs all collectors.
 
+    The run is queued for the scheduler's manual-run workers rather than
+    attached to this request.
+
     Returns:
         Status message indicating collection was triggered
     """
-    logger.info(f"[COLLECTION] POST /run: collector={collector_name or 'all'}")
+    logger.info("[COLLECTION] POST /run: collector=%s", collector_name or 'all')
 
     try:
-        scheduler = get_scheduler()
-
         if collector_name:
             # Run specific collector
             if collector_name not in scheduler.collectors:
-                logger.warning(f"[COLLECTION] Collector not found: {collector_name}")
+                logger.warning("[COLLECTION] Collector not found: %s", collector_name)
                 raise HTTPException(
                     status_code=404,
                     detail=f"Collector '{collector_name}' not found. "
                            f"Available: {list(scheduler.collectors.keys())}"
                 )
 
-            # Run in background
-            async def run_collector():
-                logger.info(f"[COLLECTION] Background task starting: {collector_name}")
-                result = await scheduler.run_collector_now(collector_name)
-                logger.info(
-                    f"[COLLECTION] Background task completed: {collector_name}, "
-                    f"new={result.items_new if result else 0}"
-                )
-
-            background_tasks.add_task(run_collector)
-            logger.info(f"[COLLECTION] Triggered: {collector_name}")
+            if not await scheduler.enqueue_run(collector_name):
+                return {
+                    "status": "already_running",
+                    "collector": collector_name,
+                    "message": f"Collection already in progress for {collector_name}"
+                }
+            logger.info("[COLLECTION] Triggered: %s", collector_name)
 
             return {
                 "status": "triggered",
@@ -127,17 +347,13 @@ async def trigger_collection(
             }
         else:
             # Run all collectors
-            async def run_all():
-                logger.info("[COLLECTION] Background task starting: all collectors")
-                results = await scheduler.run_all_now()
-                total_new = sum(r.items_new for r in results if r)
-                logger.info(
-                    f"[COLLECTION] Background task completed: all collectors, "
-                    f"runs={len(results)}, total_new={total_new}"
-                )
-
-            background_tasks.add_task(run_all)
-            logger.info(f"[COLLECTION] Triggered: all {len(scheduler.collectors)} collectors")
+            if not await scheduler.enqueue_run(None):
+                return {
+                    "status": "already_running",
+                    "collector": "all",
+                    "message": "Collection already in progress for all collectors"
+                }
+            logger.info("[COLLECTION] Triggered: all %d collectors", len(scheduler.collectors))
 
             return {
                 "status": "triggered",
@@ -148,7 +364,7 @@ async def trigger_collection(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"[COLLECTION] Failed to trigger collection: {e}", exc_info=True)
+        logger.error("[COLLECTION] Failed to trigger collection: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to trigger collection: {str(e)}"
@@ -157,43 +373,49 @@ async def trigger_collection(
 
 @router.get("/runs")
 async def get_collection_runs(
-    db: AsyncSession = Depends(get_db),
-    limit: int = 50,
-    collector_type: Optional[str] = None,
+    response: Response,
+    db: AsyncSession = Depends(get_replica_db),
+    limit: int = Query(50, ge=1, le=500),
+    collector_type: Optional[str] = Query(None, max_length=50, pattern=IDENTIFIER_PATTERN),
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
 ):
     """
     Get recent collection run history.
 
     Args:
-        limit: Maximum number of runs to return (default 50)
+        limit: Maximum number of runs to return (default 50, max 500)
         collector_type: Filter by collector type
         status: Filter by status (running, completed, failed)
+        cursor: Opaque keyset cursor from a previous X-Next-Cursor header
 
     Returns:
-        List of recent collection runs
+        List of recent collection runs. When more runs exist, the
+        X-Next-Cursor response header carries the cursor for the next page.
     """
     logger.debug(
-        f"[COLLECTION] GET /runs: limit={limit}, type={collector_type}, status={status}"
+        "[COLLECTION] GET /runs: limit=%s, type=%s, status=%s",
+        limit, collector_type, status
     )
     try:
-        query = select(CollectionRun).order_by(desc(CollectionRun.started_at))
-
-        if collector_type:
-            query = query.where(CollectionRun.collector_type == collector_type)
-        if status:
-            query = query.where(CollectionRun.status == status)
-
-        query = query.limit(limit)
+        runs = await _recent_runs(
+            db,
+            limit=limit,
+            collector_type=collector_type,
+            status=status,
+            before=_decode_cursor(cursor) if cursor else None,
+        )
 
-        result = await db.execute(query)
-        runs = result.scalars().all()
+        if len(runs) == limit and runs:
+            response.headers["X-Next-Cursor"] = _encode_cursor(runs[-1].started_at, runs[-1].id)
 
-        logger.info(f"[COLLECTION] Returned {len(runs)} collection runs")
-        return [run.to_dict() for run in runs]
+        logger.info("[COLLECTION] Returned %d collection runs", len(runs))
+        return _serialize_runs(runs)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"[COLLECTION] Failed to get runs: {e}", exc_info=True)
+        logger.error("[COLLECTION] Failed to get runs: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get collection runs: {str(e)}"
@@ -202,8 +424,8 @@ async def get_collection_runs(
 
 @router.get("/runs/{run_id}")
 async def get_collection_run(
-    run_id: str,
-    db: AsyncSession = Depends(get_db)
+    run_id: uuid.UUID,
+    db: AsyncSession = Depends(get_replica_db)
 ):
     """
     Get details of a specific collection run.
@@ -215,9 +437,8 @@ async def get_collection_run(
         Collection run details
     """
     try:
-        query = select(CollectionRun).where(CollectionRun.id == run_id)
-        result = await db.execute(query)
-        run = result.scalar_one_or_none()
+        # Primary-key lookup; served from the identity map when already loaded
+        run = await db.get(CollectionRun, run_id)
 
         if not run:
             raise HTTPException(
@@ -225,83 +446,136 @@ async def get_collection_run(
                 detail=f"Collection run {run_id} not found"
             )
 
-        return run.to_dict()
+        return _serialize_runs([run])[0]
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get collection run: {e}")
+        logger.error("Failed to get collection run: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get collection run: {str(e)}"
         )
 
 
-@router.get("/items")
+@router.get("/items", response_class=ORJSONResponse)
 async def get_collected_items(
-    db: AsyncSession = Depends(get_db),
-    limit: int = 500,
-    offset: int = 0,
-    source_type: Optional[str] = None,
-    category: Optional[str] = None,
-    hours: Optional[int] = None,
+    db: AsyncSession = Depends(get_replica_db),
+    limit: int = Query(500, ge=1, le=1000),
+    offset: int = Query(0, ge=0, le=100_000),
+    source_type: Optional[str] = Query(None, max_length=50, pattern=IDENTIFIER_PATTERN),
+    category: Optional[str] = Query(None, max_length=50, pattern=IDENTIFIER_PATTERN),
+    hours: Optional[int] = Query(None, ge=1, le=8760),
+    cursor: Optional[str] = None,
+    with_total: bool = False,
 ):
     """
     Get collected items with pagination support.
 
+    Prefer `cursor` over `offset` for deep pages: the cursor seeks directly
+    into the (collected_at, id) index instead of scanning and discarding
+    `offset` rows.
+
     Args:
         limit: Maximum number of items to return (default 500, max 1000)
-        offset: Number of items to skip for pagination
+        offset: Number of items to skip for pagination (max 100000, ignored with cursor)
         source_type: Filter by source type (rss, gdelt, arxiv, etc.)
         category: Filter by category (geopolitics, tech_ai, research, etc.)
         hours: Optional - limit to items from the last N hours (default: no time limit)
+        cursor: Opaque keyset cursor returned as `next_cursor` by a previous call
+        with_total: Also return a total count (estimated when unfiltered).
+                    When false, `total` is null and only `has_more` is computed.
 
     Returns:
-        Object with items array, pagination info, and total count
+        Object with items array, pagination info, optional total and next_cursor
     """
-    from sqlalchemy import func
+    cache_params = {
+        "limit": limit, "offset": offset, "source_type": source_type,
+        "category": category, "hours": hours, "cursor": cursor,
+        "with_total": with_total,
+    }
+    cached = await cache_get(COLLECTION_ITEMS_NAMESPACE, cache_params)
+    if cached is not None:
+        return cached
 
     try:
-        # Cap limit at 1000 to prevent excessive queries
-        limit = min(limit, 1000)
-
-        # Build base query
-        query = select(NewsItem).order_by(desc(NewsItem.collected_at))
-        count_query = select(func.count(NewsItem.id))
+        # Statements are built with lambda_stmt so SQLAlchemy caches the
+        # compiled SQL per filter combination; closure values (which must be
+        # computed outside the lambdas) become bound parameters.
+        #
+        # Base query selects plain columns; rows skip ORM hydration and are
+        # validated straight into NewsItemOut
+        query = lambda_stmt(
+            lambda: select(*ITEM_COLUMNS)
+            .order_by(desc(NewsItem.collected_at), desc(NewsItem.id))
+        )
+        # count(*) rather than count(id): the filters are all covered by
+        # ix_news_items_source_collected / the categories GIN index, so
+        # Postgres can count from the index without visiting id in the heap
+        count_query = lambda_stmt(lambda: select(func.count()).select_from(NewsItem))
 
         # Apply time filter only if hours is specified
         if hours is not None:
             cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-            query = query.where(NewsItem.collected_at >= cutoff)
-            count_query = count_query.where(NewsItem.collected_at >= cutoff)
+            query += lambda q: q.where(NewsItem.collected_at >= cutoff)
+            count_query += lambda q: q.where(NewsItem.collected_at >= cutoff)
 
         if source_type:
-            query = query.where(NewsItem.source_type == source_type)
-            count_query = count_query.where(NewsItem.source_type == source_type)
+            query += lambda q: q.where(NewsItem.source_type == source_type)
+            count_query += lambda q: q.where(NewsItem.source_type == source_type)
         if category:
-            query = query.where(NewsItem.categories.contains([category]))
-            count_query = count_query.where(NewsItem.categories.contains([category]))
-
-        # Get total count for pagination
-        total_result = await db.execute(count_query)
-        total_count = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.offset(offset).limit(limit)
+            # @> containment, served by the jsonb_path_ops GIN index
+            category_filter = [category]
+            query += lambda q: q.where(NewsItem.categories.contains(category_filter))
+            count_query += lambda q: q.where(NewsItem.categories.contains(category_filter))
+
+        if cursor:
+            # Keyset path: index seek instead of an offset scan
+            c_at, c_id = _decode_cursor(cursor)
+            query += lambda q: q.where(
+                tuple_(NewsItem.collected_at, NewsItem.id) < tuple_(c_at, c_id)
+            )
+        else:
+            query += lambda q: q.offset(offset)
 
+        # Fetch one extra row to learn whether another page exists
+        fetch_limit = limit + 1
+        query += lambda q: q.limit(fetch_limit)
         result = await db.execute(query)
-        items = result.scalars().all()
+        items = result.all()
+        has_more = len(items) > limit
+        items = items[:limit]
+
+        total_count = None
+        if with_total:
+            if not (source_type or category or hours is not None):
+                # Planner estimate is O(1) and close enough for an unfiltered total
+                total_result = await db.execute(_ESTIMATED_ITEM_COUNT)
+                total_count = max(total_result.scalar() or 0, offset + len(items))
+            else:
+                total_result = await db.execute(count_query)
+                total_count = total_result.scalar() or 0
+
+        next_cursor = (
+            _encode_cursor(items[-1].collected_at, items[-1].id)
+            if has_more and items else None
+        )
 
-        return {
-            "items": [item.to_dict() for item in items],
+        payload = {
+            "items": _serialize_items(items),
             "total": total_count,
             "limit": limit,
             "offset": offset,
-            "has_more": offset + len(items) < total_count,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
+        await cache_set(COLLECTION_ITEMS_NAMESPACE, cache_params, payload, ITEMS_CACHE_TTL)
+        return payload
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Failed to get collected items: {e}")
+        logger.error("Failed to get collected items: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get collected items: {str(e)}"
@@ -310,62 +584,71 @@ async def get_collected_items(
 
 @router.get("/items/stats")
 async def get_collection_stats(
-    db: AsyncSession = Depends(get_db),
-    hours: int = 24,
+    db: AsyncSession = Depends(get_replica_db),
+    hours: int = Query(24, ge=1, le=24 * 365),
 ):
     """
     Get collection statistics.
 
     Args:
-        hours: Number of hours to analyze
+        hours: Number of hours to analyze (max one year)
 
     Returns:
         Statistics about collected items by source and category
     """
+    cached = await cache_get(COLLECTION_STATS_NAMESPACE, {"hours": hours})
+    if cached is not None:
+        return cached
+
     try:
-        from sqlalchemy import func
+        from sqlalchemy import rollup
 
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        # Count by source type
-        source_query = (
+        # Per-source counts plus the grand total in one scan via ROLLUP
+        # (index-only over ix_news_items_source_collected);
+        # the rolled-up row (grouping() == 1) carries the total.
+        agg_query = (
             select(
                 NewsItem.source_type,
-                func.count(NewsItem.id).label('count')
+                func.count().label('count'),
+                func.grouping(NewsItem.source_type).label('is_total'),
             )
             .where(NewsItem.collected_at >= cutoff)
-            .group_by(NewsItem.source_type)
+            .group_by(rollup(NewsItem.source_type))
         )
-        source_result = await db.execute(source_query)
-        by_source = {row.source_type: row.count for row in source_result}
 
-        # Total count
-        total_query = (
-            select(func.count(NewsItem.id))
-            .where(NewsItem.collected_at >= cutoff)
-        )
-        total_result = await db.execute(total_query)
-        total = total_result.scalar() or 0
-
-        # Recent runs
-        runs_query = (
-            select(CollectionRun)
-            .where(CollectionRun.started_at >= cutoff)
-            .order_by(desc(CollectionRun.started_at))
-            .limit(10)
+        async def fetch_recent_runs():
+            # An AsyncSession cannot run two statements at once, so the runs
+            # query gets its own short-lived session to overlap with agg_query
+            async with replica_session() as runs_db:
+                runs = await _recent_runs(runs_db, limit=10, since=cutoff)
+                return _serialize_runs(runs)
+
+        agg_result, recent_runs = await asyncio.gather(
+            db.execute(agg_query),
+            fetch_recent_runs(),
         )
-        runs_result = await db.execute(runs_query)
-        recent_runs = [run.to_dict() for run in runs_result.scalars().all()]
 
-        return {
+        by_source = {}
+        total = 0
+        for row in agg_result:
+            if row.is_total:
+                total = row.count or 0
+            else:
+                by_source[row.source_type] = row.count
+
+        payload = {
             "period_hours": hours,
             "total_items": total,
             "by_source": by_source,
             "recent_runs": recent_runs,
         }
+        await cache_set(COLLECTION_STATS_NAMESPACE, {"hours": hours}, payload, STATS_CACHE_TTL)
+        return payload
 
     except Exception as e:
-        logger.error(f"Failed to get collection stats: {e}")
+        logger.error("Failed to get collection stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get collection stats: {str(e)}"
@@ -381,17 +664,16 @@ async def list_collectors():
         List of collector information
     """
     try:
-        collectors = get_all_collectors()
-        return [
+        return _micro_cached("collectors", lambda: [
             {
                 "name": c.name,
                 "source_type": c.source_type,
                 "class": c.__class__.__name__,
             }
-            for c in collectors
-        ]
+            for c in get_all_collectors()
+        ])
     except Exception as e:
-        logger.error(f"Failed to list collectors: {e}")
+        logger.error("Failed to list collectors: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list collectors: {str(e)}"
@@ -399,7 +681,10 @@ async def list_collectors():
 
 
 @router.post("/start")
-async def start_scheduler(background_tasks: BackgroundTasks):
+async def start_scheduler(
+    background_tasks: BackgroundTasks,
+    scheduler: CollectionScheduler = Depends(get_scheduler),
+):
     """
     Start the collection scheduler.
 
@@ -407,8 +692,6 @@ async def start_scheduler(background_tasks: BackgroundTasks):
     """
     logger.info("[COLLECTION] POST /start - Starting scheduler")
     try:
-        scheduler = get_scheduler()
-
         if scheduler.is_running:
             logger.info("[COLLECTION] Scheduler already running")
             return {
@@ -423,15 +706,16 @@ async def start_scheduler(background_tasks: BackgroundTasks):
             logger.info("[COLLECTION] Scheduler started successfully")
 
         background_tasks.add_task(start)
+        _micro_cache.clear()
 
-        logger.info(f"[COLLECTION] Scheduler start triggered: {len(scheduler.collectors)} collectors")
+        logger.info("[COLLECTION] Scheduler start triggered: %d collectors", len(scheduler.collectors))
         return {
             "status": "starting",
             "message": f"Starting scheduler with {len(scheduler.collectors)} collectors"
         }
 
     except Exception as e:
-        logger.error(f"[COLLECTION] Failed to start scheduler: {e}", exc_info=True)
+        logger.error("[COLLECTION] Failed to start scheduler: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to start scheduler: {str(e)}"
@@ -439,7 +723,9 @@ async def start_scheduler(background_tasks: BackgroundTasks):
 
 
 @router.post("/stop")
-async def stop_scheduler():
+async def stop_scheduler(
+    scheduler: CollectionScheduler = Depends(get_scheduler),
+):
     """
     Stop the collection scheduler.
 
@@ -447,8 +733,6 @@ async def stop_scheduler():
     """
     logger.info("[COLLECTION] POST /stop - Stopping scheduler")
     try:
-        scheduler = get_scheduler()
-
         if not scheduler.is_running:
             logger.info("[COLLECTION] Scheduler not running")
             return {
@@ -457,6 +741,7 @@ async def stop_scheduler():
             }
 
         await scheduler.stop()
+        _micro_cache.clear()
         logger.info("[COLLECTION] Scheduler stopped successfully")
 
         return {
@@ -465,7 +750,7 @@ async def stop_scheduler():
         }
 
     except Exception as e:
-        logger.error(f"[COLLECTION] Failed to stop scheduler: {e}", exc_info=True)
+        logger.error("[COLLECTION] Failed to stop scheduler: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to stop scheduler: {str(e)}"
@@ -473,7 +758,9 @@ async def stop_scheduler():
 
 
 @router.get("/websocket/status")
-async def get_websocket_status():
+async def get_websocket_status(
+    broadcast_manager: BroadcastManager = Depends(get_broadcast_manager),
+):
     """
     Get WebSocket broadcast status.
 
@@ -482,10 +769,9 @@ async def get_websocket_status():
         active connections and subscriptions.
     """
     try:
-        broadcast_manager = get_broadcast_manager()
         return broadcast_manager.get_status()
     except Exception as e:
-        logger.error(f"Failed to get websocket status: {e}")
+        logger.error("Failed to get websocket status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get websocket status: {str(e)}"
@@ -1,22 +1,277 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-import uuid
+import time
 from uuid import UUID
 from pydantic import BaseModel
-from sqlalchemy import select, text, update, func
+from sqlalchemy import JSON, Integer, String, bindparam, column, delete, exists, select, text, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 import logging
 
-from ....database import get_db
+from ....core.cache import (
+    cache_clear,
+    cache_get,
+    cache_set,
+    user_namespace,
+    ENTITIES_NAMESPACE,
+    ENTITIES_DIAGNOSTIC_NAMESPACE,
+)
+from ....database import get_db, get_replica_db
 from ....core.dependencies import get_local_user, LocalUser
+from ....core.responses import PulseORJSONResponse
 from ....services.entity_tracker import EntityTrackingService
 from ....services.document_processor import DocumentProcessor
 from ....models.entities import TrackedEntity, EntityMention
 
-router = APIRouter()
-document_processor = DocumentProcessor()
+# Encodes datetimes and (asyncpg) UUIDs directly, so handlers can return
+# raw row values without str() conversion
+router = APIRouter(default_response_class=PulseORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# Created on first use: DocumentProcessor connects to Qdrant on init
+_document_processor: Optional[DocumentProcessor] = None
+
+
+def get_document_processor() -> DocumentProcessor:
+    """
+    Get the shared DocumentProcessor instance.
+    Creates one on first call and reuses it for all subsequent calls.
+    """
+    global _document_processor
+    if _document_processor is None:
+        _document_processor = DocumentProcessor()
+    return _document_processor
+
+# Batch size for streaming list queries off a server-side cursor
+STREAM_BATCH_SIZE = 100
+
+# Response cache TTLs for read endpoints; per-user entries are also
+# invalidated by the entity write endpoints
+SEARCH_CACHE_TTL = 60
+MENTIONS_CACHE_TTL = 120
+DUPLICATES_CACHE_TTL = 300
+DIAGNOSTIC_CACHE_TTL = 30
+
+
+# Write side of merge_entities in one round-trip: re-point mentions, merge
+# the secondary's name and aliases into the primary's metadata (deduplicated
+# by UNION) with a merged_from entry, and delete the secondary. The metadata
+# is merged with jsonb operators so it never round-trips through Python.
+# A None entity_metadata is stored as JSON 'null', hence the NULLIF.
+_MERGE_ENTITIES_SQL = text("""
+    WITH sec AS (
+        SELECT entity_id, name, COALESCE(NULLIF(entity_metadata::jsonb, 'null'), '{}'::jsonb) AS meta
+        FROM tracked_entities
+        WHERE entity_id = :secondary_id AND user_id = :user_id
+    ),
+    moved AS (
+        UPDATE entity_mentions
+        SET entity_id = :primary_id
+        WHERE entity_id IN (SELECT entity_id FROM sec)
+        RETURNING 1
+    ),
+    upd AS (
+        UPDATE tracked_entities te
+        SET entity_metadata = jsonb_set(
+            jsonb_set(
+                COALESCE(NULLIF(te.entity_metadata::jsonb, 'null'), '{}'::jsonb),
+                '{aliases}',
+                (
+                    SELECT COALESCE(jsonb_agg(merged.alias), '[]'::jsonb)
+                    FROM (
+                        SELECT jsonb_array_elements_text(
+                            COALESCE(te.entity_metadata::jsonb -> 'aliases', '[]'::jsonb)
+                        ) AS alias
+                        UNION
+                        SELECT jsonb_array_elements_text(
+                            COALESCE(sec.meta -> 'aliases', '[]'::jsonb)
+                        )
+                        UNION
+                        SELECT sec.name
+                    ) merged
+                )
+            ),
+            '{merged_from}',
+            COALESCE(te.entity_metadata::jsonb -> 'merged_from', '[]'::jsonb)
+                || jsonb_build_array(jsonb_build_object(
+                    'entity_id', sec.entity_id::text,
+                    'name', sec.name,
+                    'merged_at', CAST(:merged_at AS text)
+                ))
+        )
+        FROM sec
+        WHERE te.entity_id = :primary_id AND te.user_id = :user_id
+        RETURNING te.entity_metadata::jsonb -> 'aliases' AS aliases
+    ),
+    del AS (
+        DELETE FROM tracked_entities
+        WHERE entity_id IN (SELECT entity_id FROM sec)
+        RETURNING name
+    )
+    SELECT
+        (SELECT COUNT(*) FROM moved) AS mentions_moved,
+        (SELECT aliases FROM upd) AS aliases,
+        (SELECT name FROM del) AS deleted_name
+""").columns(
+    column("mentions_moved", Integer),
+    column("aliases", JSON),
+    column("deleted_name", String),
+)
+
+
+# Request-independent SQL, parsed once at import. Typed bindparams let
+# asyncpg reuse one prepared statement per query.
+_DELETE_MENTIONS_SQL = text("""
+    DELETE FROM entity_mentions
+    WHERE entity_id = :entity_id
+""").bindparams(bindparam("entity_id", type_=PG_UUID(as_uuid=True)))
+
+# Relevance is pg_trgm similarity (1.0 for an exact match). Both the LIKE
+# and the % predicates are served by the trigram indexes on name_lower, and
+# <-> is the matching distance for ordering. The optional type filter is a
+# NULL-guarded predicate so one statement covers both cases.
+_SEARCH_SQL = text("""
+    SELECT
+        entity_id,
+        name,
+        entity_type,
+        entity_metadata,
+        similarity(name_lower, :q) as relevance
+    FROM tracked_entities
+    WHERE user_id = :user_id
+      AND (name_lower LIKE :pattern OR name_lower % :q)
+      AND (CAST(:entity_type AS text) IS NULL OR LOWER(entity_type) = :entity_type)
+    ORDER BY name_lower <-> :q, name ASC
+    LIMIT :limit
+""").bindparams(
+    bindparam("user_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("q", type_=String),
+    bindparam("pattern", type_=String),
+    bindparam("entity_type", type_=String),
+    bindparam("limit", type_=Integer),
+)
+
+_ARTICLES_SAMPLE_SQL = text("""
+    SELECT 
+        id,
+        title,
+        url,
+        scraped_at,
+        CASE 
+            WHEN content IS NULL THEN 'missing'
+            WHEN content = '' THEN 'empty'
+            ELSE 'present'
+        END as content_status,
+        CASE 
+            WHEN content IS NOT NULL THEN length(content)
+            ELSE 0
+        END as content_length
+    FROM news_articles
+    ORDER BY scraped_at DESC
+    LIMIT :limit
+""").bindparams(bindparam("limit", type_=Integer))
+
+# The WHERE and GROUP BY repeat the ix_tracked_entities_user_wikidata
+# expression verbatim so the planner can use that partial index
+_DUPLICATES_SQL = text("""
+    SELECT
+        entity_metadata->>'wikidata_id' as wikidata_id,
+        COUNT(*) as count,
+        ARRAY_AGG(name ORDER BY created_at) as names,
+        ARRAY_AGG(entity_id ORDER BY created_at) as entity_ids,
+        ARRAY_AGG(entity_type ORDER BY created_at) as entity_types
+    FROM tracked_entities
+    WHERE user_id = :user_id
+      AND entity_metadata->>'wikidata_id' IS NOT NULL
+    GROUP BY entity_metadata->>'wikidata_id'
+    HAVING COUNT(*) > 1
+    ORDER BY COUNT(*) DESC
+    LIMIT :limit
+""").bindparams(
+    bindparam("user_id", type_=PG_UUID(as_uuid=True)),
+    bindparam("limit", type_=Integer),
+)
+
+# All /diagnostic counts as scalar subqueries, fetched in one round-trip
+_DIAGNOSTIC_COUNTS_SQL = text("""
+    SELECT
+        (SELECT COUNT(*) FROM news_articles) AS news_total,
+        (SELECT COUNT(*) FROM news_articles WHERE content IS NOT NULL) AS news_with_content,
+        (SELECT COUNT(*) FROM tracked_entities) AS tracked_entities,
+        (SELECT COUNT(*) FROM entity_mentions) AS entity_mentions
+""")
+
+
+def _entities_namespace(user_id) -> str:
+    return user_namespace(ENTITIES_NAMESPACE, user_id)
+
+
+# In-process L1 cache of (user_id, name_lower) -> entity identity for the
+# relationship and scan endpoints, in front of the Redis response cache.
+# Values are (monotonic timestamp, EntityRef); oldest entries are evicted
+# first once ENTITY_REF_CACHE_SIZE is reached.
+@dataclass(frozen=True)
+class EntityRef:
+    """The fields of a TrackedEntity needed to scan for its mentions."""
+    entity_id: UUID
+    name: str
+    name_lower: str
+
+
+ENTITY_REF_CACHE_TTL = 30.0
+ENTITY_REF_CACHE_SIZE = 10_000
+_entity_ref_cache: "OrderedDict[Tuple[UUID, str], Tuple[float, EntityRef]]" = OrderedDict()
+
+
+def _get_entity_ref(user_id, name_lower: str) -> Optional[EntityRef]:
+    key = (user_id, name_lower)
+    cached = _entity_ref_cache.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= ENTITY_REF_CACHE_TTL:
+        del _entity_ref_cache[key]
+        return None
+    _entity_ref_cache.move_to_end(key)
+    return cached[1]
+
+
+def _put_entity_ref(user_id, entity: TrackedEntity) -> EntityRef:
+    ref = EntityRef(entity.entity_id, entity.name, entity.name_lower)
+    _entity_ref_cache[(user_id, ref.name_lower)] = (time.monotonic(), ref)
+    _entity_ref_cache.move_to_end((user_id, ref.name_lower))
+    while len(_entity_ref_cache) > ENTITY_REF_CACHE_SIZE:
+        _entity_ref_cache.popitem(last=False)
+    return ref
+
+
+async def _lookup_entity_ref(session: AsyncSession, user_id, entity_name: str) -> EntityRef:
+    """Resolve an entity name for a user, raising NoResultFound if missing."""
+    ref = _get_entity_ref(user_id, entity_name.lower())
+    if ref is None:
+        result = await session.execute(
+            select(TrackedEntity).where(
+                TrackedEntity.name_lower == entity_name.lower(),
+                TrackedEntity.user_id == user_id
+            )
+        )
+        ref = _put_entity_ref(user_id, result.scalar_one())
+    return ref
+
+
+async def _invalidate_entities(user_id, refs: bool = True) -> None:
+    """Drop cached entity reads for a user after a write.
+
+    refs=False keeps the L1 entity lookups, for writes that only add
+    mentions and leave the entities themselves unchanged.
+    """
+    await cache_clear(_entities_namespace(user_id))
+    if refs:
+        for key in [k for k in _entity_ref_cache if k[0] == user_id]:
+            del _entity_ref_cache[key]
+
 
 class EntityTrackRequest(BaseModel):
     name: str
@@ -33,7 +288,7 @@ async def track_entity(
     """Add a new entity to track"""
     entity_tracker = EntityTrackingService(
         session=session, 
-        document_processor=document_processor,
+        document_processor=get_document_processor(),
         user_id=current_user.user_id
     )
     try:
@@ -43,6 +298,7 @@ async def track_entity(
             metadata=entity.metadata,
             user_id=current_user.user_id
         )
+        await _invalidate_entities(current_user.user_id)
         return tracked_entity
     except Exception as e:
         logger.error(f"Error tracking entity: {str(e)}")
@@ -72,15 +328,12 @@ async def delete_entity(
             )
         
         # Delete related mentions first (if your DB doesn't handle cascading deletes)
-        delete_mentions = text("""
-            DELETE FROM entity_mentions 
-            WHERE entity_id = :entity_id
-        """)
-        await session.execute(delete_mentions, {"entity_id": entity.entity_id})
+        await session.execute(_DELETE_MENTIONS_SQL, {"entity_id": entity.entity_id})
         
         # Delete the entity
         await session.delete(entity)
         await session.commit()
+        await _invalidate_entities(current_user.user_id)
         
         return {"status": "success", "message": f"Entity '{entity_name}' deleted"}
         
@@ -103,8 +356,8 @@ async def search_entities(
     """
     Search entities by name with fuzzy matching.
 
-    Uses ILIKE for substring matching and orders by relevance.
-    Prioritizes exact matches, then prefix matches, then substring matches.
+    Matches substrings and trigram-similar names (typos, word order) and
+    orders by trigram similarity, so exact matches rank first.
 
     Args:
         q: Search query (minimum 2 characters)
@@ -114,62 +367,42 @@ async def search_entities(
     Returns:
         List of matching entities with relevance scores
     """
+    namespace = _entities_namespace(current_user.user_id)
+    cache_params = {
+        "endpoint": "search",
+        "q": q,
+        "limit": limit,
+        "entity_type": entity_type,
+    }
+    cached = await cache_get(namespace, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
     try:
         search_lower = q.lower()
 
-        # Build query with relevance scoring
-        # Using CASE to prioritize: exact > prefix > contains
-        query = text("""
-            SELECT
-                entity_id,
-                name,
-                entity_type,
-                entity_metadata,
-                created_at,
-                CASE
-                    WHEN LOWER(name) = :exact THEN 3
-                    WHEN LOWER(name) LIKE :prefix THEN 2
-                    ELSE 1
-                END as relevance
-            FROM tracked_entities
-            WHERE user_id = :user_id
-              AND LOWER(name) LIKE :pattern
-              {type_filter}
-            ORDER BY relevance DESC, name ASC
-            LIMIT :limit
-        """.format(
-            type_filter="AND LOWER(entity_type) = :entity_type" if entity_type else ""
-        ))
-
         params = {
-            "user_id": str(current_user.user_id),
-            "exact": search_lower,
-            "prefix": f"{search_lower}%",
+            "user_id": current_user.user_id,
+            "q": search_lower,
             "pattern": f"%{search_lower}%",
+            "entity_type": entity_type.lower() if entity_type else None,
             "limit": limit
         }
-        if entity_type:
-            params["entity_type"] = entity_type.lower()
-
-        result = await session.execute(query, params)
-        rows = result.fetchall()
 
+        # Columns are selected in output shape; orjson encodes the UUIDs
+        result = await session.stream(_SEARCH_SQL, params)
         entities = [
-            {
-                "entity_id": str(row.entity_id),
-                "name": row.name,
-                "entity_type": row.entity_type,
-                "entity_metadata": row.entity_metadata,
-                "relevance": row.relevance
-            }
-            for row in rows
+            dict(row._mapping)
+            async for row in result.yield_per(STREAM_BATCH_SIZE)
         ]
 
-        return {
+        payload = {
             "results": entities,
             "count": len(entities),
             "query": q
         }
+        await cache_set(namespace, cache_params, payload, SEARCH_CACHE_TTL)
+        return PulseORJSONResponse(payload)
 
     except Exception as e:
         logger.error(f"Entity search failed: {e}")
@@ -189,19 +422,37 @@ async def get_entity_mentions(
 ):
     """Get mentions for an entity"""
     logger.debug(f"Getting mentions for entity: {entity_name}")
+    namespace = _entities_namespace(current_user.user_id)
+    cache_params = {
+        "endpoint": "mentions",
+        "entity_name": entity_name.lower(),
+        "limit": limit,
+        "offset": offset,
+    }
+    cached = await cache_get(namespace, cache_params)
+    if cached is not None:
+        return cached
+
     entity_tracker = EntityTrackingService(
         session=session, 
-        document_processor=document_processor,
+        document_processor=get_document_processor(),
         user_id=current_user.user_id
     )
     try:
-        mentions = await entity_tracker.get_entity_mentions(
+        mentions, total = await entity_tracker.get_entity_mentions(
             entity_name=entity_name,
             limit=limit,
             offset=offset
         )
         # BUG-002 FIX: Wrap response in object with mentions key
-        return {"mentions": mentions, "total": len(mentions)}
+        payload = {
+            "mentions": mentions,
+            "total": total,
+            "limit": limit,
+            "offset": offset
+        }
+        await cache_set(namespace, cache_params, payload, MENTIONS_CACHE_TTL)
+        return payload
     except Exception as e:
         logger.error(f"Error getting mentions for {entity_name}: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -229,13 +480,19 @@ async def get_tracked_entities(
         Dict with entities list and total count
     """
     try:
-        # Base query with mention count
+        # mention_count is maintained on the row by a trigger, so no join
+        # or GROUP BY is needed. Total rides along as a window function so
+        # the page and the count come back in one round-trip
         base_query = (
             select(
-                TrackedEntity,
-                func.count(EntityMention.mention_id).label('mention_count')
+                TrackedEntity.entity_id,
+                TrackedEntity.name,
+                TrackedEntity.entity_type,
+                TrackedEntity.created_at,
+                TrackedEntity.entity_metadata,
+                TrackedEntity.mention_count,
+                func.count().over().label('total_count')
             )
-            .outerjoin(EntityMention, TrackedEntity.entity_id == EntityMention.entity_id)
             .where(TrackedEntity.user_id == current_user.user_id)
         )
 
@@ -245,53 +502,47 @@ async def get_tracked_entities(
                 func.lower(TrackedEntity.entity_type) == type.lower()
             )
 
-        # Group by entity
-        base_query = base_query.group_by(TrackedEntity.entity_id)
-
         # Apply sorting
         if sort == "name":
             base_query = base_query.order_by(TrackedEntity.name.asc())
         elif sort == "recent":
             base_query = base_query.order_by(TrackedEntity.created_at.desc())
         else:  # Default: mentions
-            base_query = base_query.order_by(func.count(EntityMention.mention_id).desc())
-
-        # Get total count (without pagination)
-        count_query = (
-            select(func.count(TrackedEntity.entity_id))
-            .where(TrackedEntity.user_id == current_user.user_id)
-        )
-        if type:
-            count_query = count_query.where(
-                func.lower(TrackedEntity.entity_type) == type.lower()
-            )
-        total_result = await session.execute(count_query)
-        total = total_result.scalar() or 0
+            base_query = base_query.order_by(TrackedEntity.mention_count.desc())
 
         # Apply pagination
         query = base_query.offset(offset).limit(limit)
 
-        result = await session.execute(query)
-        rows = result.all()
-
-        entities = [
-            {
-                "entity_id": str(row.TrackedEntity.entity_id),
-                "name": row.TrackedEntity.name,
-                "entity_type": row.TrackedEntity.entity_type,
-                "created_at": str(row.TrackedEntity.created_at),
-                "entity_metadata": row.TrackedEntity.entity_metadata,
-                "mention_count": row.mention_count or 0
-            }
-            for row in rows
-        ]
-
-        return {
+        result = await session.stream(query)
+        entities = []
+        total = None
+        async for row in result.yield_per(STREAM_BATCH_SIZE):
+            if total is None:
+                total = row.total_count
+            entity = dict(row._mapping)
+            del entity["total_count"]
+            entities.append(entity)
+
+        if total is None and offset:
+            # Paged past the end; the window count has no row to ride on
+            count_query = (
+                select(func.count(TrackedEntity.entity_id))
+                .where(TrackedEntity.user_id == current_user.user_id)
+            )
+            if type:
+                count_query = count_query.where(
+                    func.lower(TrackedEntity.entity_type) == type.lower()
+                )
+            total = (await session.execute(count_query)).scalar() or 0
+        elif total is None:
+            total = 0
+
+        return PulseORJSONResponse({
             "entities": entities,
             "total": total,
             "limit": limit,
             "offset": offset
-        }
+        })
 
     except Exception as e:
         logger.error(f"Failed to fetch tracked entities: {str(e)}")
@@ -324,39 +575,37 @@ async def bulk_delete_entities(
         if not request.entity_ids:
             raise HTTPException(400, "No entity IDs provided")
 
-        deleted_count = 0
-
+        entity_ids = []
         for entity_id_str in request.entity_ids:
             try:
-                entity_id = UUID(entity_id_str)
+                entity_ids.append(UUID(entity_id_str))
             except ValueError:
                 logger.warning(f"Invalid entity ID: {entity_id_str}")
-                continue
 
-            # Find the entity
-            query = select(TrackedEntity).where(
-                TrackedEntity.entity_id == entity_id,
-                TrackedEntity.user_id == current_user.user_id
+        deleted_ids = set()
+        if entity_ids:
+            # Single statement; the user_id predicate doubles as the
+            # ownership check, so ids that are missing or belong to another
+            # user simply do not come back in RETURNING. Mentions and
+            # relationships go with the entity via ON DELETE CASCADE
+            result = await session.execute(
+                delete(TrackedEntity)
+                .where(
+                    TrackedEntity.entity_id.in_(entity_ids),
+                    TrackedEntity.user_id == current_user.user_id
+                )
+                .returning(TrackedEntity.entity_id)
             )
-            result = await session.execute(query)
-            entity = result.scalar_one_or_none()
-
-            if not entity:
-                logger.warning(f"Entity not found or not owned by user: {entity_id}")
-                continue
-
-            # Delete related mentions first
-            delete_mentions = text("""
-                DELETE FROM entity_mentions
-                WHERE entity_id = :entity_id
-            """)
-            await session.execute(delete_mentions, {"entity_id": str(entity_id)})
-
-            # Delete the entity
-            await session.delete(entity)
-            deleted_count += 1
+            deleted_ids = set(result.scalars().all())
+        deleted_count = len(deleted_ids)
 
         await session.commit()
+        if deleted_count:
+            await _invalidate_entities(current_user.user_id)
+
+        for entity_id in entity_ids:
+            if entity_id not in deleted_ids:
+                logger.warning(f"Entity not found or not owned by user: {entity_id}")
 
         logger.info(f"Bulk deleted {deleted_count} entities for user {current_user.user_id}")
 
@@ -390,34 +639,39 @@ async def get_entity_relationships(
     logger.debug(f"Getting relationships for entity: {entity_name}")
     entity_tracker = EntityTrackingService(
         session=session, 
-        document_processor=document_processor,
+        document_processor=get_document_processor(),
         user_id=current_user.user_id,
         debug=debug
     )
     try:
-        # First check if we have any mentions for this entity
-        mentions_check = await session.execute(
-            text("""
-                SELECT COUNT(*) 
-                FROM entity_mentions em
-                JOIN tracked_entities te ON em.entity_id = te.entity_id
-                WHERE te.name_lower = :entity_name
-            """),
-            {"entity_name": entity_name.lower()}
-        )
-        mention_count = mentions_check.scalar()
+        # EXISTS stops at the first mention instead of counting them all
+        entity = _get_entity_ref(current_user.user_id, entity_name.lower())
+        if entity is not None:
+            has_mentions = (await session.execute(
+                select(exists().where(EntityMention.entity_id == entity.entity_id))
+            )).scalar()
+        else:
+            # Fetch the entity and the mentions flag in one query
+            entity_result = await session.execute(
+                select(
+                    TrackedEntity,
+                    exists()
+                    .where(EntityMention.entity_id == TrackedEntity.entity_id)
+                    .label("has_mentions")
+                )
+                .where(
+                    TrackedEntity.name_lower == entity_name.lower(),
+                    TrackedEntity.user_id == current_user.user_id
+                )
+            )
+            row, has_mentions = entity_result.one()
+            entity = _put_entity_ref(current_user.user_id, row)
         
-        if mention_count == 0:
+        if not has_mentions:
             logger.debug(f"No mentions found for {entity_name}, triggering scan...")
-            # Get entity details
-            entity = await session.execute(
-                select(TrackedEntity)
-                .where(TrackedEntity.name_lower == entity_name.lower())
-            )
-            entity = entity.scalar_one()
-            
             # Scan for mentions
             await entity_tracker._scan_existing_documents(entity)
+            await _invalidate_entities(current_user.user_id, refs=False)
         
         # Now analyze relationships
         network = await entity_tracker.analyze_entity_relationships(
@@ -439,20 +693,17 @@ async def scan_entity_mentions(
     logger.debug(f"Starting scan for entity: {entity_name}")
     entity_tracker = EntityTrackingService(
         session=session, 
-        document_processor=document_processor,
+        document_processor=get_document_processor(),
         user_id=current_user.user_id
     )
     try:
         # Get entity details
-        entity = await session.execute(
-            select(TrackedEntity)
-            .where(TrackedEntity.name_lower == entity_name.lower())
-        )
-        entity = entity.scalar_one()
+        entity = await _lookup_entity_ref(session, current_user.user_id, entity_name)
         logger.debug(f"Found entity: {entity.name} (ID: {entity.entity_id})")
         
         # Scan for mentions
         mentions_added = await entity_tracker._scan_existing_documents(entity)
+        await _invalidate_entities(current_user.user_id, refs=False)
         
         return {
             "status": "success",
@@ -465,33 +716,32 @@ async def scan_entity_mentions(
 
 @router.get("/diagnostic")
 async def diagnostic_check(
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Check database state for troubleshooting"""
+    cached = await cache_get(ENTITIES_DIAGNOSTIC_NAMESPACE, {"endpoint": "diagnostic"})
+    if cached is not None:
+        return cached
+
     try:
-        # Check news articles
-        news_query = text("SELECT COUNT(*) as count, COUNT(CASE WHEN content IS NOT NULL THEN 1 END) as with_content FROM news_articles")
-        news_result = await session.execute(news_query)
-        news_stats = news_result.first()
-        
-        # Check tracked entities
-        entity_query = text("SELECT COUNT(*) FROM tracked_entities")
-        entity_result = await session.execute(entity_query)
-        entity_count = entity_result.scalar()
-        
-        # Check mentions
-        mention_query = text("SELECT COUNT(*) FROM entity_mentions")
-        mention_result = await session.execute(mention_query)
-        mention_count = mention_result.scalar()
+        result = await session.execute(_DIAGNOSTIC_COUNTS_SQL)
+        counts = result.one()
         
-        return {
+        payload = {
             "news_articles": {
-                "total": news_stats.count,
-                "with_content": news_stats.with_content
+                "total": counts.news_total,
+                "with_content": counts.news_with_content
             },
-            "tracked_entities": entity_count,
-            "entity_mentions": mention_count
+            "tracked_entities": counts.tracked_entities,
+            "entity_mentions": counts.entity_mentions
         }
+        await cache_set(
+            ENTITIES_DIAGNOSTIC_NAMESPACE,
+            {"endpoint": "diagnostic"},
+            payload,
+            DIAGNOSTIC_CACHE_TTL,
+        )
+        return payload
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -501,47 +751,19 @@ async def diagnostic_check(
 @router.get("/diagnostic/articles")
 async def diagnostic_check_articles(
     limit: int = 5,
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Check sample of articles for troubleshooting"""
     try:
         # Get sample of articles with their content status
-        article_query = text("""
-            SELECT 
-                id,
-                title,
-                url,
-                scraped_at,
-                CASE 
-                    WHEN content IS NULL THEN 'missing'
-                    WHEN content = '' THEN 'empty'
-                    ELSE 'present'
-                END as content_status,
-                CASE 
-                    WHEN content IS NOT NULL THEN length(content)
-                    ELSE 0
-                END as content_length
-            FROM news_articles
-            ORDER BY scraped_at DESC
-            LIMIT :limit
-        """)
-        
-        result = await session.execute(article_query, {"limit": limit})
-        articles = result.fetchall()
+        result = await session.stream(_ARTICLES_SAMPLE_SQL, {"limit": limit})
         
-        return {
+        return PulseORJSONResponse({
             "articles": [
-                {
-                    "id": str(article.id),
-                    "title": article.title,
-                    "url": article.url,
-                    "scraped_at": str(article.scraped_at),
-                    "content_status": article.content_status,
-                    "content_length": article.content_length
-                }
-                for article in articles
+                dict(article._mapping)
+                async for article in result.yield_per(STREAM_BATCH_SIZE)
             ]
-        }
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -568,44 +790,28 @@ async def find_duplicate_entities(
     Returns:
         List of duplicate groups with entity details
     """
+    namespace = _entities_namespace(current_user.user_id)
+    cache_params = {"endpoint": "duplicates", "limit": limit}
+    cached = await cache_get(namespace, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
     try:
         # Find entities with duplicate WikiData QIDs
-        query = text("""
-            SELECT
-                entity_metadata->>'wikidata_id' as wikidata_id,
-                COUNT(*) as count,
-                ARRAY_AGG(name ORDER BY created_at) as names,
-                ARRAY_AGG(entity_id::text ORDER BY created_at) as entity_ids,
-                ARRAY_AGG(entity_type ORDER BY created_at) as entity_types
-            FROM tracked_entities
-            WHERE user_id = :user_id
-              AND entity_metadata->>'wikidata_id' IS NOT NULL
-            GROUP BY entity_metadata->>'wikidata_id'
-            HAVING COUNT(*) > 1
-            ORDER BY COUNT(*) DESC
-            LIMIT :limit
-        """)
-
-        result = await session.execute(query, {
-            "user_id": str(current_user.user_id),
+        result = await session.execute(_DUPLICATES_SQL, {
+            "user_id": current_user.user_id,
             "limit": limit
         })
 
-        duplicates = []
-        for row in result.fetchall():
-            duplicates.append({
-                "wikidata_id": row.wikidata_id,
-                "count": row.count,
-                "names": row.names,
-                "entity_ids": row.entity_ids,
-                "entity_types": row.entity_types,
-            })
+        duplicates = [dict(row._mapping) for row in result]
 
-        return {
+        payload = {
             "duplicates": duplicates,
             "total_groups": len(duplicates),
             "message": f"Found {len(duplicates)} groups of duplicate entities"
         }
+        await cache_set(namespace, cache_params, payload, DUPLICATES_CACHE_TTL)
+        return PulseORJSONResponse(payload)
 
     except Exception as e:
         logger.error(f"Failed to find duplicates: {e}")
@@ -638,21 +844,15 @@ async def merge_entities(
     """
     try:
         # Verify both entities exist and belong to user
-        primary_result = await session.execute(
+        entities_result = await session.execute(
             select(TrackedEntity).where(
-                TrackedEntity.entity_id == primary_id,
+                TrackedEntity.entity_id.in_([primary_id, secondary_id]),
                 TrackedEntity.user_id == current_user.user_id
             )
         )
-        primary = primary_result.scalar_one_or_none()
-
-        secondary_result = await session.execute(
-            select(TrackedEntity).where(
-                TrackedEntity.entity_id == secondary_id,
-                TrackedEntity.user_id == current_user.user_id
-            )
-        )
-        secondary = secondary_result.scalar_one_or_none()
+        entities = {e.entity_id: e for e in entities_result.scalars().all()}
+        primary = entities.get(primary_id)
+        secondary = entities.get(secondary_id)
 
         if not primary:
             raise HTTPException(404, f"Primary entity not found: {primary_id}")
@@ -661,47 +861,23 @@ async def merge_entities(
         if primary_id == secondary_id:
             raise HTTPException(400, "Cannot merge entity with itself")
 
-        # Count mentions being moved
-        mention_count_query = select(EntityMention).where(
-            EntityMention.entity_id == secondary_id
-        )
-        mention_result = await session.execute(mention_count_query)
-        mentions_to_move = len(list(mention_result.scalars().all()))
-
-        # Move all mentions from secondary to primary
-        await session.execute(
-            update(EntityMention)
-            .where(EntityMention.entity_id == secondary_id)
-            .values(entity_id=primary_id)
-        )
-
-        # Merge aliases into primary's metadata
-        primary_metadata = dict(primary.entity_metadata) if primary.entity_metadata else {}
-        secondary_metadata = dict(secondary.entity_metadata) if secondary.entity_metadata else {}
-
-        primary_aliases = set(primary_metadata.get("aliases", []))
-        secondary_aliases = set(secondary_metadata.get("aliases", []))
-        secondary_aliases.add(secondary.name)  # Add secondary's name as alias
-
-        merged_aliases = list(primary_aliases | secondary_aliases)
-
-        # Track merge history
-        merge_history = primary_metadata.get("merged_from", [])
-        merge_history.append({
-            "entity_id": str(secondary_id),
-            "name": secondary.name,
-            "merged_at": str(uuid.uuid1().time)  # Timestamp
+        # Move mentions, merge aliases and merge history into the primary's
+        # metadata, and delete the secondary in a single statement
+        merge_result = await session.execute(_MERGE_ENTITIES_SQL, {
+            "primary_id": primary_id,
+            "secondary_id": secondary_id,
+            "user_id": current_user.user_id,
+            "merged_at": datetime.now(timezone.utc).isoformat(),
         })
+        merged = merge_result.one()
+        if merged.deleted_name is None:
+            await session.rollback()
+            raise HTTPException(404, f"Secondary entity not found: {secondary_id}")
+        mentions_to_move = merged.mentions_moved
+        merged_aliases = merged.aliases or []
 
-        primary_metadata["aliases"] = merged_aliases
-        primary_metadata["merged_from"] = merge_history
-
-        # Update primary entity metadata
-        primary.entity_metadata = primary_metadata
-
-        # Delete secondary entity
-        await session.delete(secondary)
         await session.commit()
+        await _invalidate_entities(current_user.user_id)
 
         logger.info(
             f"Merged entity {secondary.name} ({secondary_id}) into "
@@ -711,11 +887,11 @@ async def merge_entities(
         return {
             "status": "merged",
             "primary": {
-                "entity_id": str(primary_id),
+                "entity_id": primary_id,
                 "name": primary.name,
             },
             "secondary": {
-                "entity_id": str(secondary_id),
+                "entity_id": secondary_id,
                 "name": secondary.name,
             },
             "mentions_moved": mentions_to_move,
@@ -9,21 +9,262 @@ Provides endpoints for:
 - Statistics
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import Optional, List, Dict, Tuple
 from uuid import UUID
-from datetime import datetime, timedelta
+import base64
+import operator
+from datetime import date, datetime, timedelta
 from pydantic import BaseModel, Field
+import orjson
 
+from app.core.cache import cache_get, cache_set, LOCAL_GOVERNMENT_NAMESPACE
 from app.core.dependencies import get_db, get_local_user, LocalUser
+from app.core.responses import PulseORJSONResponse
+from app.database import async_session
 from app.services.local_government import GeofenceService, LocalIntelligenceAnalyzer
+from app.services.local_government.geofence_service import PREDEFINED_AREAS
 from app.models.local_government import (
     WatchArea, LocalGovernmentAlert,
     CouncilMeeting, ZoningCase, BuildingPermit, PropertyTransaction, LocalCourtCase
 )
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, delete, desc, func, and_, or_, bindparam, cast, true, tuple_, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Encodes UUIDs and datetimes directly, so handlers can return raw column
+# values; the listings return the response themselves to skip jsonable_encoder
+router = APIRouter(
+    prefix="/local",
+    tags=["local-government"],
+    default_response_class=PulseORJSONResponse
+)
+
+# Record listings are shared across users and only change when the local
+# collectors run, which clears LOCAL_GOVERNMENT_NAMESPACE
+LIST_CACHE_TTL = 30
+MENTIONS_CACHE_TTL = 300
+STREAM_BATCH_SIZE = 100
+
+
+# Columns returned by the record listings. Selecting them directly returns
+# plain rows instead of hydrating full ORM objects (with their large
+# text/JSON columns) only to read a few attributes.
+_MEETING_LIST_COLUMNS = (
+    CouncilMeeting.id,
+    CouncilMeeting.jurisdiction,
+    CouncilMeeting.body,
+    CouncilMeeting.meeting_type,
+    CouncilMeeting.meeting_date,
+    CouncilMeeting.agenda_url,
+    # Only the length is listed; counted in Postgres so the array isn't sent
+    func.coalesce(
+        func.jsonb_array_length(cast(CouncilMeeting.agenda_items, JSONB)), 0
+    ).label("agenda_items_count"),
+    CouncilMeeting.summary,
+)
+
+# agenda_items/votes are JSON columns, so the detail view is a single row;
+# minutes_text and the extraction columns are not returned
+_MEETING_DETAIL_COLUMNS = (
+    CouncilMeeting.id,
+    CouncilMeeting.jurisdiction,
+    CouncilMeeting.body,
+    CouncilMeeting.meeting_type,
+    CouncilMeeting.meeting_date,
+    CouncilMeeting.agenda_url,
+    CouncilMeeting.agenda_text,
+    CouncilMeeting.minutes_url,
+    CouncilMeeting.video_url,
+    CouncilMeeting.agenda_items,
+    CouncilMeeting.votes,
+    CouncilMeeting.summary,
+)
+
+_ZONING_LIST_COLUMNS = (
+    ZoningCase.id,
+    ZoningCase.case_number,
+    ZoningCase.jurisdiction,
+    ZoningCase.case_type,
+    ZoningCase.address,
+    ZoningCase.applicant,
+    ZoningCase.status,
+    ZoningCase.filed_date,
+    ZoningCase.hearing_date,
+)
+
+_PERMIT_LIST_COLUMNS = (
+    BuildingPermit.id,
+    BuildingPermit.permit_number,
+    BuildingPermit.jurisdiction,
+    BuildingPermit.permit_type,
+    BuildingPermit.address,
+    BuildingPermit.contractor,
+    BuildingPermit.estimated_value,
+    BuildingPermit.status,
+    BuildingPermit.applied_date,
+)
+
+_PROPERTY_LIST_COLUMNS = (
+    PropertyTransaction.id,
+    PropertyTransaction.parcel_id,
+    PropertyTransaction.address,
+    PropertyTransaction.jurisdiction,
+    PropertyTransaction.sale_price,
+    PropertyTransaction.sale_date,
+    PropertyTransaction.grantor,
+    PropertyTransaction.grantee,
+)
+
+_COURT_LIST_COLUMNS = (
+    LocalCourtCase.id,
+    LocalCourtCase.case_number,
+    LocalCourtCase.court,
+    LocalCourtCase.case_type,
+    LocalCourtCase.case_title,
+    LocalCourtCase.status,
+    LocalCourtCase.filed_date,
+    LocalCourtCase.next_hearing,
+)
 
-router = APIRouter(prefix="/local", tags=["local-government"])
+# /watch-areas/predefined body, encoded once at import
+_PREDEFINED_AREAS_JSON = orjson.dumps({"areas": PREDEFINED_AREAS})
+
+# Alert items are encoded by Postgres (json_build_object, read back as text),
+# so /alerts only concatenates them; no per-row Python objects or encoding
+_ALERT_JSON = cast(func.json_build_object(
+    "id", LocalGovernmentAlert.id,
+    "type", LocalGovernmentAlert.alert_type,
+    "severity", LocalGovernmentAlert.severity,
+    "title", LocalGovernmentAlert.title,
+    "summary", LocalGovernmentAlert.summary,
+    "address", LocalGovernmentAlert.address,
+    "source_type", LocalGovernmentAlert.source_type,
+    "source_url", LocalGovernmentAlert.source_url,
+    "is_read", LocalGovernmentAlert.is_read,
+    "created_at", LocalGovernmentAlert.created_at,
+), Text)
+
+
+def _optional_filter(column, value, compare=operator.eq):
+    """
+    Filter on column only when value is set.
+
+    Falsy values (None, an empty query parameter, a zero min_price) mean
+    "no filter", as the handlers' `if value:` checks did before.
+
+    Absent filters are left out of the SQL (true() drops out of an AND,
+    and a lone WHERE true is folded by the planner) rather than bound as
+    `:p IS NULL OR ...`: a generic plan keeps that OR and cannot use the
+    composite listing indexes. Each combination of filters is its own
+    statement, and there are few enough that asyncpg caches a prepared
+    statement for each.
+    """
+    if not value:
+        return true()
+    return compare(column, bindparam(column.key, value, type_=column.type))
+
+
+def _encode_cursor(sort_value, row_id) -> str:
+    """Encode a (date, id) keyset position as an opaque cursor string."""
+    raw = f"{sort_value.isoformat() if sort_value else ''}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _after_cursor(sort_column, id_column, cursor: str):
+    """
+    Build the WHERE clause for rows after a cursor from _encode_cursor.
+
+    Listings order by (sort_column DESC, id DESC), which puts NULL dates
+    first, so a cursor on a NULL date continues through the remaining
+    NULLs and then every dated row.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_raw, row_id = raw.split("|", 1)
+        row_id = UUID(row_id)
+        if not sort_raw:
+            sort_value = None
+        elif len(sort_raw) == 10:
+            sort_value = date.fromisoformat(sort_raw)
+        else:
+            sort_value = datetime.fromisoformat(sort_raw)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    if sort_value is None:
+        return or_(
+            sort_column.isnot(None),
+            and_(sort_column.is_(None), id_column < row_id)
+        )
+    return tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+
+
+async def _fetch_page(db, query, sort_column, id_column, limit: int, offset: int,
+                      cursor: Optional[str]) -> Tuple[List[Dict], Optional[int], Optional[str]]:
+    """
+    Run a record listing query, paging by keyset cursor or by offset.
+
+    Offset pages carry the filtered total in a COUNT(*) OVER () column, so
+    the page and the count come back in one round-trip. Cursor pages skip
+    the count to stay O(limit) and report total as None.
+
+    Returns:
+        (rows as dicts, total or None, next_cursor or None)
+    """
+    if cursor:
+        # Keyset path: index seek instead of an offset scan
+        query = query.where(_after_cursor(sort_column, id_column, cursor))
+    else:
+        count_query = query.with_only_columns(
+            func.count(), maintain_column_froms=True
+        ).order_by(None)
+        query = query.add_columns(func.count().over().label("total")).offset(offset)
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    rows = [dict(row) for row in result.mappings()]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    total = None
+    if not cursor:
+        if rows:
+            total = rows[0]["total"]
+            for row in rows:
+                del row["total"]
+        elif offset:
+            # Paged past the end; the window count has no row to ride on
+            total = (await db.execute(count_query)).scalar() or 0
+        else:
+            total = 0
+
+    next_cursor = (
+        _encode_cursor(rows[-1][sort_column.key], rows[-1]["id"])
+        if has_more else None
+    )
+    return rows, total, next_cursor
+
+
+# ==================== Dependencies ====================
+
+async def get_geofence(
+    db=Depends(get_db),
+    current_user: LocalUser = Depends(get_local_user)
+) -> GeofenceService:
+    """GeofenceService for the request's session and user (cached per request)."""
+    return GeofenceService(db, user_id=current_user.user_id)
+
+
+async def get_local_analyzer(
+    db=Depends(get_db),
+    current_user: LocalUser = Depends(get_local_user)
+) -> LocalIntelligenceAnalyzer:
+    """LocalIntelligenceAnalyzer for the request's session and user (cached per request)."""
+    return LocalIntelligenceAnalyzer(db, user_id=current_user.user_id)
 
 
 # ==================== Pydantic Models ====================
@@ -45,17 +286,20 @@ class LocationCheck(BaseModel):
     alert_type: Optional[str] = None
 
 
+class AlertsReadRequest(BaseModel):
+    """Request model for marking several alerts read."""
+    alert_ids: List[UUID] = Field(..., min_length=1, max_length=500)
+
+
 # ==================== Briefing Endpoints ====================
 
 @router.get("/briefing")
 async def get_local_briefing(
     days: int = Query(7, ge=1, le=90, description="Days to include"),
     jurisdiction: Optional[str] = Query(None, description="Filter by jurisdiction"),
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    analyzer: LocalIntelligenceAnalyzer = Depends(get_local_analyzer)
 ):
     """Get local government briefing."""
-    analyzer = LocalIntelligenceAnalyzer(db, user_id=current_user.user_id)
     briefing = await analyzer.generate_local_briefing(days=days)
 
     return briefing
@@ -64,11 +308,9 @@ async def get_local_briefing(
 @router.get("/stats")
 async def get_local_stats(
     jurisdiction: Optional[str] = Query(None),
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    analyzer: LocalIntelligenceAnalyzer = Depends(get_local_analyzer)
 ):
     """Get local government activity statistics."""
-    analyzer = LocalIntelligenceAnalyzer(db, user_id=current_user.user_id)
     stats = await analyzer.get_activity_stats(jurisdiction=jurisdiction)
 
     return stats
@@ -82,42 +324,26 @@ async def list_watch_areas(
     current_user: LocalUser = Depends(get_local_user)
 ):
     """List user's watch areas."""
-    query = select(WatchArea).where(
+    # cached_json is maintained by GeofenceService on every write
+    query = select(WatchArea.cached_json).where(
         WatchArea.user_id == current_user.user_id
     ).order_by(WatchArea.name)
 
     result = await db.execute(query)
     areas = result.scalars().all()
 
-    return {
+    return PulseORJSONResponse({
         "count": len(areas),
-        "watch_areas": [
-            {
-                "id": str(area.id),
-                "name": area.name,
-                "description": area.description,
-                "latitude": area.latitude,
-                "longitude": area.longitude,
-                "radius_miles": area.radius_miles,
-                "alert_types": area.alert_types,
-                "is_active": area.is_active,
-                "trigger_count": area.trigger_count,
-                "last_triggered": area.last_triggered.isoformat() if area.last_triggered else None
-            }
-            for area in areas
-        ]
-    }
+        "watch_areas": areas
+    })
 
 
 @router.post("/watch-areas")
 async def create_watch_area(
     request: WatchAreaCreate,
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    geofence: GeofenceService = Depends(get_geofence)
 ):
     """Create a new watch area."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
-
     watch_area = await geofence.create_watch_area(
         name=request.name,
         latitude=request.latitude,
@@ -137,12 +363,9 @@ async def create_watch_area(
 @router.post("/watch-areas/predefined/{area_key}")
 async def create_predefined_watch_area(
     area_key: str,
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    geofence: GeofenceService = Depends(get_geofence)
 ):
     """Create a watch area from predefined locations."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
-
     watch_area = await geofence.create_from_predefined(area_key)
 
     if not watch_area:
@@ -156,13 +379,10 @@ async def create_predefined_watch_area(
 
 
 @router.get("/watch-areas/predefined")
-async def list_predefined_areas(
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
-):
+async def list_predefined_areas():
     """List available predefined watch areas."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
-    return {"areas": geofence.get_predefined_areas()}
+    # Static data: no session or user lookup, and no per-request encoding
+    return Response(content=_PREDEFINED_AREAS_JSON, media_type="application/json")
 
 
 @router.delete("/watch-areas/{area_id}")
@@ -172,34 +392,26 @@ async def delete_watch_area(
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Delete a watch area."""
-    result = await db.execute(
-        select(WatchArea).where(
+    deleted_id = await db.scalar(
+        delete(WatchArea).where(
             WatchArea.id == area_id,
             WatchArea.user_id == current_user.user_id
-        )
+        ).returning(WatchArea.id)
     )
-    area = result.scalar_one_or_none()
 
-    if not area:
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Watch area not found")
 
-    await db.delete(area)
-    await db.commit()
-
     return {"message": "Watch area deleted"}
 
 
 @router.post("/check-location")
 async def check_location(
     request: LocationCheck,
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    geofence: GeofenceService = Depends(get_geofence)
 ):
     """Check if a location is within any watch area."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
-    await geofence.load_watch_areas()
-
-    triggered = geofence.check_location(
+    triggered = await geofence.find_triggered_areas(
         latitude=request.latitude,
         longitude=request.longitude,
         alert_type=request.alert_type
@@ -215,11 +427,9 @@ async def check_location(
 @router.post("/scan")
 async def scan_recent_activity(
     hours: int = Query(24, ge=1, le=168),
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    geofence: GeofenceService = Depends(get_geofence)
 ):
     """Scan recent activity for watch area matches."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
     matches = await geofence.scan_recent_activity(hours=hours)
 
     return matches
@@ -231,44 +441,45 @@ async def scan_recent_activity(
 async def get_alerts(
     unread_only: bool = Query(False),
     limit: int = Query(50, ge=1, le=200),
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    geofence: GeofenceService = Depends(get_geofence)
 ):
-    """Get local government alerts."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
-    alerts = await geofence.get_user_alerts(
-        unread_only=unread_only,
-        limit=limit
-    )
+    """Get local government alerts, streamed to the client as rows are read."""
+    query = geofence.user_alerts_query(
+        unread_only=unread_only, limit=limit
+    ).with_only_columns(_ALERT_JSON, maintain_column_froms=True)
+
+    async def stream_alerts():
+        # Dependencies with yield exit before a streamed body is sent, so the
+        # rows are read on a session owned by the generator
+        count = 0
+        yield b'{"alerts":['
+        async with async_session() as session:
+            result = await session.stream(query)
+            async for item in result.yield_per(STREAM_BATCH_SIZE).scalars():
+                yield item.encode() if count == 0 else b"," + item.encode()
+                count += 1
+        yield b'],"count":%d}' % count
+
+    return StreamingResponse(stream_alerts(), media_type="application/json")
+
+
+@router.post("/alerts/read")
+async def mark_alerts_read(
+    request: AlertsReadRequest,
+    geofence: GeofenceService = Depends(get_geofence)
+):
+    """Mark several alerts as read in a single statement."""
+    updated = await geofence.mark_alerts_read(request.alert_ids)
 
-    return {
-        "count": len(alerts),
-        "alerts": [
-            {
-                "id": str(alert.id),
-                "type": alert.alert_type,
-                "severity": alert.severity,
-                "title": alert.title,
-                "summary": alert.summary,
-                "address": alert.address,
-                "source_type": alert.source_type,
-                "source_url": alert.source_url,
-                "is_read": alert.is_read,
-                "created_at": alert.created_at.isoformat()
-            }
-            for alert in alerts
-        ]
-    }
+    return {"updated": updated, "message": f"Marked {updated} alerts as read"}
 
 
 @router.post("/alerts/{alert_id}/read")
 async def mark_alert_read(
     alert_id: UUID,
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    geofence: GeofenceService = Depends(get_geofence)
 ):
     """Mark an alert as read."""
-    geofence = GeofenceService(db, user_id=current_user.user_id)
     success = await geofence.mark_alert_read(alert_id)
 
     if not success:
@@ -284,36 +495,40 @@ async def list_council_meetings(
     jurisdiction: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """List council meetings."""
-    query = select(CouncilMeeting).order_by(desc(CouncilMeeting.meeting_date))
-
-    if jurisdiction:
-        query = query.where(CouncilMeeting.jurisdiction == jurisdiction)
-
-    query = query.limit(limit).offset(offset)
+    cache_params = {
+        "endpoint": "meetings",
+        "jurisdiction": jurisdiction, "limit": limit, "offset": offset,
+        "cursor": cursor,
+    }
+    cached = await cache_get(LOCAL_GOVERNMENT_NAMESPACE, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
+    query = (
+        select(*_MEETING_LIST_COLUMNS)
+        .where(
+            _optional_filter(CouncilMeeting.jurisdiction, jurisdiction)
+        )
+        .order_by(desc(CouncilMeeting.meeting_date), desc(CouncilMeeting.id))
+    )
 
-    result = await db.execute(query)
-    meetings = result.scalars().all()
+    meetings, total, next_cursor = await _fetch_page(
+        db, query, CouncilMeeting.meeting_date, CouncilMeeting.id, limit, offset, cursor
+    )
 
-    return {
+    payload = {
         "count": len(meetings),
-        "meetings": [
-            {
-                "id": str(m.id),
-                "jurisdiction": m.jurisdiction,
-                "body": m.body,
-                "meeting_type": m.meeting_type,
-                "meeting_date": m.meeting_date.isoformat() if m.meeting_date else None,
-                "agenda_url": m.agenda_url,
-                "agenda_items_count": len(m.agenda_items or []),
-                "summary": m.summary
-            }
-            for m in meetings
-        ]
+        "total": total,
+        "next_cursor": next_cursor,
+        "meetings": meetings
     }
+    await cache_set(LOCAL_GOVERNMENT_NAMESPACE, cache_params, payload, LIST_CACHE_TTL)
+    return PulseORJSONResponse(payload)
 
 
 @router.get("/meetings/{meeting_id}")
@@ -324,27 +539,14 @@ async def get_meeting(
 ):
     """Get meeting details."""
     result = await db.execute(
-        select(CouncilMeeting).where(CouncilMeeting.id == meeting_id)
+        select(*_MEETING_DETAIL_COLUMNS).where(CouncilMeeting.id == meeting_id)
     )
-    meeting = result.scalar_one_or_none()
+    meeting = result.mappings().one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    return {
-        "id": str(meeting.id),
-        "jurisdiction": meeting.jurisdiction,
-        "body": meeting.body,
-        "meeting_type": meeting.meeting_type,
-        "meeting_date": meeting.meeting_date.isoformat() if meeting.meeting_date else None,
-        "agenda_url": meeting.agenda_url,
-        "agenda_text": meeting.agenda_text,
-        "minutes_url": meeting.minutes_url,
-        "video_url": meeting.video_url,
-        "agenda_items": meeting.agenda_items,
-        "votes": meeting.votes,
-        "summary": meeting.summary
-    }
+    return PulseORJSONResponse(dict(meeting))
 
 
 # ==================== Zoning Case Endpoints ====================
@@ -355,39 +557,41 @@ async def list_zoning_cases(
     status: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """List zoning cases."""
-    query = select(ZoningCase).order_by(desc(ZoningCase.filed_date))
-
-    if jurisdiction:
-        query = query.where(ZoningCase.jurisdiction == jurisdiction)
-    if status:
-        query = query.where(ZoningCase.status == status)
-
-    query = query.limit(limit).offset(offset)
+    cache_params = {
+        "endpoint": "zoning",
+        "jurisdiction": jurisdiction, "status": status, "limit": limit, "offset": offset,
+        "cursor": cursor,
+    }
+    cached = await cache_get(LOCAL_GOVERNMENT_NAMESPACE, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
+    query = (
+        select(*_ZONING_LIST_COLUMNS)
+        .where(
+            _optional_filter(ZoningCase.jurisdiction, jurisdiction),
+            _optional_filter(ZoningCase.status, status)
+        )
+        .order_by(desc(ZoningCase.filed_date), desc(ZoningCase.id))
+    )
 
-    result = await db.execute(query)
-    cases = result.scalars().all()
+    cases, total, next_cursor = await _fetch_page(
+        db, query, ZoningCase.filed_date, ZoningCase.id, limit, offset, cursor
+    )
 
-    return {
+    payload = {
         "count": len(cases),
-        "cases": [
-            {
-                "id": str(c.id),
-                "case_number": c.case_number,
-                "jurisdiction": c.jurisdiction,
-                "case_type": c.case_type,
-                "address": c.address,
-                "applicant": c.applicant,
-                "status": c.status,
-                "filed_date": c.filed_date.isoformat() if c.filed_date else None,
-                "hearing_date": c.hearing_date.isoformat() if c.hearing_date else None
-            }
-            for c in cases
-        ]
+        "total": total,
+        "next_cursor": next_cursor,
+        "cases": cases
     }
+    await cache_set(LOCAL_GOVERNMENT_NAMESPACE, cache_params, payload, LIST_CACHE_TTL)
+    return PulseORJSONResponse(payload)
 
 
 # ==================== Permit Endpoints ====================
@@ -398,39 +602,42 @@ async def list_permits(
     permit_type: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """List building permits."""
-    query = select(BuildingPermit).order_by(desc(BuildingPermit.applied_date))
-
-    if jurisdiction:
-        query = query.where(BuildingPermit.jurisdiction == jurisdiction)
-    if permit_type:
-        query = query.where(BuildingPermit.permit_type == permit_type)
-
-    query = query.limit(limit).offset(offset)
+    cache_params = {
+        "endpoint": "permits",
+        "jurisdiction": jurisdiction, "permit_type": permit_type,
+        "limit": limit, "offset": offset,
+        "cursor": cursor,
+    }
+    cached = await cache_get(LOCAL_GOVERNMENT_NAMESPACE, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
+    query = (
+        select(*_PERMIT_LIST_COLUMNS)
+        .where(
+            _optional_filter(BuildingPermit.jurisdiction, jurisdiction),
+            _optional_filter(BuildingPermit.permit_type, permit_type)
+        )
+        .order_by(desc(BuildingPermit.applied_date), desc(BuildingPermit.id))
+    )
 
-    result = await db.execute(query)
-    permits = result.scalars().all()
+    permits, total, next_cursor = await _fetch_page(
+        db, query, BuildingPermit.applied_date, BuildingPermit.id, limit, offset, cursor
+    )
 
-    return {
+    payload = {
         "count": len(permits),
-        "permits": [
-            {
-                "id": str(p.id),
-                "permit_number": p.permit_number,
-                "jurisdiction": p.jurisdiction,
-                "permit_type": p.permit_type,
-                "address": p.address,
-                "contractor": p.contractor,
-                "estimated_value": p.estimated_value,
-                "status": p.status,
-                "applied_date": p.applied_date.isoformat() if p.applied_date else None
-            }
-            for p in permits
-        ]
+        "total": total,
+        "next_cursor": next_cursor,
+        "permits": permits
     }
+    await cache_set(LOCAL_GOVERNMENT_NAMESPACE, cache_params, payload, LIST_CACHE_TTL)
+    return PulseORJSONResponse(payload)
 
 
 # ==================== Property Transaction Endpoints ====================
@@ -441,38 +648,41 @@ async def list_property_transactions(
     min_price: Optional[float] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """List property transactions."""
-    query = select(PropertyTransaction).order_by(desc(PropertyTransaction.sale_date))
-
-    if jurisdiction:
-        query = query.where(PropertyTransaction.jurisdiction == jurisdiction)
-    if min_price:
-        query = query.where(PropertyTransaction.sale_price >= min_price)
-
-    query = query.limit(limit).offset(offset)
+    cache_params = {
+        "endpoint": "property",
+        "jurisdiction": jurisdiction, "min_price": min_price, "limit": limit, "offset": offset,
+        "cursor": cursor,
+    }
+    cached = await cache_get(LOCAL_GOVERNMENT_NAMESPACE, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
+    query = (
+        select(*_PROPERTY_LIST_COLUMNS)
+        .where(
+            _optional_filter(PropertyTransaction.jurisdiction, jurisdiction),
+            _optional_filter(PropertyTransaction.sale_price, min_price, operator.ge)
+        )
+        .order_by(desc(PropertyTransaction.sale_date), desc(PropertyTransaction.id))
+    )
 
-    result = await db.execute(query)
-    transactions = result.scalars().all()
+    transactions, total, next_cursor = await _fetch_page(
+        db, query, PropertyTransaction.sale_date, PropertyTransaction.id, limit, offset, cursor
+    )
 
-    return {
+    payload = {
         "count": len(transactions),
-        "transactions": [
-            {
-                "id": str(t.id),
-                "parcel_id": t.parcel_id,
-                "address": t.address,
-                "jurisdiction": t.jurisdiction,
-                "sale_price": t.sale_price,
-                "sale_date": t.sale_date.isoformat() if t.sale_date else None,
-                "grantor": t.grantor,
-                "grantee": t.grantee
-            }
-            for t in transactions
-        ]
+        "total": total,
+        "next_cursor": next_cursor,
+        "transactions": transactions
     }
+    await cache_set(LOCAL_GOVERNMENT_NAMESPACE, cache_params, payload, LIST_CACHE_TTL)
+    return PulseORJSONResponse(payload)
 
 
 # ==================== Court Case Endpoints ====================
@@ -483,38 +693,41 @@ async def list_court_cases(
     case_type: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """List court cases."""
-    query = select(LocalCourtCase).order_by(desc(LocalCourtCase.filed_date))
-
-    if court:
-        query = query.where(LocalCourtCase.court == court)
-    if case_type:
-        query = query.where(LocalCourtCase.case_type == case_type)
-
-    query = query.limit(limit).offset(offset)
+    cache_params = {
+        "endpoint": "court",
+        "court": court, "case_type": case_type, "limit": limit, "offset": offset,
+        "cursor": cursor,
+    }
+    cached = await cache_get(LOCAL_GOVERNMENT_NAMESPACE, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
+    query = (
+        select(*_COURT_LIST_COLUMNS)
+        .where(
+            _optional_filter(LocalCourtCase.court, court),
+            _optional_filter(LocalCourtCase.case_type, case_type)
+        )
+        .order_by(desc(LocalCourtCase.filed_date), desc(LocalCourtCase.id))
+    )
 
-    result = await db.execute(query)
-    cases = result.scalars().all()
+    cases, total, next_cursor = await _fetch_page(
+        db, query, LocalCourtCase.filed_date, LocalCourtCase.id, limit, offset, cursor
+    )
 
-    return {
+    payload = {
         "count": len(cases),
-        "cases": [
-            {
-                "id": str(c.id),
-                "case_number": c.case_number,
-                "court": c.court,
-                "case_type": c.case_type,
-                "case_title": c.case_title,
-                "status": c.status,
-                "filed_date": c.filed_date.isoformat() if c.filed_date else None,
-                "next_hearing": c.next_hearing.isoformat() if c.next_hearing else None
-            }
-            for c in cases
-        ]
+        "total": total,
+        "next_cursor": next_cursor,
+        "cases": cases
     }
+    await cache_set(LOCAL_GOVERNMENT_NAMESPACE, cache_params, payload, LIST_CACHE_TTL)
+    return PulseORJSONResponse(payload)
 
 
 # ==================== Entity Search ====================
@@ -522,11 +735,17 @@ async def list_court_cases(
 @router.get("/search/entity/{entity_name}")
 async def search_entity_mentions(
     entity_name: str,
-    db=Depends(get_db),
-    current_user: LocalUser = Depends(get_local_user)
+    analyzer: LocalIntelligenceAnalyzer = Depends(get_local_analyzer)
 ):
     """Search for entity mentions across local government records."""
-    analyzer = LocalIntelligenceAnalyzer(db, user_id=current_user.user_id)
+    # Most names match nothing; caching the (often empty) result lets repeat
+    # lookups skip the scans until the next collector run
+    cache_params = {"endpoint": "entity_mentions", "name": entity_name.lower()}
+    cached = await cache_get(LOCAL_GOVERNMENT_NAMESPACE, cache_params)
+    if cached is not None:
+        return PulseORJSONResponse(cached)
+
     mentions = await analyzer.find_entity_mentions(entity_name)
 
-    return mentions
+    await cache_set(LOCAL_GOVERNMENT_NAMESPACE, cache_params, mentions, MENTIONS_CACHE_TTL)
+    return PulseORJSONResponse(mentions)
@@ -8,36 +8,146 @@ Provides endpoints for:
 - Graph statistics
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response
 from typing import Optional, List, Dict, Any, Literal
-from uuid import UUID
+from collections import OrderedDict
+from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone, timedelta
 from sqlalchemy import text
+import numpy as np
+import orjson
 import asyncio
+import hashlib
+import inspect
 import logging
+import threading
 import time
-
+import weakref
+
+from app.core.cache import (
+    NETWORK_CLUSTERS_NAMESPACE,
+    NETWORK_LAYOUT_NAMESPACE,
+    cache_clear,
+    cache_get,
+    cache_set,
+    user_namespace,
+)
 from app.core.dependencies import get_db, get_local_user, LocalUser
+from app.core.responses import PulseORJSONResponse
+from app.database import async_session
 from app.services.network_mapper import NetworkMapperService, RelationshipDiscoveryService
+from app.services.network_mapper.discovery_jobs import get_discovery_job_manager
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/network", tags=["network"])
+router = APIRouter(
+    prefix="/network",
+    tags=["network"],
+    default_response_class=PulseORJSONResponse
+)
 
 
 # ==================== Graph Cache ====================
 
 class GraphCache:
-    """Simple in-memory cache for loaded graphs with TTL."""
+    """
+    Simple in-memory cache for loaded graphs with TTL.
+
+    Hits are served without locking. On a miss the first caller registers
+    a Future for the key and loads the graph; concurrent callers for the
+    same key await that Future instead of issuing their own load, and
+    other users are never blocked.
+
+    Futures belong to the loop that created them, so the in-flight registry
+    is kept per event loop. A loop that is closed and collected (test
+    runners, worker restarts) drops its registry with it instead of leaving
+    Futures behind that another loop would fail to await.
+
+    The cache is bounded: least recently used graphs are evicted once there
+    are more than max_entries, or once the cached graphs together hold more
+    than max_elements nodes plus edges. The newest graph is always kept.
+    Evicted graphs are only weakly referenced; one still in use by a request
+    is promoted back on its user's next lookup instead of being reloaded.
+    """
 
-    def __init__(self, ttl_seconds: int = 60):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        max_entries: int = 128,
+        max_elements: int = 5_000_000
+    ):
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._ttl = timedelta(seconds=ttl_seconds)
-        self._lock = asyncio.Lock()
+        self._max_entries = max_entries
+        self._max_elements = max_elements
+        self._elements_used = 0
+        # Evicted mappers, alive only while something else holds them
+        self._evicted = weakref.WeakValueDictionary()
+        self._evicted_loaded_at: Dict[str, datetime] = {}
+        # event loop -> {cache key: Future}
+        self._inflight_by_loop = weakref.WeakKeyDictionary()
+        self._registry_lock = threading.Lock()
 
     def _cache_key(self, user_id: UUID) -> str:
         return str(user_id) if user_id else "default"
 
+    def _inflight(self) -> Dict[str, asyncio.Future]:
+        """In-flight loads for the running event loop."""
+        loop = asyncio.get_running_loop()
+        # Loops may run in different threads; WeakKeyDictionary.setdefault is not atomic
+        with self._registry_lock:
+            return self._inflight_by_loop.setdefault(loop, {})
+
+    def _fresh_entry(self, key: str, now: datetime) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(key)
+        if entry is not None and now - entry["loaded_at"] < self._ttl:
+            self._cache.move_to_end(key)
+            return entry
+
+        mapper = self._evicted.get(key)
+        if mapper is not None:
+            loaded_at = self._evicted_loaded_at[key]
+            if now - loaded_at < self._ttl:
+                logger.debug(f"Promoting evicted graph for user {key}")
+                self._store(key, mapper, loaded_at)
+                return self._cache[key]
+        return None
+
+    def _store(self, key: str, mapper: NetworkMapperService, loaded_at: datetime) -> None:
+        self._discard(key)
+        self._evicted.pop(key, None)
+        self._evicted_loaded_at.pop(key, None)
+        elements = mapper.graph.number_of_nodes() + mapper.graph.number_of_edges()
+        self._cache[key] = {
+            "mapper": mapper,
+            "loaded_at": loaded_at,
+            "elements": elements
+        }
+        self._elements_used += elements
+
+        while len(self._cache) > 1 and (
+            len(self._cache) > self._max_entries
+            or self._elements_used > self._max_elements
+        ):
+            evicted_key, evicted = next(iter(self._cache.items()))
+            self._discard(evicted_key)
+            self._evicted[evicted_key] = evicted["mapper"]
+            self._evicted_loaded_at[evicted_key] = evicted["loaded_at"]
+            logger.info(f"Evicted graph cache for user {evicted_key}")
+
+        # Drop timestamps of evicted mappers that have since been collected
+        for stale_key in [k for k in self._evicted_loaded_at if k not in self._evicted]:
+            del self._evicted_loaded_at[stale_key]
+
+    def _discard(self, key: str) -> bool:
+        # Requests already holding the mapper keep using it; it is freed
+        # once they finish, so the graph is not cleared here
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._elements_used -= entry["elements"]
+        return True
+
     async def get_mapper(
         self,
         db,
@@ -47,42 +157,71 @@ class GraphCache:
         key = self._cache_key(user_id)
         now = datetime.now(timezone.utc)
 
-        async with self._lock:
-            # Check if we have a valid cached entry
-            if key in self._cache:
-                entry = self._cache[key]
-                if now - entry["loaded_at"] < self._ttl:
-                    logger.debug(f"Graph cache hit for user {key}")
-                    # Update db session reference
-                    entry["mapper"].db = db
-                    return entry["mapper"]
-                else:
-                    logger.debug(f"Graph cache expired for user {key}")
+        entry = self._fresh_entry(key, now)
+        if entry is not None:
+            logger.debug(f"Graph cache hit for user {key}")
+            # Update db session reference
+            entry["mapper"].db = db
+            return entry["mapper"]
+
+        inflight_loads = self._inflight()
+        inflight = inflight_loads.get(key)
+        if inflight is not None:
+            logger.debug(f"Waiting on in-flight graph load for user {key}")
+            try:
+                # Shield so a cancelled waiter does not cancel the shared load
+                mapper = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The loading request was cancelled; take over the load
+                return await self.get_mapper(db, user_id)
+            mapper.db = db
+            return mapper
 
+        future = asyncio.get_running_loop().create_future()
+        inflight_loads[key] = future
+        try:
             # Create new mapper and load from database
             logger.info(f"Loading graph from database for user {key}")
             mapper = NetworkMapperService(db, user_id=user_id)
             await mapper.load_from_database()
 
             # Cache it
-            self._cache[key] = {
-                "mapper": mapper,
-                "loaded_at": now
-            }
-
+            self._store(key, mapper, now)
+            future.set_result(mapper)
             return mapper
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved so a load nobody waited on
+            # does not log "Future exception was never retrieved"
+            future.exception()
+            raise
+        finally:
+            inflight_loads.pop(key, None)
+
+    def keys_for_user(self, user_id: Optional[UUID]) -> List[str]:
+        """Keys currently cached for a user (at most one: graphs are per user)."""
+        key = self._cache_key(user_id)
+        return [key] if key in self._cache else []
 
     async def invalidate(self, user_id: Optional[UUID] = None):
         """Invalidate cache for a user or all users."""
-        async with self._lock:
-            if user_id:
-                key = self._cache_key(user_id)
-                if key in self._cache:
-                    del self._cache[key]
-                    logger.info(f"Invalidated graph cache for user {key}")
-            else:
-                self._cache.clear()
-                logger.info("Invalidated all graph caches")
+        if user_id:
+            key = self._cache_key(user_id)
+            self._evicted.pop(key, None)
+            self._evicted_loaded_at.pop(key, None)
+            if self._discard(key):
+                logger.info(f"Invalidated graph cache for user {key}")
+        else:
+            self._cache.clear()
+            self._evicted.clear()
+            self._evicted_loaded_at.clear()
+            self._elements_used = 0
+            logger.info("Invalidated all graph caches")
 
 
 # SERV-007: Global cache instance with 5-minute TTL (was 60 seconds)
@@ -92,16 +231,18 @@ _graph_cache = GraphCache(ttl_seconds=300)
 # ==================== Layout Cache (SERV-002) ====================
 
 class LayoutCache:
-    """Cache for computed layout positions with longer TTL."""
+    """
+    Cache for computed layout positions with longer TTL.
+
+    Backed by Redis so every worker shares one computation per user,
+    algorithm and node count; expiry is handled by the Redis TTL.
+    """
 
     def __init__(self, ttl_seconds: int = 300):  # 5 minute TTL
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._ttl = timedelta(seconds=ttl_seconds)
-        self._lock = asyncio.Lock()
+        self.ttl_seconds = ttl_seconds
 
-    def _cache_key(self, user_id: UUID, algorithm: str, node_count: int) -> str:
-        """Cache key includes algorithm and node count for invalidation."""
-        return f"{user_id}:{algorithm}:{node_count}"
+    def _namespace(self, user_id: UUID) -> str:
+        return user_namespace(NETWORK_LAYOUT_NAMESPACE, user_id)
 
     async def get_positions(
         self,
@@ -110,19 +251,13 @@ class LayoutCache:
         node_count: int
     ) -> Optional[Dict[str, tuple]]:
         """Get cached positions if valid."""
-        key = self._cache_key(user_id, algorithm, node_count)
-        now = datetime.now(timezone.utc)
-
-        async with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if now - entry["computed_at"] < self._ttl:
-                    logger.debug(f"Layout cache hit for {key}")
-                    return entry["positions"]
-                else:
-                    logger.debug(f"Layout cache expired for {key}")
-                    del self._cache[key]
-        return None
+        positions = await cache_get(
+            self._namespace(user_id),
+            {"algorithm": algorithm, "node_count": node_count}
+        )
+        if positions is not None:
+            logger.debug(f"Layout cache hit for {user_id}:{algorithm}:{node_count}")
+        return positions
 
     async def set_positions(
         self,
@@ -132,26 +267,21 @@ class LayoutCache:
         positions: Dict[str, tuple]
     ):
         """Store computed positions in cache."""
-        key = self._cache_key(user_id, algorithm, node_count)
-        async with self._lock:
-            self._cache[key] = {
-                "positions": positions,
-                "computed_at": datetime.now(timezone.utc)
-            }
-            logger.info(f"Cached layout positions for {key} ({len(positions)} nodes)")
+        await cache_set(
+            self._namespace(user_id),
+            {"algorithm": algorithm, "node_count": node_count},
+            positions,
+            self.ttl_seconds
+        )
+        logger.info(
+            f"Cached layout positions for {user_id}:{algorithm}:{node_count} "
+            f"({len(positions)} nodes)"
+        )
 
-    async def invalidate(self, user_id: Optional[UUID] = None):
-        """Invalidate cache for a user or all users."""
-        async with self._lock:
-            if user_id:
-                keys_to_delete = [k for k in self._cache if k.startswith(str(user_id))]
-                for key in keys_to_delete:
-                    del self._cache[key]
-                if keys_to_delete:
-                    logger.info(f"Invalidated {len(keys_to_delete)} layout cache entries")
-            else:
-                self._cache.clear()
-                logger.info("Invalidated all layout caches")
+    async def invalidate(self, user_id: UUID):
+        """Invalidate all cached layouts for a user."""
+        await cache_clear(self._namespace(user_id))
+        logger.info(f"Invalidated layout cache for user {user_id}")
 
 
 # Global layout cache with 5-minute TTL
@@ -161,15 +291,13 @@ _layout_cache = LayoutCache(ttl_seconds=300)
 # ==================== Cluster Cache (SERV-003) ====================
 
 class ClusterCache:
-    """Cache for computed cluster data with longer TTL."""
+    """Redis-backed cache for computed cluster data with longer TTL."""
 
     def __init__(self, ttl_seconds: int = 600):  # 10 minute TTL
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._ttl = timedelta(seconds=ttl_seconds)
-        self._lock = asyncio.Lock()
+        self.ttl_seconds = ttl_seconds
 
-    def _cache_key(self, user_id: UUID, min_size: int, node_count: int) -> str:
-        return f"{user_id}:clusters:{min_size}:{node_count}"
+    def _namespace(self, user_id: UUID) -> str:
+        return user_namespace(NETWORK_CLUSTERS_NAMESPACE, user_id)
 
     async def get_clusters(
         self,
@@ -178,19 +306,13 @@ class ClusterCache:
         node_count: int
     ) -> Optional[List[Dict]]:
         """Get cached clusters if valid."""
-        key = self._cache_key(user_id, min_size, node_count)
-        now = datetime.now(timezone.utc)
-
-        async with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if now - entry["computed_at"] < self._ttl:
-                    logger.debug(f"Cluster cache hit for {key}")
-                    return entry["clusters"]
-                else:
-                    logger.debug(f"Cluster cache expired for {key}")
-                    del self._cache[key]
-        return None
+        clusters = await cache_get(
+            self._namespace(user_id),
+            {"min_size": min_size, "node_count": node_count}
+        )
+        if clusters is not None:
+            logger.debug(f"Cluster cache hit for {user_id}:clusters:{min_size}:{node_count}")
+        return clusters
 
     async def set_clusters(
         self,
@@ -200,32 +322,230 @@ class ClusterCache:
         clusters: List[Dict]
     ):
         """Store computed clusters in cache."""
-        key = self._cache_key(user_id, min_size, node_count)
-        async with self._lock:
-            self._cache[key] = {
-                "clusters": clusters,
-                "computed_at": datetime.now(timezone.utc)
-            }
-            logger.info(f"Cached {len(clusters)} clusters for {key}")
+        await cache_set(
+            self._namespace(user_id),
+            {"min_size": min_size, "node_count": node_count},
+            clusters,
+            self.ttl_seconds
+        )
+        logger.info(f"Cached {len(clusters)} clusters for {user_id}:clusters:{min_size}:{node_count}")
 
-    async def invalidate(self, user_id: Optional[UUID] = None):
-        """Invalidate cache for a user or all users."""
-        async with self._lock:
-            if user_id:
-                keys_to_delete = [k for k in self._cache if k.startswith(str(user_id))]
-                for key in keys_to_delete:
-                    del self._cache[key]
-                if keys_to_delete:
-                    logger.info(f"Invalidated {len(keys_to_delete)} cluster cache entries")
-            else:
-                self._cache.clear()
-                logger.info("Invalidated all cluster caches")
+    async def invalidate(self, user_id: UUID):
+        """Invalidate all cached clusters for a user."""
+        await cache_clear(self._namespace(user_id))
+        logger.info(f"Invalidated cluster cache for user {user_id}")
 
 
 # Global cluster cache with 10-minute TTL
 _cluster_cache = ClusterCache(ttl_seconds=600)
 
 
+# ==================== Analytics Cache ====================
+
+class AnalyticsCache:
+    """
+    In-process cache for centrality and community results.
+
+    Keyed by the mapper's graph_version, which changes with every graph
+    change, so entries never need invalidating for correctness; the TTL and
+    LRU bound only limit memory.
+    """
+
+    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 512):
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # user id -> that user's keys, so per-user lookups skip the full scan
+        self._by_user: Dict[str, set] = {}
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    def _cache_key(self, user_id: UUID, metric: str, graph_version: int, limit: int) -> str:
+        return f"{user_id}:{metric}:{graph_version}:{limit}"
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return
+        user_keys = self._by_user.get(entry["user_id"])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._by_user[entry["user_id"]]
+
+    def keys_for_user(self, user_id: UUID) -> List[str]:
+        """Keys currently cached for a user."""
+        return sorted(self._by_user.get(str(user_id), ()))
+
+    async def get_result(
+        self,
+        user_id: UUID,
+        metric: str,
+        graph_version: int,
+        limit: int = 0
+    ) -> Optional[List[Dict]]:
+        """Get a cached result if valid."""
+        key = self._cache_key(user_id, metric, graph_version, limit)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if datetime.now(timezone.utc) - entry["computed_at"] >= self._ttl:
+            self._remove(key)
+            return None
+        self._cache.move_to_end(key)
+        logger.debug(f"Analytics cache hit for {key}")
+        return entry["result"]
+
+    async def set_result(
+        self,
+        user_id: UUID,
+        metric: str,
+        graph_version: int,
+        result: List[Dict],
+        limit: int = 0
+    ):
+        """Store a computed result in cache."""
+        key = self._cache_key(user_id, metric, graph_version, limit)
+        self._cache[key] = {
+            "result": result,
+            "computed_at": datetime.now(timezone.utc),
+            "user_id": str(user_id)
+        }
+        self._cache.move_to_end(key)
+        self._by_user.setdefault(str(user_id), set()).add(key)
+        while len(self._cache) > self._max_entries:
+            self._remove(next(iter(self._cache)))
+
+    async def invalidate(self, user_id: UUID):
+        """Drop all cached results for a user."""
+        keys_to_delete = self.keys_for_user(user_id)
+        for key in keys_to_delete:
+            self._remove(key)
+        if keys_to_delete:
+            logger.info(f"Invalidated {len(keys_to_delete)} analytics cache entries")
+
+
+# Global analytics cache with 1-hour TTL
+_analytics_cache = AnalyticsCache(ttl_seconds=3600)
+
+
+async def _cached_analytics(
+    mapper: NetworkMapperService,
+    user_id: UUID,
+    metric: str,
+    compute,
+    limit: int = 0,
+    refresh: bool = False
+) -> List[Dict]:
+    """Return a cached analytics result for the mapper's current graph, computing on miss."""
+    graph_version = mapper.graph_version
+    if not refresh:
+        result = await _analytics_cache.get_result(user_id, metric, graph_version, limit)
+        if result is not None:
+            return result
+
+    # compute may await the analytics pool; store under the version it ran on
+    result = compute()
+    if inspect.isawaitable(result):
+        result = await result
+    await _analytics_cache.set_result(user_id, metric, graph_version, result, limit)
+    return result
+
+
+# ==================== Helpers ====================
+
+# Graph versions are only unique within one process; salting ETags with a
+# per-process token keeps two workers' graphs from sharing a tag
+_ETAG_SALT = uuid4().hex
+
+
+def _graph_etag(user_id: UUID, graph_version: int, *options: Any) -> str:
+    """Strong ETag for a /network/graph payload."""
+    digest = hashlib.blake2b(
+        f"{_ETAG_SALT}:{user_id}:{graph_version}:{options}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (which may list several tags) against etag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+# Share of a graph's edges that may be added before its cached layouts and
+# clusters are recomputed
+LAYOUT_REFRESH_EDGE_FRACTION = 0.005
+
+# SERV-009: Graphs above this many nodes get no server-side layout; the
+# client FA2 Web Worker lays them out without blocking, so server
+# computation is unnecessary overhead
+SKIP_LAYOUT_THRESHOLD = 500
+
+# Caps concurrent cache warmups so a burst of discovery runs cannot tie up
+# the database pool and analytics workers
+_WARMUP_SEMAPHORE = asyncio.Semaphore(2)
+
+
+# Every per-user cache; a new cache registered here is invalidated along
+# with the others on discovery and manual invalidation
+_USER_CACHES = (_graph_cache, _layout_cache, _cluster_cache, _analytics_cache)
+
+
+async def _invalidate_user_caches(user_id: UUID) -> None:
+    """Invalidate all of a user's caches together."""
+    await asyncio.gather(*(cache.invalidate(user_id) for cache in _USER_CACHES))
+
+
+async def _warm_user_caches(user_id: UUID) -> None:
+    """
+    Reload a user's graph and recompute the default /graph layout and
+    clusters, so the first request after a discovery run hits warm caches.
+    """
+    async with _WARMUP_SEMAPHORE:
+        try:
+            # Runs after the response, when the request's session is closed
+            async with async_session() as session:
+                mapper = await _graph_cache.get_mapper(session, user_id=user_id)
+            node_count = mapper.get_graph_stats()["nodes"]
+
+            if node_count <= SKIP_LAYOUT_THRESHOLD:
+                positions = await mapper.run_offloaded("compute_layout", algorithm="spring")
+                await _layout_cache.set_positions(user_id, "spring", node_count, positions)
+
+            clusters = await mapper.run_offloaded("get_clusters_for_visualization", min_size=3)
+            await _cluster_cache.set_clusters(user_id, 3, node_count, clusters)
+        except Exception as e:
+            # Warming is best effort; the next request computes on demand
+            logger.warning(f"Cache warmup failed for user {user_id}: {e}")
+
+
+async def _invalidate_derived_caches(user_id: UUID) -> None:
+    """Invalidate a user's layout and cluster caches, keeping the loaded graph."""
+    await asyncio.gather(
+        _layout_cache.invalidate(user_id),
+        _cluster_cache.invalidate(user_id)
+    )
+
+
+def _apply_cluster_centroids(clusters: List[Dict], positions: Dict[str, tuple]) -> None:
+    """Set each cluster's position to the mean of its members' positions."""
+    # One (N, 2) array plus a row index, so each centroid is a single vectorized mean
+    node_index = {node_id: i for i, node_id in enumerate(positions)}
+    coords = np.asarray(list(positions.values()), dtype=np.float64).reshape(-1, 2)
+
+    for cluster in clusters:
+        rows = np.fromiter(
+            (node_index[m] for m in cluster["members"] if m in node_index),
+            dtype=np.intp
+        )
+        if rows.size:
+            cx, cy = coords[rows].mean(axis=0)
+            cluster["position"] = {"x": float(cx), "y": float(cy)}
+
+
 # ==================== Pydantic Models ====================
 
 class PathRequest(BaseModel):
@@ -273,6 +593,7 @@ async def get_full_graph(
     include_positions: bool = Query(True, description="Include pre-computed layout positions"),
     layout: str = Query("spring", description="Layout algorithm: spring, kamada_kawai, circular, shell"),
     include_clusters: bool = Query(False, description="Include cluster data for semantic zoom"),
+    if_none_match: Optional[str] = Header(None),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
@@ -290,6 +611,7 @@ async def get_full_graph(
     - Layout positions cached for 5 minutes
     - Cluster data cached for 10 minutes
     - Fixed double layout computation bug
+    - ETag / 304 Not Modified while the graph is unchanged
     """
     timings = {}
     total_start = time.perf_counter()
@@ -299,21 +621,40 @@ async def get_full_graph(
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
     timings["graph_load_ms"] = round((time.perf_counter() - t0) * 1000, 1)
 
-    node_count = mapper.graph.number_of_nodes()
+    stats = mapper.get_graph_stats()
+    node_count = stats["nodes"]
+
+    # The payload is determined by the graph version and the query options,
+    # so a client already holding it gets a 304 without any serialization
+    etag = _graph_etag(
+        current_user.user_id, mapper.graph_version, node_count,
+        include_isolated, include_positions, layout, include_clusters
+    )
+    # no-cache, not max-age: the browser must revalidate every time, or a
+    # fetch right after a graph change (e.g. discovery) gets the old graph
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    # SERV-009: Skip server-side layout for large graphs (>500 nodes)
+    apply_layout = include_positions and node_count <= SKIP_LAYOUT_THRESHOLD
 
     # SERV-000: Time export
+    # Without positions to merge in, the elements are the same on every request,
+    # so reuse the mapper's pre-serialized export instead of rebuilding dicts
     t0 = time.perf_counter()
-    elements = mapper.export_cytoscape(include_isolated=include_isolated)
+    if apply_layout:
+        elements = mapper.export_cytoscape(include_isolated=include_isolated)
+        elements_json = None
+    else:
+        elements = None
+        elements_json = mapper.export_cytoscape_json(include_isolated=include_isolated)
     timings["export_cytoscape_ms"] = round((time.perf_counter() - t0) * 1000, 1)
 
     # SERV-002: Layout positions with caching
-    # SERV-009: Skip server-side layout for large graphs (>500 nodes)
-    # Client FA2 Web Worker handles layout non-blocking, so server computation
-    # is unnecessary overhead for large graphs
-    SKIP_LAYOUT_THRESHOLD = 500
     positions = {}
 
-    if include_positions and node_count <= SKIP_LAYOUT_THRESHOLD:
+    if apply_layout:
         # Check layout cache first
         positions = await _layout_cache.get_positions(
             current_user.user_id, layout, node_count
@@ -321,7 +662,7 @@ async def get_full_graph(
 
         if positions is None:
             t0 = time.perf_counter()
-            positions = mapper.compute_layout(algorithm=layout)
+            positions = await mapper.run_offloaded("compute_layout", algorithm=layout)
             timings["compute_layout_ms"] = round((time.perf_counter() - t0) * 1000, 1)
             timings["layout_cache"] = "miss"
 
@@ -346,10 +687,9 @@ async def get_full_graph(
         timings["layout_skip_reason"] = f"node_count ({node_count}) > threshold ({SKIP_LAYOUT_THRESHOLD})"
         logger.info(f"Skipping server-side layout for {node_count} nodes (threshold: {SKIP_LAYOUT_THRESHOLD})")
 
-    response = {
-        "elements": elements,
-        "stats": mapper.get_graph_stats()
-    }
+    response = {"stats": stats}
+    if elements is not None:
+        response = {"elements": elements, **response}
 
     # SERV-003: Cluster data with caching
     if include_clusters:
@@ -360,7 +700,7 @@ async def get_full_graph(
 
         if clusters is None:
             t0 = time.perf_counter()
-            clusters = mapper.get_clusters_for_visualization(min_size=3)
+            clusters = await mapper.run_offloaded("get_clusters_for_visualization", min_size=3)
             timings["compute_clusters_ms"] = round((time.perf_counter() - t0) * 1000, 1)
             timings["cluster_cache"] = "miss"
 
@@ -373,14 +713,7 @@ async def get_full_graph(
 
         # SERV-001: Use already-computed positions for centroids (FIX - was computing twice!)
         if positions and clusters:
-            for cluster in clusters:
-                member_positions = [
-                    positions[m] for m in cluster["members"] if m in positions
-                ]
-                if member_positions:
-                    cx = sum(p[0] for p in member_positions) / len(member_positions)
-                    cy = sum(p[1] for p in member_positions) / len(member_positions)
-                    cluster["position"] = {"x": cx, "y": cy}
+            _apply_cluster_centroids(clusters, positions)
 
         response["clusters"] = clusters
 
@@ -392,7 +725,16 @@ async def get_full_graph(
     # Include timings in response for debugging
     response["_timings"] = timings
 
-    return response
+    if elements_json is None:
+        # Returned directly so FastAPI skips jsonable_encoder on the full graph
+        return PulseORJSONResponse(response, headers=cache_headers)
+
+    # Splice the cached elements JSON in as the first key of the encoded response
+    return Response(
+        content=b'{"elements":' + elements_json + b"," + orjson.dumps(response, default=str)[1:],
+        media_type="application/json",
+        headers=cache_headers
+    )
 
 
 @router.get("/graph/subset")
@@ -434,94 +776,60 @@ async def get_graph_subset(
             "pagination": {"limit": limit, "offset": offset, "has_more": False}
         }
 
-    # Calculate centrality for sorting
-    import networkx as nx
-    centrality_scores = {}
-
-    if sort_by == "centrality" and mapper.graph.number_of_nodes() > 0:
-        try:
-            centrality_scores = nx.degree_centrality(mapper.graph)
-        except Exception:
-            # Fallback to degree if centrality fails
-            centrality_scores = {n: d for n, d in mapper.graph.degree()}
-
-    # Collect all nodes with their data
-    nodes_data = []
-    for node_id, data in mapper.graph.nodes(data=True):
-        # Apply entity_type filter
-        if entity_type:
-            node_type = data.get("entity_type", "").lower()
-            if node_type != entity_type.lower():
-                continue
-
-        # Apply search filter (prefix match)
-        if search:
-            node_name = data.get("name", "").lower()
-            if not node_name.startswith(search.lower()):
-                continue
-
-        nodes_data.append({
-            "id": node_id,
-            "data": data,
-            "centrality": centrality_scores.get(node_id, 0),
-            "degree": mapper.graph.degree(node_id)
-        })
-
-    # Sort nodes
-    if sort_by == "centrality":
-        nodes_data.sort(key=lambda x: x["centrality"], reverse=True)
-    elif sort_by == "mentions":
-        nodes_data.sort(key=lambda x: x["degree"], reverse=True)
-    elif sort_by == "recent":
-        nodes_data.sort(
-            key=lambda x: x["data"].get("created_at", ""),
-            reverse=True
-        )
-
-    total_filtered = len(nodes_data)
-
-    # Apply pagination
-    paginated_nodes = nodes_data[offset:offset + limit]
-    node_ids = set(n["id"] for n in paginated_nodes)
+    # Page through the orderings precomputed at graph load
+    page_ids, total_filtered = mapper.get_ranked_nodes(
+        sort_by=sort_by,
+        entity_type=entity_type,
+        search=search,
+        offset=offset,
+        limit=limit
+    )
+    node_ids = set(page_ids)
+    graph_nodes = mapper.graph.nodes
+    degree = mapper.graph.degree
 
-    # Build Cytoscape elements
+    # Build Cytoscape elements; each list is built in a single comprehension
+    # straight from the page, with no intermediate per-node records
     elements = {
         "nodes": [
             {
                 "data": {
-                    "id": n["id"],
-                    "label": n["data"].get("name", "Unknown"),
-                    "type": n["data"].get("entity_type", "unknown").lower(),
-                    "size": min(40, max(15, 15 + n["degree"] * 2)),
-                    "centrality": n["centrality"],
-                    **{k: v for k, v in n["data"].items()
+                    "id": node_id,
+                    "label": data.get("name", "Unknown"),
+                    "type": data.get("entity_type", "unknown").lower(),
+                    "size": min(40, max(15, 15 + degree(node_id) * 2)),
+                    "centrality": mapper.get_degree_centrality(node_id) if sort_by == "centrality" else 0,
+                    **{k: v for k, v in data.items()
                        if k not in ("created_at", "metadata") and not isinstance(v, (dict, list))}
                 }
             }
-            for n in paginated_nodes
+            for node_id, data in ((node_id, graph_nodes[node_id]) for node_id in page_ids)
         ],
         "edges": []
     }
 
     # Add edges between the selected nodes (if requested)
+    # Only the page's own out-edges are walked, not every edge in the graph
     if include_relationships:
-        for u, v, k, d in mapper.graph.edges(keys=True, data=True):
-            if u in node_ids and v in node_ids:
-                elements["edges"].append({
-                    "data": {
-                        "id": f"{u}-{v}-{k}",
-                        "source": u,
-                        "target": v,
-                        "type": d.get("relationship_type", "associated_with"),
-                        "weight": min(5, max(1, d.get("weight", 1))),
-                        "confidence": d.get("confidence", 0.5)
-                    }
-                })
+        elements["edges"] = [
+            {
+                "data": {
+                    "id": f"{u}-{v}-{k}",
+                    "source": u,
+                    "target": v,
+                    "type": d.get("relationship_type", "associated_with"),
+                    "weight": min(5, max(1, d.get("weight", 1))),
+                    "confidence": d.get("confidence", 0.5)
+                }
+            }
+            for u, v, k, d in mapper.graph.out_edges(page_ids, keys=True, data=True)
+            if v in node_ids
+        ]
 
-    return {
+    return PulseORJSONResponse({
         "elements": elements,
         "stats": {
-            "returned": len(paginated_nodes),
+            "returned": len(page_ids),
             "total_entities": stats["nodes"],
             "total_relationships": stats["edges"],
             "filtered_entities": total_filtered
@@ -531,7 +839,7 @@ async def get_graph_subset(
             "offset": offset,
             "has_more": offset + limit < total_filtered
         }
-    }
+    })
 
 
 @router.get("/neighborhood/{entity_id}")
@@ -636,14 +944,21 @@ async def find_all_paths(
 @router.get("/centrality/degree")
 async def get_degree_centrality(
     limit: int = Query(20, ge=1, le=100),
+    refresh: bool = Query(False, description="Recompute instead of using the cached result"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Get most connected entities by degree centrality."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
+    entities = await _cached_analytics(
+        mapper, current_user.user_id, "degree_centrality",
+        lambda: mapper.get_most_connected(n=limit),
+        limit=limit, refresh=refresh
+    )
+
     return {
-        "entities": mapper.get_most_connected(n=limit),
+        "entities": entities,
         "metric": "degree_centrality"
     }
 
@@ -651,14 +966,21 @@ async def get_degree_centrality(
 @router.get("/centrality/betweenness")
 async def get_betweenness_centrality(
     limit: int = Query(20, ge=1, le=100),
+    refresh: bool = Query(False, description="Recompute instead of using the cached result"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Get entities that bridge different communities."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
+    entities = await _cached_analytics(
+        mapper, current_user.user_id, "betweenness_centrality",
+        lambda: mapper.run_offloaded("get_betweenness_centrality", n=limit),
+        limit=limit, refresh=refresh
+    )
+
     return {
-        "entities": mapper.get_betweenness_centrality(n=limit),
+        "entities": entities,
         "metric": "betweenness_centrality"
     }
 
@@ -666,14 +988,21 @@ async def get_betweenness_centrality(
 @router.get("/centrality/pagerank")
 async def get_pagerank(
     limit: int = Query(20, ge=1, le=100),
+    refresh: bool = Query(False, description="Recompute instead of using the cached result"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Get entities ranked by PageRank importance."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
+    entities = await _cached_analytics(
+        mapper, current_user.user_id, "pagerank",
+        lambda: mapper.get_pagerank(n=limit),
+        limit=limit, refresh=refresh
+    )
+
     return {
-        "entities": mapper.get_pagerank(n=limit),
+        "entities": entities,
         "metric": "pagerank"
     }
 
@@ -682,13 +1011,18 @@ async def get_pagerank(
 
 @router.get("/communities")
 async def detect_communities(
+    refresh: bool = Query(False, description="Recompute instead of using the cached result"),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Detect communities/clusters in the entity network."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
-    communities = mapper.detect_communities()
+    communities = await _cached_analytics(
+        mapper, current_user.user_id, "communities",
+        lambda: mapper.run_offloaded("detect_communities"),
+        refresh=refresh
+    )
 
     return {
         "count": len(communities),
@@ -742,10 +1076,6 @@ async def get_entity_activity_timeline(
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
 
-    # Determine date truncation based on period
-    trunc_expr = "date_trunc('day', timestamp::timestamptz)" if period == "day" else "date_trunc('week', timestamp::timestamptz)"
-    trunc_first_seen = "date_trunc('day', first_seen)" if period == "day" else "date_trunc('week', first_seen)"
-
     # Build entity type filter clause
     type_filter = ""
     if entity_type:
@@ -754,21 +1084,19 @@ async def get_entity_activity_timeline(
     query = text(f"""
         WITH mention_activity AS (
             SELECT
-                {trunc_expr} as period_date,
+                date_trunc(CAST(:trunc_unit AS TEXT), em.ts_parsed) as period_date,
                 COUNT(DISTINCT em.entity_id) as entity_count,
                 COUNT(*) as mention_count
             FROM entity_mentions em
             JOIN tracked_entities te ON te.entity_id = em.entity_id
-            WHERE em.timestamp ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}'
-            AND em.timestamp::timestamptz >= :start_date
-            AND em.timestamp::timestamptz <= :end_date
+            WHERE em.ts_parsed BETWEEN :start_date AND :end_date
             AND te.user_id = :user_id
             {type_filter}
             GROUP BY period_date
         ),
         new_entities AS (
             SELECT
-                {trunc_first_seen} as period_date,
+                date_trunc(CAST(:trunc_unit AS TEXT), first_seen) as period_date,
                 COUNT(*) as new_entities
             FROM tracked_entities te
             WHERE te.first_seen >= :start_date
@@ -788,9 +1116,12 @@ async def get_entity_activity_timeline(
         ORDER BY period_date ASC
     """)
 
+    # The truncation unit is a bind parameter so the statement text (and
+    # its prepared plan) is shared between periods
     params = {
         "start_date": start_date,
         "end_date": end_date,
+        "trunc_unit": period,
         "user_id": current_user.user_id
     }
     if entity_type:
@@ -808,13 +1139,13 @@ async def get_entity_activity_timeline(
         for row in result
     ]
 
-    return {
+    return PulseORJSONResponse({
         "period": period,
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
         "entity_type": entity_type,
         "data": data
-    }
+    })
 
 
 # ==================== Relationship Management ====================
@@ -822,12 +1153,17 @@ async def get_entity_activity_timeline(
 @router.post("/relationships")
 async def add_relationship(
     request: RelationshipRequest,
+    background_tasks: BackgroundTasks,
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Manually add a relationship between entities."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
+    for entity_id in (request.source_id, request.target_id):
+        if entity_id not in mapper.graph:
+            raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found in graph")
+
     is_new = mapper.add_relationship(
         source_id=request.source_id,
         target_id=request.target_id,
@@ -836,13 +1172,28 @@ async def add_relationship(
         properties={"description": request.description} if request.description else {}
     )
 
-    # Save to database
-    await mapper.save_to_database()
+    # Write through just this relationship; the cached mapper already holds
+    # the change, so the graph cache stays valid
+    try:
+        await mapper.save_relationship(
+            db,
+            source_id=request.source_id,
+            target_id=request.target_id,
+            relationship_type=request.relationship_type,
+            description=request.description,
+            confidence=request.confidence
+        )
+    except Exception:
+        # The in-memory edge was never persisted; reload on the next request
+        await _graph_cache.invalidate(current_user.user_id)
+        raise
 
-    # SERV-004: Invalidate ALL caches since relationships changed
-    await _graph_cache.invalidate(current_user.user_id)
-    await _layout_cache.invalidate(current_user.user_id)
-    await _cluster_cache.invalidate(current_user.user_id)
+    # A single edge barely moves layouts or clusters; recompute them only once
+    # the edges added since the last refresh pass a share of the graph
+    edge_count = max(1, mapper.graph.number_of_edges())
+    if mapper.edges_added_since_refresh > LAYOUT_REFRESH_EDGE_FRACTION * edge_count:
+        mapper.edges_added_since_refresh = 0
+        background_tasks.add_task(_invalidate_derived_caches, current_user.user_id)
 
     return {
         "created": is_new,
@@ -862,6 +1213,7 @@ async def get_relationship_types():
 @router.post("/discover")
 async def discover_relationships(
     request: DiscoveryRequest,
+    background_tasks: BackgroundTasks,
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
@@ -880,9 +1232,8 @@ async def discover_relationships(
 
     # SERV-004: Invalidate ALL caches since new relationships were discovered
     if relationships:
-        await _graph_cache.invalidate(current_user.user_id)
-        await _layout_cache.invalidate(current_user.user_id)
-        await _cluster_cache.invalidate(current_user.user_id)
+        await _invalidate_user_caches(current_user.user_id)
+        background_tasks.add_task(_warm_user_caches, current_user.user_id)
 
     return {
         "discovered": len(relationships),
@@ -890,29 +1241,57 @@ async def discover_relationships(
     }
 
 
-@router.post("/discover/full")
+async def _run_full_discovery_job(user_id: UUID, min_confidence: float) -> Dict:
+    """Body of a full-discovery job; runs outside the request on its own session."""
+    async with async_session() as session:
+        discovery = RelationshipDiscoveryService(
+            db_session=session,
+            user_id=user_id
+        )
+        results = await discovery.discover_all_relationships(
+            min_confidence=min_confidence
+        )
+
+    # SERV-004: Invalidate ALL caches since new relationships were discovered
+    if results.get("relationships_found", 0) > 0:
+        await _invalidate_user_caches(user_id)
+        await _warm_user_caches(user_id)
+
+    return results
+
+
+@router.post("/discover/full", status_code=202)
 async def run_full_discovery(
     min_confidence: float = Query(0.3, ge=0, le=1),
-    db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
-    """Run full relationship discovery across all entities."""
-    discovery = RelationshipDiscoveryService(
-        db_session=db,
-        user_id=current_user.user_id
-    )
+    """
+    Start full relationship discovery across all entities.
 
-    results = await discovery.discover_all_relationships(
-        min_confidence=min_confidence
+    Discovery can take minutes, so it runs as a background job; poll
+    /discover/jobs/{job_id} for its status and results. While a job is
+    running for the user, that job is returned instead of starting another.
+    """
+    user_id = current_user.user_id
+    job = get_discovery_job_manager().start(
+        user_id,
+        lambda: _run_full_discovery_job(user_id, min_confidence)
     )
 
-    # SERV-004: Invalidate ALL caches since new relationships were discovered
-    if results.get("relationships_found", 0) > 0:
-        await _graph_cache.invalidate(current_user.user_id)
-        await _layout_cache.invalidate(current_user.user_id)
-        await _cluster_cache.invalidate(current_user.user_id)
+    return job.to_dict()
 
-    return results
+
+@router.get("/discover/jobs/{job_id}")
+async def get_discovery_job(
+    job_id: UUID,
+    current_user: LocalUser = Depends(get_local_user)
+):
+    """Get the status of a full-discovery job, with its results once complete."""
+    job = get_discovery_job_manager().get_job(job_id, current_user.user_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Discovery job {job_id} not found")
+
+    return job.to_dict()
 
 
 @router.get("/discover/stats")
@@ -934,27 +1313,52 @@ async def get_discovery_stats(
 @router.get("/export/cytoscape")
 async def export_cytoscape_format(
     include_isolated: bool = Query(False),
+    if_none_match: Optional[str] = Header(None),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Export graph in Cytoscape.js format."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
-    return mapper.export_cytoscape(include_isolated=include_isolated)
+    etag = _graph_etag(
+        current_user.user_id, mapper.graph_version, "export/cytoscape", include_isolated
+    )
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    # The mapper's pre-serialized export; no dict rebuild or re-encoding
+    return Response(
+        content=mapper.export_cytoscape_json(include_isolated=include_isolated),
+        media_type="application/json",
+        headers=cache_headers
+    )
 
 
 @router.get("/export/json")
 async def export_json_format(
+    if_none_match: Optional[str] = Header(None),
     db=Depends(get_db),
     current_user: LocalUser = Depends(get_local_user)
 ):
     """Export graph as JSON."""
     mapper = await _graph_cache.get_mapper(db, user_id=current_user.user_id)
 
-    return {
-        "graph": mapper.export_json(),
-        "stats": mapper.get_graph_stats()
-    }
+    etag = _graph_etag(current_user.user_id, mapper.graph_version, "export/json")
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    # Encoded here rather than through jsonable_encoder, which would walk
+    # the whole graph string and stats before the response class saw them
+    return Response(
+        content=(
+            b'{"graph":' + orjson.dumps(mapper.export_json())
+            + b',"stats":' + orjson.dumps(mapper.get_graph_stats(), default=str) + b"}"
+        ),
+        media_type="application/json",
+        headers=cache_headers
+    )
 
 
 # ==================== Cache Management (SERV-008) ====================
@@ -971,9 +1375,10 @@ async def get_cache_status(
     """
     user_id = str(current_user.user_id)
 
-    graph_entries = [k for k in _graph_cache._cache if user_id in k]
-    layout_entries = [k for k in _layout_cache._cache if user_id in k]
-    cluster_entries = [k for k in _cluster_cache._cache if user_id in k]
+    # Layout and cluster entries live in Redis under versioned keys, so only
+    # the in-process graph cache can be listed
+    graph_entries = _graph_cache.keys_for_user(current_user.user_id)
+    analytics_entries = _analytics_cache.keys_for_user(current_user.user_id)
 
     return {
         "user_id": user_id,
@@ -983,14 +1388,17 @@ async def get_cache_status(
             "keys": graph_entries
         },
         "layout_cache": {
-            "entries": len(layout_entries),
-            "ttl_seconds": 300,
-            "keys": layout_entries
+            "backend": "redis",
+            "ttl_seconds": _layout_cache.ttl_seconds
         },
         "cluster_cache": {
-            "entries": len(cluster_entries),
-            "ttl_seconds": 600,
-            "keys": cluster_entries
+            "backend": "redis",
+            "ttl_seconds": _cluster_cache.ttl_seconds
+        },
+        "analytics_cache": {
+            "entries": len(analytics_entries),
+            "ttl_seconds": _analytics_cache.ttl_seconds,
+            "keys": analytics_entries
         }
     }
 
@@ -1005,9 +1413,7 @@ async def invalidate_caches(
     Forces next graph request to recompute everything fresh.
     Useful after bulk entity updates or for debugging.
     """
-    await _graph_cache.invalidate(current_user.user_id)
-    await _layout_cache.invalidate(current_user.user_id)
-    await _cluster_cache.invalidate(current_user.user_id)
+    await _invalidate_user_caches(current_user.user_id)
 
     return {
         "status": "invalidated",
@@ -0,0 +1,113 @@
+"""
+Short-TTL Redis response cache for read-heavy API endpoints.
+
+Entries are grouped into namespaces. Each namespace carries a version
+counter that is part of every key, so invalidating a namespace is a single
+INCR instead of a key scan; stale entries simply age out via their TTL.
+
+All helpers are coroutines on the shared redis.asyncio client, so cache
+traffic never blocks the event loop. Redis failures never break a request:
+reads fall through to the database and writes are skipped, with a warning
+logged.
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_PREFIX = "pulse:cache:"
+
+# Namespaces shared between the API layer and the services that invalidate them
+COLLECTION_ITEMS_NAMESPACE = "collection:items"
+COLLECTION_STATS_NAMESPACE = "collection:stats"
+ENTITIES_NAMESPACE = "entities"
+ENTITIES_DIAGNOSTIC_NAMESPACE = "entities:diagnostic"
+LOCAL_GOVERNMENT_NAMESPACE = "local"
+NETWORK_LAYOUT_NAMESPACE = "network:layout"
+NETWORK_CLUSTERS_NAMESPACE = "network:clusters"
+
+
+def user_namespace(namespace: str, user_id: Any) -> str:
+    """Scope a namespace to one user so their writes only invalidate their entries."""
+    return f"{namespace}:{user_id}"
+
+
+def _json_default(value: Any) -> str:
+    # Match the API encoders: ISO 8601 for dates/datetimes, str() otherwise
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _get_client():
+    # Imported lazily to avoid pulling the service graph in at import time
+    from .dependencies import get_async_redis_client
+    return get_async_redis_client()
+
+
+# The data key embeds the namespace version, so reading it naively takes two
+# round trips (version, then data). These scripts resolve the version and
+# touch the data key server-side in one call.
+# KEYS[1] = version key; ARGV[1] = data key prefix; ARGV[2] = data key suffix
+_GET_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+return redis.call('GET', ARGV[1] .. version .. ARGV[2])
+"""
+# ARGV[3] = TTL seconds; ARGV[4] = payload
+_SET_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+return redis.call('SETEX', ARGV[1] .. version .. ARGV[2], ARGV[3], ARGV[4])
+"""
+
+
+def _version_key(namespace: str) -> str:
+    return f"{CACHE_PREFIX}{namespace}:version"
+
+
+def _params_digest(params: dict) -> str:
+    return hashlib.md5(
+        json.dumps(params, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+async def cache_get(namespace: str, params: dict) -> Optional[Any]:
+    """Return the cached payload for params, or None on miss/error."""
+    try:
+        client = _get_client()
+        cached = await client.eval(
+            _GET_SCRIPT, 1, _version_key(namespace),
+            f"{CACHE_PREFIX}{namespace}:v", f":{_params_digest(params)}"
+        )
+        if cached is not None:
+            return json.loads(cached)
+    except Exception as e:
+        logger.warning(f"Response cache read error ({namespace}): {e}")
+    return None
+
+
+async def cache_set(namespace: str, params: dict, payload: Any, ttl_seconds: int) -> None:
+    """Store a JSON-serializable payload for params with a TTL."""
+    try:
+        client = _get_client()
+        await client.eval(
+            _SET_SCRIPT, 1, _version_key(namespace),
+            f"{CACHE_PREFIX}{namespace}:v", f":{_params_digest(params)}",
+            ttl_seconds, json.dumps(payload, default=_json_default)
+        )
+    except Exception as e:
+        logger.warning(f"Response cache write error ({namespace}): {e}")
+
+
+async def cache_clear(*namespaces: str) -> None:
+    """Invalidate every entry in the given namespaces."""
+    try:
+        client = _get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for namespace in namespaces:
+                pipe.incr(_version_key(namespace))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Response cache clear error ({', '.join(namespaces)}): {e}")
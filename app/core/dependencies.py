@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import redis
+import redis.asyncio as aioredis
 from contextlib import asynccontextmanager
 import uuid
 
@@ -26,6 +27,7 @@ from .logging import init_logging, get_logger
 
 # Global singletons for shared resources
 _redis_client: Optional[redis.Redis] = None
+_async_redis_client: Optional[aioredis.Redis] = None
 _wikidata_linker: Optional[WikiDataLinker] = None
 
 # Local user configuration for auth-free dashboard operation
@@ -229,12 +231,21 @@ async def lifespan(app: FastAPI):
     try:
         from ..services.collectors.scheduler import get_scheduler
         scheduler = get_scheduler()
+        await scheduler.stop_manual_workers()
         if scheduler.is_running:
             await scheduler.stop()
             logger.info("Collection scheduler stopped")
     except Exception as e:
         logger.warning(f"Error stopping collection scheduler: {e}")
 
+    from ..services.network_mapper.analytics_pool import shutdown_pool
+    shutdown_pool()
+
+    global _async_redis_client
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose()
+        _async_redis_client = None
+
 # Add service initialization functions
 def init_services():
     """Initialize all services"""
@@ -283,6 +294,23 @@ def get_redis_client() -> redis.Redis:
     return _redis_client
 
 
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    Get the shared asyncio Redis client, for use from async code.
+    Creates one on first call and reuses it for all subsequent calls.
+    """
+    global _async_redis_client
+    if _async_redis_client is None:
+        _async_redis_client = aioredis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            decode_responses=True  # Return strings instead of bytes
+        )
+        logger.info(f"Async Redis client initialized: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+    return _async_redis_client
+
+
 def get_wikidata_linker() -> WikiDataLinker:
     """
     Get the shared WikiDataLinker instance with Redis caching.
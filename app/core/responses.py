@@ -0,0 +1,24 @@
+"""
+Shared response classes for the API routers.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class PulseORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that falls back to str() for unknown types.
+
+    asyncpg returns its own UUID subclass, which orjson does not recognise
+    as uuid.UUID; this lets raw database rows be returned without
+    converting every id by hand.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -7,7 +7,7 @@ Includes:
 - EntityRelationship: Relationships between entities (supports, opposes, etc.)
 """
 from typing import Dict, Optional, List
-from sqlalchemy import Column, String, Integer, Float, JSON, ForeignKey, UniqueConstraint, Index, CheckConstraint, DateTime
+from sqlalchemy import Column, String, Integer, Float, JSON, ForeignKey, UniqueConstraint, Index, CheckConstraint, DateTime, Computed, DDL, event, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone, date
@@ -27,6 +27,8 @@ class TrackedEntity(Base):
         entity_metadata (JSON): Additional metadata about the entity
         first_seen (DateTime): When entity first appeared in content (VIZ-005)
         last_seen (DateTime): When entity most recently appeared in content (VIZ-005)
+        mention_count (int): Number of entity_mentions rows, maintained by a
+            trigger on entity_mentions (MENTION_COUNT_TRIGGER below)
     """
     __tablename__ = "tracked_entities"
 
@@ -42,13 +44,33 @@ class TrackedEntity(Base):
     first_seen = Column(DateTime(timezone=True), nullable=True, index=True)
     last_seen = Column(DateTime(timezone=True), nullable=True, index=True)
 
+    # Denormalized count of entity_mentions; written only by the DB trigger
+    mention_count = Column(Integer, nullable=False, default=0, server_default='0')
+
     __table_args__ = (
+        # Also serves as the (user_id, name_lower) index for by-name lookups
         UniqueConstraint('user_id', 'name_lower', name='uq_user_entity_name'),
         Index('ix_tracked_entities_name_lower_trgm', 'name_lower', postgresql_using='gist', postgresql_ops={'name_lower': 'gist_trgm_ops'}),
+        # GIN trigram index for the LIKE '%q%' substring search
+        Index('ix_tracked_entities_name_lower_gin', 'name_lower', postgresql_using='gin', postgresql_ops={'name_lower': 'gin_trgm_ops'}),
         # B-tree index for exact matches (faster than trigram for exact lookups)
         Index('ix_tracked_entities_name_lower_btree', 'name_lower'),
         # Index for user filtering
         Index('ix_tracked_entities_user_id', 'user_id'),
+        # User + case-insensitive type filter used by search and listing
+        Index('ix_tracked_entities_user_type_lower', 'user_id', func.lower(entity_type)),
+        # Ordered scans for the name / recent sorts of the entity list
+        Index('ix_tracked_entities_user_created', 'user_id', created_at.desc()),
+        Index('ix_tracked_entities_user_name', 'user_id', 'name'),
+        Index('ix_tracked_entities_user_mention_count', 'user_id', mention_count.desc()),
+        # Type-filtered entity list in its default mentions order
+        Index('ix_tracked_entities_user_type_mentions', 'user_id', func.lower(entity_type), mention_count.desc()),
+        # Partial expression index for the WikiData duplicate grouping
+        Index(
+            'ix_tracked_entities_user_wikidata',
+            'user_id', text("(entity_metadata->>'wikidata_id')"),
+            postgresql_where=text("entity_metadata->>'wikidata_id' IS NOT NULL"),
+        ),
     )
     
     def __repr__(self):
@@ -67,6 +89,57 @@ class TrackedEntity(Base):
             "last_seen": self.last_seen.isoformat() if self.last_seen else None
         }
 
+# Keeps TrackedEntity.mention_count current as mentions are inserted, deleted,
+# or re-pointed to another entity (as on merge)
+MENTION_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION tracked_entities_mention_count()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.entity_id IS NOT DISTINCT FROM OLD.entity_id THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE tracked_entities SET mention_count = mention_count + 1
+        WHERE entity_id = NEW.entity_id;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE tracked_entities SET mention_count = mention_count - 1
+        WHERE entity_id = OLD.entity_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+MENTION_COUNT_TRIGGER = """
+CREATE TRIGGER trg_entity_mentions_count
+AFTER INSERT OR DELETE OR UPDATE OF entity_id ON entity_mentions
+FOR EACH ROW EXECUTE FUNCTION tracked_entities_mention_count();
+"""
+
+# Parses EntityMention.timestamp for the ts_parsed generated column. A plain
+# ::timestamptz cast depends on the session TimeZone, so Postgres will not
+# accept it in a generated column; pinning UTC (the zone the timestamps are
+# written in) makes it immutable, and unparseable values become NULL instead
+# of failing the insert.
+PARSE_MENTION_TIMESTAMP_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION pulse_parse_mention_timestamp(value text)
+RETURNS timestamptz
+LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE
+SET timezone = 'UTC'
+AS $$
+BEGIN
+    IF value ~ '^\d{4}-\d{2}-\d{2}' THEN
+        RETURN value::timestamptz;
+    END IF;
+    RETURN NULL;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$;
+"""
+
+
 class EntityMention(Base):
     """
     Model for storing entity mentions in documents, news articles, and news items.
@@ -81,6 +154,7 @@ class EntityMention(Base):
         chunk_id (str): ID of the document chunk containing the mention
         context (str): Surrounding text context of the mention
         timestamp (str): ISO format timestamp of when the mention was found
+        ts_parsed (datetime): timestamp parsed to timestamptz (generated, NULL if unparseable)
     """
     __tablename__ = "entity_mentions"
 
@@ -93,6 +167,10 @@ class EntityMention(Base):
     chunk_id = Column(String, nullable=False)
     context = Column(String, nullable=False)
     timestamp = Column(String, nullable=False, default=lambda: datetime.utcnow().isoformat())
+    ts_parsed = Column(
+        DateTime(timezone=True),
+        Computed("pulse_parse_mention_timestamp(timestamp)", persisted=True)
+    )
 
     __table_args__ = (
         # Ensure exactly one of document_id, news_article_id, or news_item_id is set
@@ -110,6 +188,9 @@ class EntityMention(Base):
         Index('ix_entity_mentions_timestamp', 'timestamp'),
         # Composite index for entity + timestamp queries
         Index('ix_entity_mentions_entity_timestamp', 'entity_id', 'timestamp'),
+        # Range scans on the parsed timestamp for the network activity timeline
+        Index('ix_entity_mentions_ts_parsed', 'ts_parsed'),
+        Index('ix_entity_mentions_entity_ts_parsed', 'entity_id', 'ts_parsed'),
     )
     
     def __repr__(self):
@@ -137,6 +218,27 @@ class EntityMention(Base):
         }
 
 
+# The generated column needs its parse function to exist before create_all
+event.listen(
+    EntityMention.__table__,
+    "before_create",
+    DDL(PARSE_MENTION_TIMESTAMP_FUNCTION).execute_if(dialect="postgresql")
+)
+
+# create_all makes the mention_count column but not the trigger that fills
+# it; add the trigger whenever entity_mentions is created
+event.listen(
+    EntityMention.__table__,
+    "after_create",
+    DDL(MENTION_COUNT_FUNCTION).execute_if(dialect="postgresql")
+)
+event.listen(
+    EntityMention.__table__,
+    "after_create",
+    DDL(MENTION_COUNT_TRIGGER).execute_if(dialect="postgresql")
+)
+
+
 # Relationship types for EntityRelationship
 RELATIONSHIP_TYPES = [
     "supports",           # Entity A supports Entity B
@@ -17,7 +17,7 @@ from sqlalchemy import (
     Column, String, Integer, Float, DateTime, Text, JSON, Date,
     ForeignKey, Boolean, Index
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -61,6 +61,9 @@ class CouncilMeeting(Base):
 
     __table_args__ = (
         Index('ix_council_jurisdiction_date', 'jurisdiction', 'meeting_date'),
+        # /local/meetings: filter by jurisdiction, newest first with the id
+        # tiebreak, so keyset pages need no sort step
+        Index('ix_council_jurisdiction_meeting', 'jurisdiction', meeting_date.desc(), id.desc()),
     )
 
 
@@ -120,6 +123,8 @@ class ZoningCase(Base):
     __table_args__ = (
         Index('ix_zoning_jurisdiction_status', 'jurisdiction', 'status'),
         Index('ix_zoning_location', 'latitude', 'longitude'),
+        # /local/zoning: filter by jurisdiction, newest filings first
+        Index('ix_zoning_jurisdiction_filed', 'jurisdiction', filed_date.desc(), id.desc()),
     )
 
 
@@ -180,6 +185,11 @@ class BuildingPermit(Base):
     __table_args__ = (
         Index('ix_permit_jurisdiction_status', 'jurisdiction', 'status'),
         Index('ix_permit_location', 'latitude', 'longitude'),
+        # /local/permits: filter by jurisdiction and type, newest first
+        Index(
+            'ix_permit_jurisdiction_type_applied',
+            'jurisdiction', 'permit_type', applied_date.desc(), id.desc()
+        ),
     )
 
 
@@ -240,6 +250,8 @@ class PropertyTransaction(Base):
     __table_args__ = (
         Index('ix_property_jurisdiction_date', 'jurisdiction', 'sale_date'),
         Index('ix_property_location', 'latitude', 'longitude'),
+        # /local/property: filter by jurisdiction, newest sales first
+        Index('ix_property_jurisdiction_sale', 'jurisdiction', sale_date.desc(), id.desc()),
     )
 
 
@@ -301,6 +313,8 @@ class LocalCourtCase(Base):
     __table_args__ = (
         Index('ix_court_court_status', 'court', 'status'),
         Index('ix_court_type_filed', 'case_type', 'filed_date'),
+        # /local/court: filter by court and case type, newest first
+        Index('ix_court_court_type_filed', 'court', 'case_type', filed_date.desc(), id.desc()),
     )
 
 
@@ -334,6 +348,13 @@ class WatchArea(Base):
     last_triggered = Column(DateTime)
     trigger_count = Column(Integer, default=0)
 
+    # API representation, written by GeofenceService on create and trigger
+    cached_json = Column(JSONB)
+
+    __table_args__ = (
+        Index('ix_watch_areas_user_active', 'user_id', 'is_active'),
+    )
+
 
 class LocalGovernmentAlert(Base):
     """Alerts generated from local government activity."""
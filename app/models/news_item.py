@@ -86,7 +86,14 @@ class NewsItem(Base):
     # Indexes for common queries
     __table_args__ = (
         Index('ix_news_items_source_collected', 'source_type', 'collected_at'),
-        Index('ix_news_items_categories', 'categories', postgresql_using='gin'),
+        Index('ix_news_items_collected_id', 'collected_at', 'id'),
+        # jsonb_path_ops only supports @>, which is the only operator used on
+        # categories, and yields a smaller, faster index than jsonb_ops
+        Index(
+            'ix_news_items_categories_path_ops', 'categories',
+            postgresql_using='gin',
+            postgresql_ops={'categories': 'jsonb_path_ops'},
+        ),
     )
 
     def __repr__(self):
@@ -95,7 +102,12 @@ class NewsItem(Base):
     @property
     def item_id(self) -> str:
         """Generate deterministic ID for this item (matches SITREP pattern)."""
-        content = f"{self.title}:{self.source_type}:{self.url}"
+        return self.compute_item_id(self.title, self.source_type, self.url)
+
+    @staticmethod
+    def compute_item_id(title: str, source_type: str, url: str) -> str:
+        """Compute the deterministic item ID from its identifying fields."""
+        content = f"{title}:{source_type}:{url}"
         return hashlib.md5(content.encode()).hexdigest()
 
     @classmethod
@@ -195,6 +207,11 @@ class CollectionRun(Base):
     error_message = Column(Text)
     run_metadata = Column(JSONB, default=dict)
 
+    # Keyset pagination index for /collection/runs
+    __table_args__ = (
+        Index('ix_collection_runs_started_id', 'started_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<CollectionRun(collector={self.collector_type!r}, status={self.status!r})>"
 
@@ -0,0 +1,82 @@
+"""
+Migration script for collection API query performance indexes.
+
+- ix_news_items_collected_id: keyset pagination for /collection/items
+- ix_collection_runs_started_id: keyset pagination for /collection/runs
+- ix_news_items_categories_path_ops: jsonb_path_ops GIN index for the
+  categories @> filter; replaces the larger jsonb_ops GIN indexes
+
+Run with:
+    python -m app.scripts.add_collection_indexes
+    OR
+    python app/scripts/add_collection_indexes.py
+
+Idempotent - safe to run multiple times.
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path for direct execution
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from app.database import engine as async_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def apply_migration():
+    """Create the collection API indexes if they do not exist."""
+    logger.info("Adding collection API indexes...")
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_news_items_collected_id
+            ON news_items (collected_at DESC, id DESC);
+        """))
+        logger.info("  - Created ix_news_items_collected_id")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_collection_runs_started_id
+            ON collection_runs (started_at DESC, id DESC);
+        """))
+        logger.info("  - Created ix_collection_runs_started_id")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_news_items_categories_path_ops
+            ON news_items USING GIN (categories jsonb_path_ops);
+        """))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_news_items_categories;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_news_items_categories_gin;"))
+        logger.info("  - Replaced categories GIN index with jsonb_path_ops")
+
+    logger.info("Collection API indexes complete")
+
+
+async def rollback_migration():
+    """Drop the collection API indexes."""
+    async with async_engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_news_items_collected_id;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_collection_runs_started_id;"))
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_news_items_categories
+            ON news_items USING GIN (categories);
+        """))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_news_items_categories_path_ops;"))
+    logger.warning("Collection API indexes dropped")
+
+
+async def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--rollback':
+        await rollback_migration()
+    else:
+        await apply_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
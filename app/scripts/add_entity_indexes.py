@@ -0,0 +1,96 @@
+"""
+Migration script for entity API query performance indexes.
+
+- ix_tracked_entities_name_lower_gin: pg_trgm GIN index for the
+  name_lower LIKE '%q%' substring search in /entities/search
+- ix_tracked_entities_user_type_lower: user + lower(entity_type) filter
+- ix_tracked_entities_user_created / ix_tracked_entities_user_name:
+  ordered scans for the recent / name sorts of GET /entities
+- ix_tracked_entities_user_wikidata: partial expression index on
+  (user_id, entity_metadata->>'wikidata_id') for /entities/duplicates
+
+Run with:
+    python -m app.scripts.add_entity_indexes
+    OR
+    python app/scripts/add_entity_indexes.py
+
+Idempotent - safe to run multiple times.
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path for direct execution
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from app.database import engine as async_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def apply_migration():
+    """Create the entity API indexes if they do not exist."""
+    logger.info("Adding entity API indexes...")
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_name_lower_gin
+            ON tracked_entities USING GIN (name_lower gin_trgm_ops);
+        """))
+        logger.info("  - Created ix_tracked_entities_name_lower_gin")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_user_type_lower
+            ON tracked_entities (user_id, lower(entity_type));
+        """))
+        logger.info("  - Created ix_tracked_entities_user_type_lower")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_user_created
+            ON tracked_entities (user_id, created_at DESC);
+        """))
+        logger.info("  - Created ix_tracked_entities_user_created")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_user_name
+            ON tracked_entities (user_id, name);
+        """))
+        logger.info("  - Created ix_tracked_entities_user_name")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_user_wikidata
+            ON tracked_entities (user_id, (entity_metadata->>'wikidata_id'))
+            WHERE entity_metadata->>'wikidata_id' IS NOT NULL;
+        """))
+        logger.info("  - Created ix_tracked_entities_user_wikidata")
+
+    logger.info("Entity API indexes complete")
+
+
+async def rollback_migration():
+    """Drop the entity API indexes."""
+    async with async_engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_name_lower_gin;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_user_type_lower;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_user_created;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_user_name;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_user_wikidata;"))
+    logger.warning("Entity API indexes dropped")
+
+
+async def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--rollback':
+        await rollback_migration()
+    else:
+        await apply_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
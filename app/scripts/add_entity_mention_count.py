@@ -0,0 +1,104 @@
+"""
+Migration script to denormalize mention counts onto tracked_entities.
+
+Adds tracked_entities.mention_count, keeps it current with a trigger on
+entity_mentions (insert, delete, and entity_id re-pointing on merge), and
+indexes (user_id, mention_count DESC) so GET /entities can sort by
+mentions without aggregating the mentions table. A second index adds
+lower(entity_type) between the two for the type-filtered list.
+
+Run with:
+    python -m app.scripts.add_entity_mention_count
+    OR
+    python app/scripts/add_entity_mention_count.py
+
+Idempotent - safe to run multiple times.
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path for direct execution
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from app.database import engine as async_engine
+from app.models.entities import MENTION_COUNT_FUNCTION, MENTION_COUNT_TRIGGER
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def apply_migration():
+    """Add the mention_count column, trigger, and index."""
+    logger.info("Adding tracked_entities.mention_count...")
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text("""
+            ALTER TABLE tracked_entities
+            ADD COLUMN IF NOT EXISTS mention_count INTEGER NOT NULL DEFAULT 0;
+        """))
+        logger.info("  - Added mention_count column")
+
+        await conn.execute(text(MENTION_COUNT_FUNCTION))
+        await conn.execute(text(
+            "DROP TRIGGER IF EXISTS trg_entity_mentions_count ON entity_mentions;"
+        ))
+        await conn.execute(text(MENTION_COUNT_TRIGGER))
+        logger.info("  - Created trg_entity_mentions_count trigger")
+
+        # Backfill after the trigger exists so no concurrent insert is missed
+        result = await conn.execute(text("""
+            UPDATE tracked_entities te
+            SET mention_count = counts.n
+            FROM (
+                SELECT te2.entity_id, COUNT(em.mention_id) AS n
+                FROM tracked_entities te2
+                LEFT JOIN entity_mentions em ON em.entity_id = te2.entity_id
+                GROUP BY te2.entity_id
+            ) counts
+            WHERE te.entity_id = counts.entity_id
+              AND te.mention_count <> counts.n;
+        """))
+        logger.info(f"  - Backfilled mention_count for {result.rowcount} entities")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_user_mention_count
+            ON tracked_entities (user_id, mention_count DESC);
+        """))
+        logger.info("  - Created ix_tracked_entities_user_mention_count")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tracked_entities_user_type_mentions
+            ON tracked_entities (user_id, lower(entity_type), mention_count DESC);
+        """))
+        logger.info("  - Created ix_tracked_entities_user_type_mentions")
+
+    logger.info("mention_count migration complete")
+
+
+async def rollback_migration():
+    """Drop the mention_count trigger, index, and column."""
+    async with async_engine.begin() as conn:
+        await conn.execute(text(
+            "DROP TRIGGER IF EXISTS trg_entity_mentions_count ON entity_mentions;"
+        ))
+        await conn.execute(text("DROP FUNCTION IF EXISTS tracked_entities_mention_count();"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_user_mention_count;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_tracked_entities_user_type_mentions;"))
+        await conn.execute(text("ALTER TABLE tracked_entities DROP COLUMN IF EXISTS mention_count;"))
+    logger.warning("mention_count column dropped")
+
+
+async def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--rollback':
+        await rollback_migration()
+    else:
+        await apply_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
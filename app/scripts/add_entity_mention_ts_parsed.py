@@ -0,0 +1,87 @@
+"""
+Migration script for the entity_mentions.ts_parsed generated column.
+
+- pulse_parse_mention_timestamp(text): immutable UTC parse of the
+  ISO 8601 timestamp strings, NULL for anything unparseable
+- entity_mentions.ts_parsed: stored generated timestamptz column, so the
+  /network/timeline query no longer regex-checks and casts every row
+- ix_entity_mentions_ts_parsed / ix_entity_mentions_entity_ts_parsed:
+  range scans on the parsed timestamp, alone and per entity
+
+Adding a stored generated column rewrites entity_mentions; run it in a
+quiet period on large databases.
+
+Run with:
+    python -m app.scripts.add_entity_mention_ts_parsed
+    OR
+    python app/scripts/add_entity_mention_ts_parsed.py
+
+Idempotent - safe to run multiple times.
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path for direct execution
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from app.database import engine as async_engine
+from app.models.entities import PARSE_MENTION_TIMESTAMP_FUNCTION
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def apply_migration():
+    """Add the ts_parsed column and its indexes if they do not exist."""
+    logger.info("Adding entity_mentions.ts_parsed...")
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text(PARSE_MENTION_TIMESTAMP_FUNCTION))
+        logger.info("  - Created pulse_parse_mention_timestamp()")
+
+        await conn.execute(text("""
+            ALTER TABLE entity_mentions
+            ADD COLUMN IF NOT EXISTS ts_parsed timestamptz
+            GENERATED ALWAYS AS (pulse_parse_mention_timestamp(timestamp)) STORED;
+        """))
+        logger.info("  - Added entity_mentions.ts_parsed")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_entity_mentions_ts_parsed
+            ON entity_mentions (ts_parsed);
+        """))
+        logger.info("  - Created ix_entity_mentions_ts_parsed")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_entity_mentions_entity_ts_parsed
+            ON entity_mentions (entity_id, ts_parsed);
+        """))
+        logger.info("  - Created ix_entity_mentions_entity_ts_parsed")
+
+    logger.info("entity_mentions.ts_parsed complete")
+
+
+async def rollback_migration():
+    """Drop the ts_parsed column, its indexes and the parse function."""
+    async with async_engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_entity_mentions_entity_ts_parsed;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_entity_mentions_ts_parsed;"))
+        await conn.execute(text("ALTER TABLE entity_mentions DROP COLUMN IF EXISTS ts_parsed;"))
+        await conn.execute(text("DROP FUNCTION IF EXISTS pulse_parse_mention_timestamp(text);"))
+    logger.warning("entity_mentions.ts_parsed dropped")
+
+
+async def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--rollback':
+        await rollback_migration()
+    else:
+        await apply_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+Migration script for local government API query performance indexes.
+
+- ix_watch_areas_user_active: per-user active watch area lookup used by
+  the SQL-side /local/check-location radius check
+- ix_council_jurisdiction_meeting, ix_zoning_jurisdiction_filed,
+  ix_permit_jurisdiction_type_applied, ix_property_jurisdiction_sale,
+  ix_court_court_type_filed: filter + newest-first order (with the id
+  tiebreak) of the /local record listings, so a page is an index range
+  scan instead of a sort
+
+Run with:
+    python -m app.scripts.add_local_government_indexes
+    OR
+    python app/scripts/add_local_government_indexes.py
+
+Idempotent - safe to run multiple times.
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path for direct execution
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from app.database import engine as async_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def apply_migration():
+    """Create the local government API indexes if they do not exist."""
+    logger.info("Adding local government API indexes...")
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_watch_areas_user_active
+            ON watch_areas (user_id, is_active);
+        """))
+        logger.info("  - Created ix_watch_areas_user_active")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_council_jurisdiction_meeting
+            ON council_meetings (jurisdiction, meeting_date DESC, id DESC);
+        """))
+        logger.info("  - Created ix_council_jurisdiction_meeting")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_zoning_jurisdiction_filed
+            ON zoning_cases (jurisdiction, filed_date DESC, id DESC);
+        """))
+        logger.info("  - Created ix_zoning_jurisdiction_filed")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_permit_jurisdiction_type_applied
+            ON building_permits (jurisdiction, permit_type, applied_date DESC, id DESC);
+        """))
+        logger.info("  - Created ix_permit_jurisdiction_type_applied")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_property_jurisdiction_sale
+            ON property_transactions (jurisdiction, sale_date DESC, id DESC);
+        """))
+        logger.info("  - Created ix_property_jurisdiction_sale")
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_court_court_type_filed
+            ON local_court_cases (court, case_type, filed_date DESC, id DESC);
+        """))
+        logger.info("  - Created ix_court_court_type_filed")
+
+    logger.info("Local government API indexes complete")
+
+
+async def rollback_migration():
+    """Drop the local government API indexes."""
+    async with async_engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_watch_areas_user_active;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_council_jurisdiction_meeting;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_zoning_jurisdiction_filed;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_permit_jurisdiction_type_applied;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_property_jurisdiction_sale;"))
+        await conn.execute(text("DROP INDEX IF EXISTS ix_court_court_type_filed;"))
+    logger.warning("Local government API indexes dropped")
+
+
+async def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--rollback':
+        await rollback_migration()
+    else:
+        await apply_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Migration script to precompute the watch area API payload.
+
+Adds watch_areas.cached_json, the JSON object GET /local/watch-areas
+returns for each area, and backfills it for existing rows.
+GeofenceService keeps it current when an area is created or triggered.
+
+Run with:
+    python -m app.scripts.add_watch_area_cached_json
+    OR
+    python app/scripts/add_watch_area_cached_json.py
+
+Idempotent - safe to run multiple times.
+"""
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path for direct execution
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+from app.database import engine as async_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def apply_migration():
+    """Add and backfill the cached_json column."""
+    logger.info("Adding watch_areas.cached_json...")
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text("""
+            ALTER TABLE watch_areas
+            ADD COLUMN IF NOT EXISTS cached_json JSONB;
+        """))
+        logger.info("  - Added cached_json column")
+
+        result = await conn.execute(text("""
+            UPDATE watch_areas
+            SET cached_json = jsonb_build_object(
+                'id', id::text,
+                'name', name,
+                'description', description,
+                'latitude', latitude,
+                'longitude', longitude,
+                'radius_miles', radius_miles,
+                'alert_types', alert_types::jsonb,
+                'is_active', is_active,
+                'trigger_count', trigger_count,
+                'last_triggered', to_char(last_triggered, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+            )
+            WHERE cached_json IS NULL;
+        """))
+        logger.info(f"  - Backfilled {result.rowcount} watch areas")
+
+    logger.info("watch_areas.cached_json complete")
+
+
+async def rollback_migration():
+    """Drop the cached_json column."""
+    async with async_engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE watch_areas DROP COLUMN IF EXISTS cached_json;"))
+    logger.warning("watch_areas.cached_json dropped")
+
+
+async def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--rollback':
+        await rollback_migration()
+    else:
+        await apply_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
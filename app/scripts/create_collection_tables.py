@@ -108,8 +108,8 @@ async def apply_migration(engine):
 
         # Create GIN index for news_items categories if not exists
         await conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS ix_news_items_categories_gin
-            ON news_items USING GIN(categories);
+            CREATE INDEX IF NOT EXISTS ix_news_items_categories_path_ops
+            ON news_items USING GIN(categories jsonb_path_ops);
         """))
         logger.info("Checked GIN index on news_items.categories")
 
@@ -249,7 +249,7 @@ class BaseCollector(ABC):
         Returns:
             Tuple of (new_items_list, duplicate_count)
         """
-        from sqlalchemy import select
+        from sqlalchemy import select, or_
 
         new_items = []
         duplicates = 0
@@ -258,54 +258,65 @@ class BaseCollector(ABC):
             f"[INDEX] [{self.name}] Processing {len(items)} items for indexing"
         )
 
+        news_items = []
         for idx, item in enumerate(items):
             try:
-                # Check for duplicate by URL or content hash
-                news_item = item.to_news_item()
-
-                # Check by URL first (faster)
-                stmt = select(NewsItem).where(NewsItem.url == news_item.url)
-                result = await db_session.execute(stmt)
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    duplicates += 1
-                    self._logger.debug(
-                        f"[INDEX] [{self.name}] DUPLICATE (url): {item.url[:80]}"
-                    )
-                    continue
-
-                # Check by content hash
-                if news_item.content_hash:
-                    stmt = select(NewsItem).where(
-                        NewsItem.content_hash == news_item.content_hash
-                    )
-                    result = await db_session.execute(stmt)
-                    existing = result.scalar_one_or_none()
-
-                    if existing:
-                        duplicates += 1
-                        self._logger.debug(
-                            f"[INDEX] [{self.name}] DUPLICATE (hash): {item.url[:80]}"
-                        )
-                        continue
-
-                # New item - add to database
-                db_session.add(news_item)
-                new_items.append(news_item)
-
-                self._logger.info(
-                    f"[INDEX] [{self.name}] NEW item queued: "
-                    f"source={item.source_name}, title=\"{item.title[:60]}...\", "
-                    f"url={item.url[:80]}"
-                )
-
+                news_items.append((item, item.to_news_item()))
             except Exception as e:
                 self._logger.warning(
                     f"[INDEX] [{self.name}] Failed to process item {idx}: {e}, url={item.url[:80] if item.url else 'N/A'}"
                 )
+
+        # Look up existing URLs and content hashes for the whole batch in one
+        # query instead of two SELECTs per item
+        urls = {n.url for _, n in news_items if n.url}
+        hashes = {n.content_hash for _, n in news_items if n.content_hash}
+        seen_urls = set()
+        seen_hashes = set()
+        if urls or hashes:
+            conditions = []
+            if urls:
+                conditions.append(NewsItem.url.in_(urls))
+            if hashes:
+                conditions.append(NewsItem.content_hash.in_(hashes))
+            result = await db_session.execute(
+                select(NewsItem.url, NewsItem.content_hash).where(or_(*conditions))
+            )
+            for url, content_hash in result:
+                seen_urls.add(url)
+                seen_hashes.add(content_hash)
+
+        for item, news_item in news_items:
+            # Check by URL first, then by content hash; the seen sets also
+            # catch duplicates within this batch
+            if news_item.url in seen_urls:
+                duplicates += 1
+                self._logger.debug(
+                    f"[INDEX] [{self.name}] DUPLICATE (url): {item.url[:80]}"
+                )
+                continue
+
+            if news_item.content_hash and news_item.content_hash in seen_hashes:
+                duplicates += 1
+                self._logger.debug(
+                    f"[INDEX] [{self.name}] DUPLICATE (hash): {item.url[:80]}"
+                )
                 continue
 
+            seen_urls.add(news_item.url)
+            if news_item.content_hash:
+                seen_hashes.add(news_item.content_hash)
+            new_items.append(news_item)
+
+            self._logger.info(
+                f"[INDEX] [{self.name}] NEW item queued: "
+                f"source={item.source_name}, title=\"{item.title[:60]}...\", "
+                f"url={item.url[:80]}"
+            )
+
+        # New items go to the database as one batched flush on commit
+        db_session.add_all(new_items)
+
         try:
             await db_session.commit()
             # After commit, log the IDs of new items
@@ -12,6 +12,12 @@ from typing import Dict, List, Optional, Any
 import logging
 
 from .base import BaseCollector
+from app.core.cache import (
+    cache_clear,
+    COLLECTION_ITEMS_NAMESPACE,
+    COLLECTION_STATS_NAMESPACE,
+    LOCAL_GOVERNMENT_NAMESPACE,
+)
 from app.models.news_item import CollectionRun
 from app.services.broadcast import (
     emit_collection_started,
@@ -33,9 +39,16 @@ class CollectionScheduler:
     - Concurrent or sequential execution
     - Health monitoring and status reporting
     - Graceful start/stop
-    - Manual trigger support
+    - Manual trigger support via a queue drained by long-lived workers
     """
 
+    # Number of workers draining manually triggered runs
+    MANUAL_RUN_WORKERS = 2
+    # Pending-run key for a run of all collectors
+    ALL_COLLECTORS = "__all__"
+    # Upper bound on collectors run concurrently by run_all_now
+    MAX_CONCURRENT_RUNS = 8
+
     def __init__(self, db_session_factory=None):
         """
         Initialize collection scheduler.
@@ -49,6 +62,11 @@ class CollectionScheduler:
         self.is_running = False
         self._tasks: List[asyncio.Task] = []
         self._db_session_factory = db_session_factory
+        # Manual run jobs: collector name, or None for all collectors
+        self._manual_queue: Optional[asyncio.Queue] = None
+        self._manual_workers: List[asyncio.Task] = []
+        # Manual runs queued or in progress, used to drop duplicate triggers
+        self._pending_runs: set = set()
         self._logger = logging.getLogger("scheduler")
 
     def register(
@@ -124,6 +142,74 @@ class CollectionScheduler:
         self._tasks.clear()
         self._logger.info("Collection scheduler stopped")
 
+    def _ensure_manual_workers(self):
+        """Start the manual-run workers on first use (requires a running loop)."""
+        if self._manual_queue is None:
+            self._manual_queue = asyncio.Queue()
+        self._manual_workers = [t for t in self._manual_workers if not t.done()]
+        while len(self._manual_workers) < self.MANUAL_RUN_WORKERS:
+            self._manual_workers.append(asyncio.create_task(
+                self._manual_run_worker(),
+                name=f"manual_run_worker_{len(self._manual_workers)}"
+            ))
+
+    async def _manual_run_worker(self):
+        """Drain manually triggered runs for the lifetime of the app."""
+        while True:
+            name = await self._manual_queue.get()
+            try:
+                if name is None:
+                    self._logger.info("[SCHEDULER] Manual run starting: all collectors")
+                    results = await self.run_all_now()
+                    total_new = sum(r.items_new for r in results if r)
+                    self._logger.info(
+                        f"[SCHEDULER] Manual run completed: all collectors, "
+                        f"runs={len(results)}, total_new={total_new}"
+                    )
+                else:
+                    self._logger.info(f"[SCHEDULER] Manual run starting: {name}")
+                    result = await self.run_collector_now(name)
+                    self._logger.info(
+                        f"[SCHEDULER] Manual run completed: {name}, "
+                        f"new={result.items_new if result else 0}"
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error(f"[SCHEDULER] Manual run failed: {name or 'all'}: {e}")
+            finally:
+                self._pending_runs.discard(name or self.ALL_COLLECTORS)
+                self._manual_queue.task_done()
+
+    async def enqueue_run(self, name: Optional[str] = None) -> bool:
+        """
+        Queue a manual collection run.
+
+        Args:
+            name: Collector to run, or None to run all collectors
+
+        Returns:
+            False if the same run is already queued or in progress
+        """
+        key = name or self.ALL_COLLECTORS
+        # Check-and-add has no await in between, so it is atomic on the loop
+        if key in self._pending_runs:
+            self._logger.info(f"[SCHEDULER] Manual run already pending: {key}")
+            return False
+        self._pending_runs.add(key)
+
+        self._ensure_manual_workers()
+        self._manual_queue.put_nowait(name)
+        return True
+
+    async def stop_manual_workers(self):
+        """Cancel the manual-run workers (called on app shutdown)."""
+        for task in self._manual_workers:
+            task.cancel()
+        if self._manual_workers:
+            await asyncio.gather(*self._manual_workers, return_exceptions=True)
+        self._manual_workers.clear()
+
     async def _run_collector_loop(
         self,
         collector: BaseCollector,
@@ -177,6 +263,13 @@ class CollectionScheduler:
 
             run = await collector.run(db_session=db_session)
 
+            # New items invalidate cached collection and local record listings
+            await cache_clear(
+                COLLECTION_ITEMS_NAMESPACE,
+                COLLECTION_STATS_NAMESPACE,
+                LOCAL_GOVERNMENT_NAMESPACE,
+            )
+
             # Calculate duration
             duration = (datetime.now(timezone.utc) - start_time).total_seconds()
 
@@ -220,20 +313,30 @@ class CollectionScheduler:
 
     async def run_all_now(self) -> List[CollectionRun]:
         """
-        Trigger all collectors immediately.
+        Trigger all collectors immediately, at most MAX_CONCURRENT_RUNS at once.
 
         Returns:
             List of CollectionRun results
         """
         self._logger.info("Running all collectors immediately")
-        results = []
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_RUNS)
 
-        for collector in self.collectors.values():
-            try:
-                run = await self._run_collector_once(collector)
-                results.append(run)
-            except Exception as e:
-                self._logger.error(f"Collector {collector.name} failed: {e}")
+        async def run_one(collector: BaseCollector) -> CollectionRun:
+            async with semaphore:
+                return await self._run_collector_once(collector)
+
+        # Overlap network-bound collectors; one failure does not cancel the rest
+        collectors = list(self.collectors.values())
+        outcomes = await asyncio.gather(
+            *(run_one(c) for c in collectors), return_exceptions=True
+        )
+
+        results = []
+        for collector, outcome in zip(collectors, outcomes):
+            if isinstance(outcome, BaseException):
+                self._logger.error(f"Collector {collector.name} failed: {outcome}")
+            else:
+                results.append(outcome)
 
         return results
 
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, select
 import logging
@@ -369,8 +369,15 @@ class EntityTrackingService:
         entity_name: str,
         limit: int = 50,
         offset: int = 0
-    ) -> List[Dict]:
-        """Get recent mentions of an entity from documents, news articles, and news items"""
+    ) -> Tuple[List[Dict], int]:
+        """
+        Get recent mentions of an entity from documents, news articles, and news items.
+
+        Returns:
+            (page of mentions, total mentions across all sources). The total
+            comes from a window count on the same query, so it is 0 when
+            offset is past the last mention.
+        """
         try:
             entity_id = await self._get_entity_id(entity_name)
 
@@ -423,7 +430,7 @@ class EntityTrackingService:
                     WHERE m.entity_id = :entity_id
                     AND m.news_item_id IS NOT NULL
                 )
-                SELECT * FROM (
+                SELECT *, COUNT(*) OVER () AS total_count FROM (
                     SELECT * FROM document_mentions
                     UNION ALL
                     SELECT * FROM news_article_mentions
@@ -439,6 +446,7 @@ class EntityTrackingService:
                 {"entity_id": entity_id, "limit": limit, "offset": offset}
             )
             
+            rows = result.fetchall()
             results = [{
                 "context": row.context,
                 "timestamp": row.timestamp,
@@ -448,9 +456,10 @@ class EntityTrackingService:
                 "news_item_id": row.news_item_id,
                 "project_id": row.project_id,
                 "source_type": row.source_type
-            } for row in result]
+            } for row in rows]
+            total = rows[0].total_count if rows else 0
             
-            return results
+            return results, total
             
         except Exception as e:
             logger.error(f"Error getting entity mentions: {str(e)}")
@@ -12,10 +12,11 @@ import logging
 from math import radians, cos, sin, asin, sqrt
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Select, select, update, and_, any_, bindparam, cast, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
 
 from app.models.local_government import (
     WatchArea, LocalGovernmentAlert,
@@ -24,6 +25,24 @@ from app.models.local_government import (
 
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_MILES = 3956
+
+
+def _watch_area_payload(area: WatchArea) -> Dict:
+    """API representation of a watch area, stored in WatchArea.cached_json."""
+    return {
+        "id": str(area.id),
+        "name": area.name,
+        "description": area.description,
+        "latitude": area.latitude,
+        "longitude": area.longitude,
+        "radius_miles": area.radius_miles,
+        "alert_types": area.alert_types,
+        "is_active": area.is_active,
+        "trigger_count": area.trigger_count,
+        "last_triggered": area.last_triggered.isoformat() if area.last_triggered else None
+    }
+
 
 # Predefined areas for Chattanooga/Hamilton County region
 PREDEFINED_AREAS = {
@@ -166,14 +185,18 @@ class GeofenceService:
             Created WatchArea
         """
         watch_area = WatchArea(
+            id=uuid4(),
             user_id=self.user_id,
             name=name,
             latitude=latitude,
             longitude=longitude,
             radius_miles=radius_miles,
             alert_types=alert_types or ['zoning', 'permits', 'property', 'court'],
-            description=description
+            description=description,
+            is_active=True,
+            trigger_count=0
         )
+        watch_area.cached_json = _watch_area_payload(watch_area)
 
         self.db.add(watch_area)
         await self.db.commit()
@@ -254,6 +277,59 @@ class GeofenceService:
 
         return triggered
 
+    async def find_triggered_areas(
+        self,
+        latitude: float,
+        longitude: float,
+        alert_type: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Check a single location against the user's watch areas in SQL.
+
+        Same result as load_watch_areas() + check_location(), but the
+        Haversine distance and radius test run in Postgres, so only the
+        triggered areas leave the database.
+
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            alert_type: Optional filter for alert type
+
+        Returns:
+            List of triggered watch areas with distances, nearest first
+        """
+        lat1 = func.radians(latitude)
+        lat2 = func.radians(WatchArea.latitude)
+        half_dlat = (lat2 - lat1) / 2
+        half_dlon = (func.radians(WatchArea.longitude) - func.radians(longitude)) / 2
+        a = (
+            func.power(func.sin(half_dlat), 2)
+            + func.cos(lat1) * func.cos(lat2) * func.power(func.sin(half_dlon), 2)
+        )
+        distance = (2 * EARTH_RADIUS_MILES * func.asin(func.sqrt(func.least(a, 1.0)))).label("distance")
+
+        query = select(
+            WatchArea.id, WatchArea.name, WatchArea.radius_miles, distance
+        ).where(
+            WatchArea.is_active == True,
+            distance <= WatchArea.radius_miles
+        ).order_by(distance)
+        if self.user_id:
+            query = query.where(WatchArea.user_id == self.user_id)
+        if alert_type:
+            query = query.where(cast(WatchArea.alert_types, JSONB).contains([alert_type]))
+
+        result = await self.db.execute(query)
+        return [
+            {
+                "id": str(row.id),
+                "name": row.name,
+                "distance_miles": round(row.distance, 2),
+                "radius_miles": row.radius_miles
+            }
+            for row in result
+        ]
+
     async def check_and_alert(
         self,
         latitude: float,
@@ -288,6 +364,7 @@ class GeofenceService:
         if not triggered:
             return []
 
+        now = datetime.now(timezone.utc)
         alerts = []
         for area in triggered:
             alert = LocalGovernmentAlert(
@@ -307,13 +384,20 @@ class GeofenceService:
             self.db.add(alert)
             alerts.append(alert)
 
-            # Update watch area trigger count
+            # Update watch area trigger count, and its cached payload to match
+            trigger_count = func.coalesce(WatchArea.trigger_count, 0) + 1
             await self.db.execute(
                 WatchArea.__table__.update()
                 .where(WatchArea.id == UUID(area["id"]))
                 .values(
-                    last_triggered=datetime.now(timezone.utc),
-                    trigger_count=WatchArea.trigger_count + 1
+                    last_triggered=now,
+                    trigger_count=trigger_count,
+                    cached_json=WatchArea.cached_json.op('||', return_type=JSONB)(
+                        func.jsonb_build_object(
+                            'trigger_count', trigger_count,
+                            'last_triggered', now.isoformat()
+                        )
+                    )
                 )
             )
 
@@ -411,20 +495,16 @@ class GeofenceService:
         matches["watch_areas"] = len(self._watch_areas)
         return matches
 
-    async def get_user_alerts(
-        self,
-        unread_only: bool = False,
-        limit: int = 50
-    ) -> List[LocalGovernmentAlert]:
+    def user_alerts_query(self, unread_only: bool = False, limit: int = 50) -> Select:
         """
-        Get alerts for the current user.
+        Build the query for the current user's alerts, newest first.
 
         Args:
             unread_only: Only return unread alerts
             limit: Maximum number to return
 
         Returns:
-            List of alerts
+            Select over LocalGovernmentAlert
         """
         query = select(LocalGovernmentAlert).where(
             LocalGovernmentAlert.user_id == self.user_id,
@@ -434,28 +514,64 @@ class GeofenceService:
         if unread_only:
             query = query.where(LocalGovernmentAlert.is_read == False)
 
-        query = query.order_by(LocalGovernmentAlert.created_at.desc()).limit(limit)
+        return query.order_by(LocalGovernmentAlert.created_at.desc()).limit(limit)
 
-        result = await self.db.execute(query)
+    async def get_user_alerts(
+        self,
+        unread_only: bool = False,
+        limit: int = 50
+    ) -> List[LocalGovernmentAlert]:
+        """
+        Get alerts for the current user.
+
+        Args:
+            unread_only: Only return unread alerts
+            limit: Maximum number to return
+
+        Returns:
+            List of alerts
+        """
+        result = await self.db.execute(self.user_alerts_query(unread_only, limit))
         return result.scalars().all()
 
     async def mark_alert_read(self, alert_id: UUID) -> bool:
         """Mark an alert as read."""
         result = await self.db.execute(
-            select(LocalGovernmentAlert).where(
+            update(LocalGovernmentAlert)
+            .where(
                 LocalGovernmentAlert.id == alert_id,
                 LocalGovernmentAlert.user_id == self.user_id
             )
+            .values(is_read=True, read_at=datetime.now(timezone.utc))
+            .returning(LocalGovernmentAlert.id)
         )
-        alert = result.scalar_one_or_none()
+        updated = result.scalar_one_or_none() is not None
+        await self.db.commit()
+        return updated
+
+    async def mark_alerts_read(self, alert_ids: List[UUID]) -> int:
+        """
+        Mark several alerts as read in one UPDATE.
 
-        if alert:
-            alert.is_read = True
-            alert.read_at = datetime.now(timezone.utc)
-            await self.db.commit()
-            return True
+        Args:
+            alert_ids: Alerts to mark; ids not owned by the user are ignored
 
-        return False
+        Returns:
+            Number of alerts updated
+        """
+        result = await self.db.execute(
+            update(LocalGovernmentAlert)
+            .where(
+                # One uuid[] parameter, so the statement is the same for any count
+                LocalGovernmentAlert.id == any_(
+                    bindparam("alert_ids", alert_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+                ),
+                LocalGovernmentAlert.user_id == self.user_id
+            )
+            .values(is_read=True, read_at=datetime.now(timezone.utc))
+        )
+        await self.db.commit()
+        return result.rowcount
 
     def get_predefined_areas(self) -> Dict:
         """Get list of predefined watch areas."""
@@ -480,7 +596,7 @@ class GeofenceService:
         Returns:
             Distance in miles
         """
-        R = 3956  # Earth radius in miles
+        R = EARTH_RADIUS_MILES
 
         lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
 
@@ -12,7 +12,7 @@ from collections import defaultdict
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, text
+from sqlalchemy import select, func, and_, text, case as sa_case, cast, literal, null, union_all, Date, String
 
 from app.models.local_government import (
     CouncilMeeting, ZoningCase, BuildingPermit,
@@ -502,47 +502,74 @@ Return JSON:
             "council_meetings": []
         }
 
-        # Search zoning cases
-        zoning_result = await self.db.execute(
-            select(ZoningCase).where(
-                func.lower(ZoningCase.applicant).contains(name_lower) |
-                func.lower(ZoningCase.owner).contains(name_lower)
-            ).limit(20)
-        )
-        for case in zoning_result.scalars():
-            mentions["zoning_cases"].append({
-                "case_number": case.case_number,
-                "address": case.address,
-                "role": "applicant" if name_lower in (case.applicant or "").lower() else "owner"
-            })
-
-        # Search permits
-        permit_result = await self.db.execute(
-            select(BuildingPermit).where(
-                func.lower(BuildingPermit.owner).contains(name_lower) |
-                func.lower(BuildingPermit.contractor).contains(name_lower)
-            ).limit(20)
-        )
-        for permit in permit_result.scalars():
-            mentions["permits"].append({
-                "permit_number": permit.permit_number,
-                "address": permit.address,
-                "role": "owner" if name_lower in (permit.owner or "").lower() else "contractor"
-            })
-
-        # Search property transactions
-        prop_result = await self.db.execute(
-            select(PropertyTransaction).where(
-                func.lower(PropertyTransaction.grantor).contains(name_lower) |
-                func.lower(PropertyTransaction.grantee).contains(name_lower)
-            ).limit(20)
-        )
-        for trans in prop_result.scalars():
-            mentions["property"].append({
-                "address": trans.address,
-                "sale_date": trans.sale_date.isoformat() if trans.sale_date else None,
-                "role": "seller" if name_lower in (trans.grantor or "").lower() else "buyer"
-            })
+        # Search zoning cases, permits and property transactions in one
+        # UNION ALL round-trip. Each branch keeps its own LIMIT 20 and
+        # projects the shared (source, ref, address, sale_date, role) shape
+        zoning = select(
+            literal("zoning").label("source"),
+            cast(ZoningCase.case_number, String).label("ref"),
+            ZoningCase.address.label("address"),
+            cast(null(), Date).label("sale_date"),
+            sa_case(
+                (func.lower(ZoningCase.applicant).contains(name_lower), "applicant"),
+                else_="owner"
+            ).label("role")
+        ).where(
+            func.lower(ZoningCase.applicant).contains(name_lower) |
+            func.lower(ZoningCase.owner).contains(name_lower)
+        ).limit(20).subquery()
+
+        permits = select(
+            literal("permit").label("source"),
+            cast(BuildingPermit.permit_number, String).label("ref"),
+            BuildingPermit.address.label("address"),
+            cast(null(), Date).label("sale_date"),
+            sa_case(
+                (func.lower(BuildingPermit.owner).contains(name_lower), "owner"),
+                else_="contractor"
+            ).label("role")
+        ).where(
+            func.lower(BuildingPermit.owner).contains(name_lower) |
+            func.lower(BuildingPermit.contractor).contains(name_lower)
+        ).limit(20).subquery()
+
+        properties = select(
+            literal("property").label("source"),
+            cast(null(), String).label("ref"),
+            PropertyTransaction.address.label("address"),
+            PropertyTransaction.sale_date.label("sale_date"),
+            sa_case(
+                (func.lower(PropertyTransaction.grantor).contains(name_lower), "seller"),
+                else_="buyer"
+            ).label("role")
+        ).where(
+            func.lower(PropertyTransaction.grantor).contains(name_lower) |
+            func.lower(PropertyTransaction.grantee).contains(name_lower)
+        ).limit(20).subquery()
+
+        result = await self.db.execute(union_all(
+            select(zoning), select(permits), select(properties)
+        ))
+
+        for row in result:
+            if row.source == "zoning":
+                mentions["zoning_cases"].append({
+                    "case_number": row.ref,
+                    "address": row.address,
+                    "role": row.role
+                })
+            elif row.source == "permit":
+                mentions["permits"].append({
+                    "permit_number": row.ref,
+                    "address": row.address,
+                    "role": row.role
+                })
+            else:
+                mentions["property"].append({
+                    "address": row.address,
+                    "sale_date": row.sale_date.isoformat() if row.sale_date else None,
+                    "role": row.role
+                })
 
         mentions["total"] = sum(len(v) for v in mentions.values())
         return mentions
@@ -0,0 +1,107 @@
+"""
+Process pool for CPU-bound graph analytics.
+
+Layouts, community detection and betweenness centrality are pure
+NetworkX/Python work; run inside the event loop they stall every other
+request on the worker for their duration. This module runs them in a
+separate process instead.
+
+Workers receive the graph as pickled bytes plus a NetworkMapperService
+method name and keyword arguments, and return the method's result. Each
+worker keeps the last few graphs it unpickled, keyed by graph version, so
+repeated calls on an unchanged graph skip deserialization.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Graphs smaller than this are analysed inline; shipping them to another
+# process costs more than the computation
+OFFLOAD_MIN_NODES = 200
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+# Worker-side cache of unpickled graphs: graph_version -> nx graph
+_WORKER_GRAPH_CACHE_SIZE = 4
+_worker_graphs: "OrderedDict[int, Any]" = OrderedDict()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+        # spawn, not fork: the API process runs threads (Redis, scheduler)
+        # that must not be duplicated into the children mid-operation
+        _pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Started graph analytics pool with {max_workers} workers")
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the analytics workers, if any were started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        logger.info("Graph analytics pool stopped")
+
+
+def _run_graph_method(graph_version: int, graph_bytes: bytes, method: str, kwargs: Dict[str, Any]) -> Any:
+    """Worker entry point: run a NetworkMapperService method on a pickled graph."""
+    from .graph_service import NetworkMapperService
+
+    graph = _worker_graphs.get(graph_version)
+    if graph is None:
+        graph = pickle.loads(graph_bytes)
+        _worker_graphs[graph_version] = graph
+        while len(_worker_graphs) > _WORKER_GRAPH_CACHE_SIZE:
+            _worker_graphs.popitem(last=False)
+    else:
+        _worker_graphs.move_to_end(graph_version)
+
+    mapper = NetworkMapperService(None)
+    mapper.graph = graph
+    return getattr(mapper, method)(**kwargs)
+
+
+async def run_graph_method(
+    graph_version: int,
+    graph_bytes: Callable[[], bytes],
+    method: str,
+    kwargs: Dict[str, Any],
+    inline: Callable[[], Any]
+) -> Any:
+    """
+    Run a graph analysis method in the process pool.
+
+    Args:
+        graph_version: Version of the graph, for the worker-side cache
+        graph_bytes: Returns the pickled graph
+        method: NetworkMapperService method to call
+        kwargs: Keyword arguments for the method
+        inline: Computes the same result in this process; used if the
+            pool has broken (e.g. a worker was killed)
+
+    Returns:
+        The method's result
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            _get_pool(), _run_graph_method, graph_version, graph_bytes(), method, kwargs
+        )
+    except BrokenProcessPool:
+        logger.warning(f"Graph analytics pool broken; running {method} inline")
+        shutdown_pool()
+        return inline()
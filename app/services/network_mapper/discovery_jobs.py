@@ -0,0 +1,140 @@
+"""
+Background job tracking for full relationship discovery.
+
+Full discovery walks every tracked entity and may call the LLM for each,
+so it runs as an asyncio task outside the request that started it. Jobs
+are tracked in-process; each user has at most one running job, and the
+most recent finished jobs are kept for status polling.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from uuid import UUID, uuid4
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DiscoveryJob:
+    """A full-discovery run and its outcome."""
+    job_id: UUID
+    user_id: Optional[UUID]
+    status: str  # "running", "completed", "failed"
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    results: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "job_id": str(self.job_id),
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "results": self.results,
+            "error_message": self.error_message,
+        }
+
+
+class DiscoveryJobManager:
+    """
+    Runs full-discovery jobs as background tasks and tracks their status.
+    """
+
+    def __init__(self, max_finished: int = 50):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_finished: Finished jobs kept for status lookups
+        """
+        self.max_finished = max_finished
+        self._jobs: Dict[UUID, DiscoveryJob] = {}
+        self._running_by_user: Dict[Optional[UUID], DiscoveryJob] = {}
+        # Strong references so running tasks are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(
+        self,
+        user_id: Optional[UUID],
+        run: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> DiscoveryJob:
+        """
+        Start a job for a user, or return the one already running.
+
+        Args:
+            user_id: Owner of the job
+            run: Performs the discovery and returns its results
+
+        Returns:
+            The new or already running DiscoveryJob
+        """
+        running = self._running_by_user.get(user_id)
+        if running is not None:
+            return running
+
+        job = DiscoveryJob(
+            job_id=uuid4(),
+            user_id=user_id,
+            status="running",
+            created_at=datetime.now(timezone.utc),
+        )
+        self._jobs[job.job_id] = job
+        self._running_by_user[user_id] = job
+
+        task = asyncio.create_task(self._run(job, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: DiscoveryJob, run: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        try:
+            job.results = await run()
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"Discovery job {job.job_id} failed: {e}", exc_info=True)
+            job.status = "failed"
+            job.error_message = str(e)
+        finally:
+            job.completed_at = datetime.now(timezone.utc)
+            self._running_by_user.pop(job.user_id, None)
+            self._prune()
+
+    def _prune(self) -> None:
+        finished = [j for j in self._jobs.values() if j.completed_at is not None]
+        if len(finished) <= self.max_finished:
+            return
+        finished.sort(key=lambda j: j.completed_at)
+        for job in finished[:len(finished) - self.max_finished]:
+            del self._jobs[job.job_id]
+
+    def get_job(self, job_id: UUID, user_id: Optional[UUID]) -> Optional[DiscoveryJob]:
+        """
+        Get a job by ID, if it belongs to the user.
+
+        Returns:
+            DiscoveryJob if found, None otherwise
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+
+# Global singleton instance
+_discovery_jobs: Optional[DiscoveryJobManager] = None
+
+
+def get_discovery_job_manager() -> DiscoveryJobManager:
+    """
+    Get the shared DiscoveryJobManager instance.
+    Creates one on first call and reuses it for all subsequent calls.
+    """
+    global _discovery_jobs
+    if _discovery_jobs is None:
+        _discovery_jobs = DiscoveryJobManager()
+    return _discovery_jobs
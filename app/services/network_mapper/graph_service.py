@@ -11,21 +11,31 @@ Provides advanced graph operations using NetworkX including:
 """
 
 import networkx as nx
+import numpy as np
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
-import json
 import logging
-from uuid import UUID
+import orjson
+import pickle
+from bisect import bisect_left
+from itertools import count
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from app.models.entities import TrackedEntity, EntityMention, EntityRelationship
+from .analytics_pool import OFFLOAD_MIN_NODES, run_graph_method
 
 logger = logging.getLogger(__name__)
 
+# Process-wide source of graph versions, so a reloaded mapper never reuses
+# a version an earlier mapper for the same user already had
+_graph_versions = count(1)
+
 
 @dataclass
 class GraphNode:
@@ -73,6 +83,58 @@ class NetworkMapperService:
         self.user_id = user_id
         self.graph = nx.MultiDiGraph()  # Directed graph with multiple edges
         self._loaded = False
+        # Changes whenever the graph does; keys caches of derived results
+        self.graph_version = next(_graph_versions)
+        # Derived views of the graph, dropped by _graph_changed()
+        # Sorted node orderings for paginated subsets; rebuilt lazily after changes
+        self._node_indices: Optional[Dict[str, Any]] = None
+        # Serialized export_cytoscape() output keyed by include_isolated
+        self._cytoscape_json: Dict[bool, bytes] = {}
+        # export_json() output
+        self._export_json: Optional[str] = None
+        # Pickled graph shipped to the analytics process pool
+        self._graph_pickle: Optional[bytes] = None
+        # get_graph_stats() result and the graph_version it was computed for
+        self._stats_cache: Optional[Dict] = None
+        self._stats_version: Optional[int] = None
+        # New edges added in memory since the last load / layout refresh
+        self.edges_added_since_refresh = 0
+
+    def _graph_changed(self) -> None:
+        """Drop everything derived from the graph after it is modified."""
+        self.graph_version = next(_graph_versions)
+        self._node_indices = None
+        self._cytoscape_json.clear()
+        self._export_json = None
+        self._graph_pickle = None
+
+    def _pickled_graph(self) -> bytes:
+        if self._graph_pickle is None:
+            self._graph_pickle = pickle.dumps(self.graph, protocol=pickle.HIGHEST_PROTOCOL)
+        return self._graph_pickle
+
+    async def run_offloaded(self, method: str, **kwargs) -> Any:
+        """
+        Run a CPU-bound analysis method without blocking the event loop.
+
+        Large graphs are analysed in the analytics process pool; small ones
+        inline, where the round trip would cost more than the work.
+
+        Args:
+            method: Name of the method to run (e.g. "compute_layout")
+            **kwargs: Arguments for the method
+
+        Returns:
+            The method's result
+        """
+        def compute():
+            return getattr(self, method)(**kwargs)
+
+        if self.graph.number_of_nodes() < OFFLOAD_MIN_NODES:
+            return compute()
+        return await run_graph_method(
+            self.graph_version, self._pickled_graph, method, kwargs, compute
+        )
 
     async def load_from_database(self) -> int:
         """
@@ -85,50 +147,81 @@ class NetworkMapperService:
 
         # Clear existing graph
         self.graph.clear()
-
-        # Load entities as nodes
-        entity_query = select(TrackedEntity)
+        self._graph_changed()
+        self.edges_added_since_refresh = 0
+
+        # Load entities as nodes. Only the needed columns are selected and
+        # fetched as plain tuples, skipping ORM object construction, and the
+        # graph is filled with one bulk add per table.
+        entity_query = select(
+            TrackedEntity.entity_id,
+            TrackedEntity.entity_type,
+            TrackedEntity.name,
+            TrackedEntity.name_lower,
+            TrackedEntity.created_at,
+            TrackedEntity.entity_metadata
+        )
         if self.user_id:
             entity_query = entity_query.where(TrackedEntity.user_id == self.user_id)
 
         result = await self.db.execute(entity_query)
-        entities = result.scalars().all()
-
-        for entity in entities:
-            self.graph.add_node(
-                str(entity.entity_id),
-                entity_type=entity.entity_type,
-                name=entity.name,
-                name_lower=entity.name_lower,
-                created_at=entity.created_at,
-                metadata=entity.entity_metadata or {}
+        entities = result.tuples().all()
+
+        self.graph.add_nodes_from(
+            (
+                str(entity_id),
+                {
+                    "entity_type": entity_type,
+                    "name": name,
+                    "name_lower": name_lower,
+                    "created_at": created_at,
+                    "metadata": metadata or {}
+                }
             )
+            for entity_id, entity_type, name, name_lower, created_at, metadata in entities
+        )
 
         logger.info(f"Loaded {len(entities)} entity nodes")
 
         # Load relationships as edges
-        rel_query = select(EntityRelationship)
+        rel_query = select(
+            EntityRelationship.id,
+            EntityRelationship.source_entity_id,
+            EntityRelationship.target_entity_id,
+            EntityRelationship.relationship_type,
+            EntityRelationship.description,
+            EntityRelationship.first_seen,
+            EntityRelationship.last_seen,
+            EntityRelationship.mention_count,
+            EntityRelationship.confidence
+        )
         if self.user_id:
             rel_query = rel_query.where(EntityRelationship.user_id == self.user_id)
 
         result = await self.db.execute(rel_query)
-        relationships = result.scalars().all()
-
-        for rel in relationships:
-            self.graph.add_edge(
-                str(rel.source_entity_id),
-                str(rel.target_entity_id),
-                relationship_type=rel.relationship_type,
-                description=rel.description,
-                first_seen=rel.first_seen,
-                last_seen=rel.last_seen,
-                weight=rel.mention_count or 1,
-                confidence=rel.confidence or 0.5,
-                key=str(rel.id)
+        relationships = result.tuples().all()
+
+        self.graph.add_edges_from(
+            (
+                str(source_id),
+                str(target_id),
+                str(rel_id),
+                {
+                    "relationship_type": relationship_type,
+                    "description": description,
+                    "first_seen": first_seen,
+                    "last_seen": last_seen,
+                    "weight": mention_count or 1,
+                    "confidence": confidence or 0.5
+                }
             )
+            for (rel_id, source_id, target_id, relationship_type, description,
+                 first_seen, last_seen, mention_count, confidence) in relationships
+        )
 
         logger.info(f"Loaded {len(relationships)} relationship edges")
         self._loaded = True
+        self._build_node_indices()
 
         return len(relationships)
 
@@ -181,6 +274,67 @@ class NetworkMapperService:
 
         return saved_count
 
+    async def save_relationship(
+        self,
+        db: AsyncSession,
+        source_id: str,
+        target_id: str,
+        relationship_type: str,
+        description: Optional[str] = None,
+        confidence: float = 0.5
+    ) -> str:
+        """
+        Persist one relationship after add_relationship().
+
+        Write-through counterpart of save_to_database(): a single upsert on
+        the (source, target, type) unique constraint, applying the same
+        update add_relationship() made in memory, so the loaded graph stays
+        valid and does not need to be reloaded.
+
+        Args:
+            db: The caller's session. Not self.db: a cached mapper is shared
+                between requests, and each one repoints self.db at its own
+                session, so it can change across the awaits below.
+
+        Returns:
+            The relationship's database ID
+        """
+        now = datetime.now(timezone.utc)
+        insert_stmt = pg_insert(EntityRelationship).values(
+            id=uuid4(),
+            source_entity_id=UUID(source_id),
+            target_entity_id=UUID(target_id),
+            relationship_type=relationship_type,
+            description=description,
+            confidence=confidence,
+            first_seen=now,
+            last_seen=now,
+            user_id=self.user_id
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            constraint="uq_entity_relationship",
+            set_={
+                "last_seen": insert_stmt.excluded.last_seen,
+                "mention_count": func.coalesce(EntityRelationship.mention_count, 1) + 1,
+                "confidence": func.greatest(
+                    EntityRelationship.confidence, insert_stmt.excluded.confidence
+                ),
+            }
+        ).returning(EntityRelationship.id)
+
+        relationship_id = str(await db.scalar(stmt))
+        await db.commit()
+
+        # Re-key a newly added edge to its row ID, as load_from_database() would
+        for key, data in list((self.graph.get_edge_data(source_id, target_id) or {}).items()):
+            if data.get("relationship_type") == relationship_type and key != relationship_id:
+                self.graph.remove_edge(source_id, target_id, key=key)
+                self.graph.add_edge(source_id, target_id, key=relationship_id, **data)
+                self._graph_changed()
+                break
+
+        return relationship_id
+
     def add_relationship(
         self,
         source_id: str,
@@ -204,6 +358,9 @@ class NetworkMapperService:
         Returns:
             True if new edge added, False if updated existing
         """
+        # Degrees, orderings and exports all change with any edge update
+        self._graph_changed()
+
         # Check for existing edge of same type
         existing = self.graph.get_edge_data(source_id, target_id)
 
@@ -219,6 +376,7 @@ class NetworkMapperService:
                     return False
 
         # Add new edge
+        self.edges_added_since_refresh += 1
         self.graph.add_edge(
             source_id,
             target_id,
@@ -646,9 +804,31 @@ class NetworkMapperService:
 
         return elements
 
+    def export_cytoscape_json(self, include_isolated: bool = False) -> bytes:
+        """
+        Full-graph export_cytoscape() output, pre-serialized as JSON.
+
+        Memoized until the graph changes, so repeat requests skip both the
+        export and the encoding.
+        """
+        cached = self._cytoscape_json.get(include_isolated)
+        if cached is None:
+            cached = orjson.dumps(
+                self.export_cytoscape(include_isolated=include_isolated),
+                default=str
+            )
+            self._cytoscape_json[include_isolated] = cached
+        return cached
+
     def export_json(self) -> str:
-        """Export graph as JSON string."""
-        return json.dumps({
+        """Export graph as JSON string, memoized until the graph changes."""
+        if self._export_json is None:
+            self._export_json = self._build_export_json()
+        return self._export_json
+
+    def _build_export_json(self) -> str:
+        # Datetimes pass through to str() so the output matches the stdlib encoder's
+        return orjson.dumps({
             "nodes": [
                 {"id": n, **self.graph.nodes[n]}
                 for n in self.graph.nodes()
@@ -657,10 +837,21 @@ class NetworkMapperService:
                 {"source": u, "target": v, **d}
                 for u, v, d in self.graph.edges(data=True)
             ]
-        }, default=str)
+        }, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
 
     def get_graph_stats(self) -> Dict:
-        """Get summary statistics about the graph."""
+        """
+        Get summary statistics about the graph.
+
+        Memoized per graph_version: the component count and relationship
+        types walk the whole graph, and most endpoints ask for the stats.
+        """
+        if self._stats_version != self.graph_version:
+            self._stats_cache = self._compute_graph_stats()
+            self._stats_version = self.graph_version
+        return self._stats_cache
+
+    def _compute_graph_stats(self) -> Dict:
         if len(self.graph) == 0:
             return {
                 "nodes": 0,
@@ -716,13 +907,155 @@ class NetworkMapperService:
             })
         return result
 
+    def _build_node_indices(self) -> Dict[str, Any]:
+        """
+        Precompute the node arrays and orderings used by paginated subsets.
+
+        Node attributes needed for filtering are held column-wise, indexed
+        by each node's position in graph order: degrees as int64 and entity
+        types as int32 codes into a small type table. Orderings are arrays
+        of positions plus the inverse rank array, so filters become
+        vectorized masks and only the returned page is turned back into IDs.
+
+        Degree centrality is degree / (n - 1), so it ranks nodes exactly
+        like degree and one ordering serves both sort modes. Orderings use
+        stable sorts, so ties keep insertion order.
+        """
+        node_list = list(self.graph.nodes)
+        node_count = len(node_list)
+        degree_arr = np.fromiter(
+            (d for _, d in self.graph.degree()), dtype=np.int64, count=node_count
+        )
+
+        type_table: Dict[str, int] = {}
+        type_codes = np.fromiter(
+            (
+                type_table.setdefault((entity_type or "").lower(), len(type_table))
+                for _, entity_type in self.graph.nodes(data="entity_type")
+            ),
+            dtype=np.int32,
+            count=node_count
+        )
+
+        created = [self.graph.nodes[n].get("created_at") or "" for n in node_list]
+        recent_order = np.array(
+            sorted(range(node_count), key=created.__getitem__, reverse=True),
+            dtype=np.intp
+        )
+
+        def with_rank(order: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            rank = np.empty(node_count, dtype=np.intp)
+            rank[order] = np.arange(node_count)
+            return order, rank
+
+        self._node_indices = {
+            "nodes": node_list,
+            "position": {n: i for i, n in enumerate(node_list)},
+            "degree": degree_arr,
+            "type_codes": type_codes,
+            "type_table": type_table,
+            "orderings": {
+                "degree": with_rank(np.argsort(-degree_arr, kind="stable")),
+                "recent": with_rank(recent_order),
+                "graph": with_rank(np.arange(node_count)),
+            },
+            # (lowercased name, node_id) pairs for bisect prefix search
+            "names": sorted(
+                ((data.get("name") or "").lower(), node_id)
+                for node_id, data in self.graph.nodes(data=True)
+            ),
+        }
+        return self._node_indices
+
+    def _get_node_indices(self) -> Dict[str, Any]:
+        return self._node_indices or self._build_node_indices()
+
+    def get_degree_centrality(self, node_id: str) -> float:
+        """Degree centrality of one node, matching nx.degree_centrality."""
+        n = self.graph.number_of_nodes()
+        if n <= 1:
+            return 1.0 if node_id in self.graph else 0.0
+        indices = self._get_node_indices()
+        position = indices["position"].get(node_id)
+        if position is None:
+            return 0.0
+        return float(indices["degree"][position]) / (n - 1)
+
+    def get_ranked_nodes(
+        self,
+        sort_by: str = "centrality",
+        entity_type: Optional[str] = None,
+        search: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[str], int]:
+        """
+        Get one page of node IDs from the precomputed orderings.
+
+        Args:
+            sort_by: centrality, mentions (degree) or recent; anything else
+                keeps graph insertion order
+            entity_type: Only include nodes of this type (case-insensitive)
+            search: Only include nodes whose name starts with this prefix
+            offset: Number of matching nodes to skip
+            limit: Maximum number of node IDs to return
+
+        Returns:
+            Tuple of (node IDs for the page, total matching nodes)
+        """
+        indices = self._get_node_indices()
+        if sort_by in ("centrality", "mentions"):
+            order, rank = indices["orderings"]["degree"]
+        elif sort_by == "recent":
+            order, rank = indices["orderings"]["recent"]
+        else:
+            order, rank = indices["orderings"]["graph"]
+
+        type_code = None
+        if entity_type:
+            type_code = indices["type_table"].get(entity_type.lower())
+            if type_code is None:
+                return [], 0
+        type_codes = indices["type_codes"]
+
+        if search:
+            # Prefix match is a contiguous slice of the sorted name index
+            names = indices["names"]
+            prefix = search.lower()
+            lo = bisect_left(names, (prefix,))
+            hi = bisect_left(names, (prefix + chr(0x10FFFF),))
+            position = indices["position"]
+            selected = np.fromiter(
+                (position[node_id] for _, node_id in names[lo:hi]),
+                dtype=np.intp,
+                count=hi - lo
+            )
+            if type_code is not None:
+                selected = selected[type_codes[selected] == type_code]
+            selected = selected[np.argsort(rank[selected])]
+        elif type_code is not None:
+            selected = order[type_codes[order] == type_code]
+        else:
+            selected = order
+
+        nodes = indices["nodes"]
+        page = [nodes[i] for i in selected[offset:offset + limit]]
+        return page, len(selected)
+
     def get_entity_by_name(self, name: str) -> Optional[Dict]:
         """Find entity by name (case-insensitive)."""
         name_lower = name.lower()
-        for node_id, data in self.graph.nodes(data=True):
-            if data.get('name_lower') == name_lower or data.get('name', '').lower() == name_lower:
-                return self._get_node_info(node_id)
-        return None
+        indices = self._get_node_indices()
+        names = indices["names"]
+        # Exact matches are a contiguous run of the sorted name index
+        lo = bisect_left(names, (name_lower,))
+        hi = bisect_left(names, (name_lower, chr(0x10FFFF)))
+        if lo == hi:
+            return None
+        # Same-name entities resolve to the earliest loaded, as a scan would
+        position = indices["position"]
+        node_id = min((node_id for _, node_id in names[lo:hi]), key=position.__getitem__)
+        return self._get_node_info(node_id)
 
     # ==================== LAYOUT COMPUTATION ====================
 
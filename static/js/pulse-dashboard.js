@@ -679,22 +679,24 @@ class PulseDashboard {
             } else {
                 this.newsItems = response.items || [];
 
-                // If there are more items, load additional pages
-                if (response.has_more && response.total > 500) {
-                    let offset = 500;
+                // If there are more items, follow the keyset cursor
+                if (response.has_more && response.next_cursor) {
+                    let cursor = response.next_cursor;
                     const maxItems = 2000; // Cap at 2000 items to prevent UI slowdown
 
-                    while (offset < response.total && offset < maxItems) {
-                        const nextPage = await this.fetchApi(`/collection/items?limit=500&offset=${offset}`);
+                    while (cursor && this.newsItems.length < maxItems) {
+                        const nextPage = await this.fetchApi(
+                            `/collection/items?limit=500&cursor=${encodeURIComponent(cursor)}`
+                        );
                         if (nextPage.items && nextPage.items.length > 0) {
                             this.newsItems = this.newsItems.concat(nextPage.items);
-                            offset += nextPage.items.length;
+                            cursor = nextPage.has_more ? nextPage.next_cursor : null;
                         } else {
                             break;
                         }
                     }
 
-                    console.log(`Loaded ${this.newsItems.length} of ${response.total} total items`);
+                    console.log(`Loaded ${this.newsItems.length} items`);
                 }
             }
 
@@ -0,0 +1,59 @@
+"""
+Shared test fixtures.
+
+Tests that need Postgres take the pg_session fixture. They run against the
+database in PULSE_TEST_DATABASE_URL (a postgresql+asyncpg URL to a
+disposable database) and are skipped when it is not set. Each test gets its
+own schema with every table created, dropped again afterwards.
+"""
+import os
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+TEST_DATABASE_URL = os.getenv("PULSE_TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def pg_session(anyio_backend):
+    if not TEST_DATABASE_URL:
+        pytest.skip("PULSE_TEST_DATABASE_URL not set")
+
+    import app.models  # noqa: F401  registers every table on Base.metadata
+    from app.database import Base
+
+    schema = f"pulse_test_{uuid.uuid4().hex[:12]}"
+    admin = create_async_engine(TEST_DATABASE_URL)
+    async with admin.begin() as conn:
+        has_trgm = (await conn.execute(text(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        ))).scalar()
+        if not has_trgm:
+            await admin.dispose()
+            pytest.skip("pg_trgm extension not available in the test database")
+        # The entity name indexes need pg_trgm, as in the setup scripts
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+
+    # public stays on the path for the pg_trgm operator classes
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"server_settings": {"search_path": f"{schema},public"}}
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        await admin.dispose()
@@ -0,0 +1,124 @@
+"""
+The merge_entities write-side CTE (_MERGE_ENTITIES_SQL), run on Postgres.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.api.v1.entities.routes import _MERGE_ENTITIES_SQL
+from app.models.entities import EntityMention, TrackedEntity
+from app.models.news_item import NewsItem
+from app.models.user import User
+
+MERGED_AT = "2024-03-01T12:00:00+00:00"
+
+
+def _entity(user_id, name, metadata):
+    return TrackedEntity(
+        user_id=user_id,
+        name=name,
+        name_lower=name.lower(),
+        entity_type="PERSON",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        entity_metadata=metadata,
+    )
+
+
+async def _seed(session, primary_metadata):
+    user = User(email=f"{uuid.uuid4().hex}@pulse.test", password_hash="x")
+    session.add(user)
+    await session.flush()
+
+    primary = _entity(user.user_id, "Alice Smith", primary_metadata)
+    secondary = _entity(user.user_id, "A. Smith", {"aliases": ["Ally", "Smith"]})
+    item = NewsItem(source_type="rss", source_name="test", title="Story")
+    session.add_all([primary, secondary, item])
+    await session.flush()
+
+    for entity, count in ((primary, 1), (secondary, 3)):
+        for i in range(count):
+            session.add(EntityMention(
+                entity_id=entity.entity_id,
+                news_item_id=item.id,
+                user_id=user.user_id,
+                chunk_id=f"{entity.name}-{i}",
+                context="...",
+            ))
+    await session.commit()
+    return user, primary, secondary
+
+
+async def _merge(session, user_id, primary_id, secondary_id):
+    result = await session.execute(_MERGE_ENTITIES_SQL, {
+        "primary_id": primary_id,
+        "secondary_id": secondary_id,
+        "user_id": user_id,
+        "merged_at": MERGED_AT,
+    })
+    merged = result.one()
+    await session.commit()
+    return merged
+
+
+async def _mention_entities(session):
+    result = await session.execute(select(EntityMention.entity_id))
+    return list(result.scalars())
+
+
+@pytest.mark.anyio
+async def test_merge_moves_mentions_and_merges_metadata(pg_session):
+    user, primary, secondary = await _seed(
+        pg_session, {"aliases": ["Smith", "Dr. Smith"], "wikidata_id": "Q1"}
+    )
+
+    merged = await _merge(pg_session, user.user_id, primary.entity_id, secondary.entity_id)
+
+    assert merged.mentions_moved == 3
+    assert merged.deleted_name == "A. Smith"
+    # Union of both alias lists plus the secondary's name, without duplicates
+    assert sorted(merged.aliases) == ["A. Smith", "Ally", "Dr. Smith", "Smith"]
+
+    assert await _mention_entities(pg_session) == [primary.entity_id] * 4
+    remaining = await pg_session.scalars(select(TrackedEntity.entity_id))
+    assert list(remaining) == [primary.entity_id]
+
+    await pg_session.refresh(primary)
+    metadata = primary.entity_metadata
+    assert metadata["wikidata_id"] == "Q1"
+    assert sorted(metadata["aliases"]) == sorted(merged.aliases)
+    assert metadata["merged_from"] == [{
+        "entity_id": str(secondary.entity_id),
+        "name": "A. Smith",
+        "merged_at": MERGED_AT,
+    }]
+    # The mention_count trigger followed the re-pointed mentions
+    assert primary.mention_count == 4
+
+
+@pytest.mark.anyio
+async def test_merge_into_entity_without_metadata(pg_session):
+    user, primary, secondary = await _seed(pg_session, None)
+
+    merged = await _merge(pg_session, user.user_id, primary.entity_id, secondary.entity_id)
+
+    assert sorted(merged.aliases) == ["A. Smith", "Ally", "Smith"]
+    await pg_session.refresh(primary)
+    assert len(primary.entity_metadata["merged_from"]) == 1
+
+
+@pytest.mark.anyio
+async def test_merge_is_scoped_to_the_user(pg_session):
+    user, primary, secondary = await _seed(pg_session, None)
+
+    merged = await _merge(pg_session, uuid.uuid4(), primary.entity_id, secondary.entity_id)
+
+    assert merged.mentions_moved == 0
+    assert merged.aliases is None
+    assert merged.deleted_name is None
+    entity_count = await pg_session.scalar(select(func.count()).select_from(TrackedEntity))
+    assert entity_count == 2
+    assert sorted(map(str, await _mention_entities(pg_session))) == sorted(
+        [str(primary.entity_id)] + [str(secondary.entity_id)] * 3
+    )
@@ -0,0 +1,189 @@
+"""
+Keyset cursors and _fetch_page for the local-government record listings.
+"""
+import base64
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import desc, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.local.routes import (
+    _MEETING_LIST_COLUMNS,
+    _after_cursor,
+    _encode_cursor,
+    _fetch_page,
+    _optional_filter,
+)
+from app.models.local_government import CouncilMeeting
+
+
+def _bound_values(clause):
+    return set(clause.compile(dialect=postgresql.dialect()).params.values())
+
+
+@pytest.mark.parametrize("sort_value", [
+    date(2024, 2, 29),
+    datetime(2024, 2, 29, 0, 0),
+    datetime(2024, 2, 29, 13, 45, 7, 123456),
+    datetime(2024, 2, 29, 13, 45, 7, tzinfo=timezone.utc),
+])
+def test_cursor_round_trip(sort_value):
+    row_id = uuid.uuid4()
+    cursor = _encode_cursor(sort_value, row_id)
+
+    clause = _after_cursor(CouncilMeeting.meeting_date, CouncilMeeting.id, cursor)
+
+    values = _bound_values(clause)
+    assert values == {sort_value, row_id}
+    assert type(next(v for v in values if v != row_id)) is type(sort_value)
+
+
+def test_cursor_round_trip_null_date():
+    row_id = uuid.uuid4()
+    cursor = _encode_cursor(None, row_id)
+
+    clause = _after_cursor(CouncilMeeting.meeting_date, CouncilMeeting.id, cursor)
+
+    assert _bound_values(clause) == {row_id}
+    assert "IS NOT NULL" in str(clause.compile(dialect=postgresql.dialect()))
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    _b64("no separator"),
+    _b64("2024-01-01|not-a-uuid"),
+    _b64(f"yesterday|{uuid.uuid4()}"),
+    base64.urlsafe_b64encode(b"\xff\xfe|x").decode(),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        _after_cursor(CouncilMeeting.meeting_date, CouncilMeeting.id, cursor)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("value", [None, "", 0])
+def test_falsy_filter_is_left_out(value):
+    query = select(CouncilMeeting.id).where(
+        _optional_filter(CouncilMeeting.jurisdiction, value)
+    )
+    compiled = query.compile(dialect=postgresql.dialect())
+    assert not compiled.params
+    assert "jurisdiction =" not in str(compiled)
+
+
+def test_filter_binds_its_value():
+    clause = _optional_filter(CouncilMeeting.jurisdiction, "chattanooga")
+    assert _bound_values(clause) == {"chattanooga"}
+
+
+# ==================== _fetch_page (Postgres) ====================
+
+def _meetings_query(jurisdiction=None):
+    return (
+        select(*_MEETING_LIST_COLUMNS)
+        .where(_optional_filter(CouncilMeeting.jurisdiction, jurisdiction))
+        .order_by(desc(CouncilMeeting.meeting_date), desc(CouncilMeeting.id))
+    )
+
+
+async def _seed_meetings(session):
+    base = datetime(2024, 1, 1, 9, 0)
+    for i in range(23):
+        # NULL dates and repeated dates, so ordering leans on the id tiebreak
+        meeting_date = None if i % 5 == 0 else base + timedelta(days=i % 4)
+        session.add(CouncilMeeting(
+            jurisdiction="chattanooga" if i % 3 else "hamilton_county",
+            meeting_date=meeting_date,
+            # The model defaults are tz-aware; these columns are naive
+            collected_at=base,
+            last_updated=base,
+        ))
+    await session.commit()
+
+
+async def _expected_ids(session, jurisdiction=None):
+    # Postgres puts NULLs first for DESC, which the cursors rely on
+    result = await session.execute(
+        select(CouncilMeeting.id)
+        .where(_optional_filter(CouncilMeeting.jurisdiction, jurisdiction))
+        .order_by(desc(CouncilMeeting.meeting_date), desc(CouncilMeeting.id))
+    )
+    return [row_id for row_id in result.scalars()]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("jurisdiction", [None, "chattanooga"])
+async def test_cursor_pages_walk_every_row_once(pg_session, jurisdiction):
+    await _seed_meetings(pg_session)
+    expected = await _expected_ids(pg_session, jurisdiction)
+
+    seen, cursor = [], None
+    while True:
+        rows, total, next_cursor = await _fetch_page(
+            pg_session, _meetings_query(jurisdiction),
+            CouncilMeeting.meeting_date, CouncilMeeting.id, 4, 0, cursor
+        )
+        # The first page is an offset page; cursor pages skip the count
+        assert total == (len(expected) if cursor is None else None)
+        seen.extend(row["id"] for row in rows)
+        if next_cursor is None:
+            break
+        cursor = next_cursor
+
+    assert seen == expected
+
+
+@pytest.mark.anyio
+async def test_offset_pages_carry_the_total(pg_session):
+    await _seed_meetings(pg_session)
+    expected = await _expected_ids(pg_session)
+
+    for offset in range(0, len(expected), 5):
+        rows, total, next_cursor = await _fetch_page(
+            pg_session, _meetings_query(),
+            CouncilMeeting.meeting_date, CouncilMeeting.id, 5, offset, None
+        )
+        assert [row["id"] for row in rows] == expected[offset:offset + 5]
+        assert total == len(expected)
+        assert all("total" not in row for row in rows)
+        assert (next_cursor is not None) == (offset + 5 < len(expected))
+
+    # Past the end the window count has no row; the fallback COUNT answers
+    rows, total, next_cursor = await _fetch_page(
+        pg_session, _meetings_query(),
+        CouncilMeeting.meeting_date, CouncilMeeting.id, 5, 100, None
+    )
+    assert (rows, total, next_cursor) == ([], len(expected), None)
+
+
+@pytest.mark.anyio
+async def test_offset_page_continues_by_cursor(pg_session):
+    await _seed_meetings(pg_session)
+    expected = await _expected_ids(pg_session)
+
+    first, _, cursor = await _fetch_page(
+        pg_session, _meetings_query(),
+        CouncilMeeting.meeting_date, CouncilMeeting.id, 6, 0, None
+    )
+    second, _, _ = await _fetch_page(
+        pg_session, _meetings_query(),
+        CouncilMeeting.meeting_date, CouncilMeeting.id, 6, 0, cursor
+    )
+    assert [row["id"] for row in first + second] == expected[:12]
+
+
+@pytest.mark.anyio
+async def test_empty_listing(pg_session):
+    assert (await pg_session.execute(text("SELECT count(*) FROM council_meetings"))).scalar() == 0
+    rows, total, next_cursor = await _fetch_page(
+        pg_session, _meetings_query(),
+        CouncilMeeting.meeting_date, CouncilMeeting.id, 5, 0, None
+    )
+    assert (rows, total, next_cursor) == ([], 0, None)
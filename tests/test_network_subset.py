@@ -0,0 +1,107 @@
+"""
+NetworkMapperService.get_ranked_nodes must page exactly like the per-node
+filter/sort/slice /network/graph/subset used before the column arrays.
+"""
+import random
+
+import networkx as nx
+import pytest
+
+from app.services.network_mapper import NetworkMapperService
+
+TYPES = ["person", "Organization", "LOCATION", "event", None]
+NAMES = [
+    "alice", "Alicia", "al", "bob", "Bobby Tables", "", "Élodie", "élan",
+    "zoë", "Zed", "ALI BABA", "x" * 20, "İstanbul", "straße",
+]
+SEARCHES = [None, "", "a", "al", "ALI", "b", "é", "Él", "z", "x" * 21, "q", "İ", "stra"]
+ENTITY_TYPES = [None, "person", "PERSON", "organization", "location", "unknown-type"]
+SORTS = ["centrality", "mentions", "recent", "name"]
+
+
+def _reference_page(graph, sort_by, entity_type, search, offset, limit):
+    """The pre-array implementation from get_graph_subset."""
+    centrality_scores = {}
+    if sort_by == "centrality" and graph.number_of_nodes() > 0:
+        centrality_scores = nx.degree_centrality(graph)
+
+    nodes_data = []
+    for node_id, data in graph.nodes(data=True):
+        if entity_type:
+            if (data.get("entity_type") or "").lower() != entity_type.lower():
+                continue
+        if search:
+            if not (data.get("name") or "").lower().startswith(search.lower()):
+                continue
+        nodes_data.append({
+            "id": node_id,
+            "data": data,
+            "centrality": centrality_scores.get(node_id, 0),
+            "degree": graph.degree(node_id),
+        })
+
+    if sort_by == "centrality":
+        nodes_data.sort(key=lambda x: x["centrality"], reverse=True)
+    elif sort_by == "mentions":
+        nodes_data.sort(key=lambda x: x["degree"], reverse=True)
+    elif sort_by == "recent":
+        nodes_data.sort(key=lambda x: x["data"].get("created_at") or "", reverse=True)
+
+    return [n["id"] for n in nodes_data[offset:offset + limit]], len(nodes_data)
+
+
+def _random_mapper(seed):
+    rng = random.Random(seed)
+    mapper = NetworkMapperService(None)
+    node_ids = [f"n{i}" for i in range(rng.randint(1, 60))]
+    for node_id in node_ids:
+        attrs = {"name": rng.choice(NAMES) + rng.choice(["", " jr", "2"])}
+        entity_type = rng.choice(TYPES)
+        if entity_type is not None:
+            attrs["entity_type"] = entity_type
+        if rng.random() < 0.8:
+            # Few distinct timestamps, so recent has plenty of ties
+            attrs["created_at"] = f"2024-01-0{rng.randint(1, 4)}T00:00:00"
+        mapper.graph.add_node(node_id, **attrs)
+    for i in range(rng.randint(0, 120)):
+        u, v = rng.choice(node_ids), rng.choice(node_ids)
+        mapper.graph.add_edge(u, v, key=str(i))
+    return mapper
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_ranked_nodes_match_reference(seed):
+    mapper = _random_mapper(seed)
+    node_count = mapper.graph.number_of_nodes()
+
+    for sort_by in SORTS:
+        for entity_type in ENTITY_TYPES:
+            for search in SEARCHES:
+                for offset, limit in [(0, 10), (0, 200), (5, 7), (node_count, 10)]:
+                    expected = _reference_page(
+                        mapper.graph, sort_by, entity_type, search, offset, limit
+                    )
+                    actual = mapper.get_ranked_nodes(
+                        sort_by=sort_by, entity_type=entity_type, search=search,
+                        offset=offset, limit=limit
+                    )
+                    assert actual == expected, (sort_by, entity_type, search, offset, limit)
+
+
+def test_ranked_nodes_follow_graph_changes():
+    mapper = _random_mapper(0)
+    mapper.get_ranked_nodes()  # build the indices
+
+    mapper.graph.add_node("late", name="alpha late", entity_type="person")
+    mapper.add_relationship("late", "n0", "associated_with")
+
+    assert mapper.get_ranked_nodes(search="alpha late") == (["late"], 1)
+    assert mapper.get_ranked_nodes(sort_by="mentions", limit=500) == _reference_page(
+        mapper.graph, "mentions", None, None, 0, 500
+    )
+
+
+def test_ranked_nodes_empty_graph():
+    mapper = NetworkMapperService(None)
+    assert mapper.get_ranked_nodes() == ([], 0)
+    assert mapper.get_ranked_nodes(search="a", entity_type="person") == ([], 0)